@@ -0,0 +1,89 @@
+"""
+Adversarial inputs for regexes of pre-processing, lexer & fast path: long runs of quotes, unterminated strings,
+long numbers, open comments, deep parentheses & one-line statements.
+
+    Each case is parsed with input of size N & 4 * N. Time of linear processing grows ~4 times,
+    quadratic backtracking gives ~16 times, so benchmark fails if any ratio is bigger than MAX_RATIO.
+
+    Run: python benchmarks/bench_adversarial.py
+"""
+import io
+import sys
+import time
+from typing import Callable, Dict
+
+from simple_ddl_parser import DDLParser
+
+N = 5000
+MAX_RATIO = 8.0
+RUNS = 3
+
+
+def run(ddl: str, **kwargs) -> None:
+    try:
+        DDLParser(ddl, silent=True, **kwargs).run()
+    except Exception:
+        # only time matters, broken input could be an error
+        pass
+
+
+def stream(ddl: str) -> None:
+    try:
+        list(DDLParser(silent=True).iter_parse(io.StringIO(ddl)))
+    except Exception:
+        pass
+
+
+def columns(n: int) -> str:
+    return ", ".join(f"c{num} int" for num in range(n // 8))
+
+
+CASES: Dict[str, Callable[[int], None]] = {
+    "run of quotes": lambda n: run("CREATE TABLE t (a int DEFAULT " + "'" * n + ");"),
+    "run of quotes & spaces": lambda n: run("CREATE TABLE t (a int DEFAULT " + "' " * n + ");"),
+    "quoted commas": lambda n: run("CREATE TABLE t (a int DEFAULT " + "','" * (n // 3) + ");"),
+    "unterminated string": lambda n: run("CREATE TABLE t (a varchar DEFAULT '" + "x" * n + ");"),
+    "unterminated dq string": lambda n: run('CREATE TABLE t (a varchar DEFAULT "' + "x" * n + ");"),
+    "open comments": lambda n: run("CREATE TABLE t (a int " + "/*'" * (n // 3) + ");"),
+    "dashes": lambda n: run("CREATE TABLE t (a int DEFAULT " + "- " * (n // 2) + ");"),
+    "long number & letter": lambda n: run("CREATE TABLE t (a int DEFAULT " + "1" * n + "x);"),
+    "long number & letter, fast path": lambda n: run(
+        "CREATE TABLE t (a int DEFAULT " + "1" * n + "x)", fast_path=True
+    ),
+    "run of numbers with dots": lambda n: run("CREATE TABLE t (a int DEFAULT " + "1." * (n // 2) + ");"),
+    "long identifier": lambda n: run("CREATE TABLE t (" + "a" * n + " int);"),
+    "deep parentheses": lambda n: run("CREATE TABLE t (a int DEFAULT " + "(" * (n // 2) + "1" + ")" * (n // 2) + ");"),
+    "one-line statement": lambda n: run("CREATE TABLE t (" + columns(n) + ");"),
+    "one-line statement, stream": lambda n: stream("CREATE TABLE t (" + columns(n) + ");"),
+    "statement without end": lambda n: run("CREATE TABLE t (\n" + "a int,\n" * (n // 7)),
+}
+
+
+def measure(case: Callable[[int], None], n: int) -> float:
+    timings = []
+    for _ in range(RUNS):
+        started = time.perf_counter()
+        case(n)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main() -> int:
+    # warm up lazy tables
+    run("CREATE TABLE t (a int);")
+    failed = []
+    for name, case in CASES.items():
+        small, big = measure(case, N), measure(case, 4 * N)
+        # too short timings are only noise
+        ratio = big / max(small, 1e-3)
+        print(f"{name:<34} {small * 1e3:9.2f} ms {big * 1e3:9.2f} ms  x{ratio:5.1f}")
+        if ratio > MAX_RATIO:
+            failed.append(name)
+    if failed:
+        print(f"time grows faster than linear for: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
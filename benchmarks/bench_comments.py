@@ -0,0 +1,47 @@
+"""
+Benchmark of comments stripping (Parser.strip_comments) on comment-heavy export.
+
+    Each column has inline '--' comment, columns are separated with block comments, strings have
+    comment markers inside. Report shows cost per byte of strip_comments alone & of splitting
+    of the whole data on statements.
+
+    Run: python benchmarks/bench_comments.py
+"""
+import time
+
+from simple_ddl_parser import DDLParser
+
+TABLES = 2000
+
+TABLE = """/* table {num}
+   generated by export tool */
+CREATE TABLE sales.orders{num} (
+    id int NOT NULL, -- identifier of order
+    name varchar(100) DEFAULT '-- no name --', -- name /* with marker */
+    /* amount of order */ amount decimal(10, 2),
+    code varchar(10) DEFAULT '/* code */' -- code
+);
+"""
+
+
+def main():
+    data = "".join(TABLE.format(num=num) for num in range(TABLES))
+    lines = data.split("\n")
+
+    parser = DDLParser()
+    parser.multi_line_comment = False
+    started = time.perf_counter()
+    for line in lines:
+        parser.strip_comments(line)
+    seconds = time.perf_counter() - started
+    print(f"{'strip_comments':<20} {seconds / len(data) * 1e9:6.1f} ns/byte, {len(parser.comments)} comments")
+
+    parser = DDLParser()
+    started = time.perf_counter()
+    statements = sum(1 for _ in parser.split_statements([data]))
+    seconds = time.perf_counter() - started
+    print(f"{'split on statements':<20} {seconds / len(data) * 1e9:6.1f} ns/byte, {statements} statements")
+
+
+if __name__ == "__main__":
+    main()
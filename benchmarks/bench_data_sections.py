@@ -0,0 +1,55 @@
+"""
+Benchmark of skipping data sections of dumps.
+
+    Generated dump has CREATE TABLE statements with data like in mysqldump (multi-line INSERT)
+    & pg_dump (COPY ... FROM stdin). Report shows time of splitting dump on statements
+    & how much of the dump was skipped without parsing.
+
+    Run: python benchmarks/bench_data_sections.py
+"""
+import io
+import time
+
+from simple_ddl_parser import DDLParser
+
+SIZE_MB = 20
+ROWS = 500
+
+TABLE = "CREATE TABLE sales.orders{num} (id int NOT NULL, name varchar(100), PRIMARY KEY (id));\n"
+MYSQL_DATA = "LOCK TABLES `orders{num}` WRITE;\nINSERT INTO `orders{num}` VALUES {rows};\nUNLOCK TABLES;\n"
+MYSQL_ROW = "({row},'name \\'{row}\\'; x')"
+PG_DATA = "COPY sales.orders{num} (id, name) FROM stdin;\n{rows}\\.\n"
+PG_ROW = "{row}\tname {row}\n"
+
+
+def dump(data: str, row: str, separator: str) -> str:
+    rows = separator.join(row.format(row=num) for num in range(ROWS))
+    parts = []
+    size = num = 0
+    while size < SIZE_MB * 1e6:
+        part = TABLE.format(num=num) + data.format(num=num, rows=rows)
+        parts.append(part)
+        size += len(part)
+        num += 1
+    return "".join(parts)
+
+
+def main():
+    dumps = {
+        "mysqldump INSERT": dump(MYSQL_DATA, MYSQL_ROW, ",\n"),
+        "pg_dump COPY": dump(PG_DATA, PG_ROW, ""),
+    }
+    for name, data in dumps.items():
+        parser = DDLParser()
+        started = time.perf_counter()
+        statements = sum(1 for _ in parser.iter_statements(io.StringIO(data)))
+        seconds = time.perf_counter() - started
+        stats = parser.data_sections_stats
+        print(
+            f"{name:<20} {statements} statements in {seconds:6.2f} s ({len(data) / 1e6 / seconds:6.1f} MB/s), "
+            f"skipped {stats['skipped'] / 1e6:.1f} MB, parsed {stats['parsed'] / 1e6:.1f} MB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark of fast path for simple CREATE TABLE statements.
+
+    Same DDL (mix of simple & not simple statements) is parsed with fast_path=False & fast_path=True,
+    report shows hit rate of fast path & time of run() in both modes.
+
+    Run: python benchmarks/bench_fast_path.py
+"""
+import timeit
+
+from simple_ddl_parser import DDLParser
+
+NUMBER = 20
+
+SIMPLE = (
+    "CREATE TABLE IF NOT EXISTS sales.t{num} (id int NOT NULL, name varchar(100) DEFAULT 'x', "
+    "amount decimal(10,2), created timestamp NULL, PRIMARY KEY (id));"
+)
+NOT_SIMPLE = (
+    "CREATE TABLE sales.o{num} (id int NOT NULL, t_id int REFERENCES sales.t{num} (id), "
+    "created timestamp DEFAULT now()) PARTITIONED BY (created);"
+)
+
+
+def ddl(simple_share: float, statements: int = 200) -> str:
+    simple = int(statements * simple_share)
+    return "\n".join(
+        (SIMPLE if num < simple else NOT_SIMPLE).format(num=num) for num in range(statements)
+    )
+
+
+def main():
+    for share in (1.0, 0.75, 0.5, 0.0):
+        text = ddl(share)
+        parser = DDLParser(text, fast_path=True)
+        parser.run()
+        results = {
+            fast_path: min(timeit.repeat(lambda: DDLParser(text, fast_path=fast_path).run(), number=NUMBER, repeat=5))
+            / NUMBER
+            for fast_path in (False, True)
+        }
+        print(
+            f"simple statements {share:4.0%}: hit rate {parser.fast_path_hit_rate():4.0%}, "
+            f"grammar {results[False] * 1e3:8.2f} ms, fast path {results[True] * 1e3:8.2f} ms, "
+            f"speedup x{results[False] / results[True]:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Memory of parser output for synthetic warehouse with interning of identifiers & types.
+
+    Warehouse has many tables with the same column names & types. Output of run() is measured with tracemalloc
+    as is (equal names, types & values share one object) & after copy where each string is a separate object,
+    as it was without interning.
+
+    Run: python benchmarks/bench_interning.py
+"""
+import time
+import tracemalloc
+from typing import Any
+
+from simple_ddl_parser import DDLParser
+
+TABLES = 5000
+
+TABLE = (
+    "CREATE TABLE dw.fact_{num} (\n  id bigint NOT NULL,\n  customer_id int NOT NULL,\n"
+    "  status varchar(20) DEFAULT 'new',\n  amount decimal(12, 2),\n  \"created_at\" timestamp DEFAULT now(),\n"
+    "  updated_at timestamp,\n  PRIMARY KEY (id)\n);\n"
+)
+
+
+def unshared(value: Any) -> Any:
+    """deep copy of output where each string is a new object"""
+    if isinstance(value, dict):
+        return {key: unshared(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [unshared(item) for item in value]
+    if isinstance(value, str) and len(value) > 1:
+        return "".join(list(value))
+    return value
+
+
+def traced(build) -> Any:
+    tracemalloc.start()
+    result = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, size
+
+
+def main():
+    ddl = "".join(TABLE.format(num=num) for num in range(TABLES))
+    started = time.perf_counter()
+    DDLParser(ddl).run()
+    print(f"{TABLES} tables parsed in {time.perf_counter() - started:6.2f} s")
+
+    result, interned = traced(lambda: DDLParser(ddl).run())
+    copy, separate = traced(lambda: unshared(result))
+    assert copy == result
+    print(f"output with interning:     {interned / 1e6:7.2f} MB")
+    print(f"output without interning:  {separate / 1e6:7.2f} MB, saved {(1 - interned / separate) * 100:.0f}%")
+
+
+if __name__ == "__main__":
+    main()
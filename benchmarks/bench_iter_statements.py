@@ -0,0 +1,77 @@
+"""
+Benchmark of memory used for splitting of ddl file on statements.
+
+    Generated dump is split on statements (without parsing) in three ways:
+    whole file content is read & split at once, file is read part by part with DDLParser.iter_statements,
+    or file is memory-mapped & only slice of each statement is decoded.
+    Report shows time & peak of memory allocated during splitting (tracemalloc).
+
+    Run: python benchmarks/bench_iter_statements.py
+"""
+import mmap
+import os
+import tempfile
+import time
+import tracemalloc
+
+from simple_ddl_parser import DDLParser
+
+SIZE_MB = 10
+
+TABLE = (
+    "CREATE TABLE sales.orders{num} (\n"
+    "    id int NOT NULL,\n"
+    "    name varchar(100) DEFAULT 'x',\n"
+    "    amount decimal(10, 2),\n"
+    "    PRIMARY KEY (id)\n"
+    ");\n"
+)
+
+
+def write_dump(path: str) -> None:
+    with open(path, "w") as df:
+        num = 0
+        while df.tell() < SIZE_MB * 1e6:
+            df.write(TABLE.format(num=num))
+            num += 1
+
+
+def whole_file(path: str) -> int:
+    with open(path) as df:
+        data = df.read()
+    return sum(1 for _ in DDLParser().split_statements([data]))
+
+
+def iter_statements(path: str) -> int:
+    with open(path) as df:
+        return sum(1 for _ in DDLParser().iter_statements(df))
+
+
+def memory_map(path: str) -> int:
+    with open(path, "rb") as df, mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        return sum(1 for _ in DDLParser().iter_statements(mapped))
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "dump.sql")
+        write_dump(path)
+        for name, split in (
+            ("whole file", whole_file),
+            ("iter_statements", iter_statements),
+            ("memory map", memory_map),
+        ):
+            tracemalloc.start()
+            started = time.perf_counter()
+            statements = split(path)
+            seconds = time.perf_counter() - started
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(
+                f"{name:<16} {SIZE_MB} MB, {statements} statements: {seconds:6.2f} s, "
+                f"peak memory {peak / 1e6:8.1f} MB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Microbenchmark of the lexer: tokens of typical statements (tables with columns, constraints, properties
+after columns, sequences & alters) without parser, so it shows cost of resolution of keywords in t_ID.
+
+    Run: python benchmarks/bench_lexer.py
+"""
+import time
+
+from simple_ddl_parser import DDLParser
+
+REPEAT = 2000
+
+STATEMENTS = [
+    "CREATE TABLE IF NOT EXISTS sales.orders ( id int NOT NULL , name varchar ( 100 ) DEFAULT 'x' , "
+    "created timestamp DEFAULT now ( ) , amount decimal ( 10 , 2 ) , "
+    "PRIMARY KEY ( id ) , FOREIGN KEY ( name ) REFERENCES other ( name ) ON DELETE CASCADE )",
+    "CREATE EXTERNAL TABLE logs ( ts timestamp COMMENT 'time' , msg string ) PARTITIONED BY ( day string ) "
+    "ROW FORMAT DELIMITED FIELDS TERMINATED BY ',' STORED AS TEXTFILE LOCATION 's3://bucket/logs'",
+    "CREATE SEQUENCE sales.seq INCREMENT BY 1 START WITH 1 MINVALUE 1 MAXVALUE 1000 CACHE 10",
+    "ALTER TABLE sales.orders ADD CONSTRAINT uq UNIQUE ( name , created )",
+]
+
+
+def lex(parser: DDLParser, statement: str) -> int:
+    parser.set_default_flags_in_lexer()
+    parser.lexer.input(statement)
+    count = 0
+    while parser.lexer.token():
+        count += 1
+    return count
+
+
+def main():
+    parser = DDLParser("")
+    tokens = sum(lex(parser, statement) for statement in STATEMENTS) * REPEAT
+    timings = []
+    for _ in range(5):
+        started = time.perf_counter()
+        for _ in range(REPEAT):
+            for statement in STATEMENTS:
+                lex(parser, statement)
+        timings.append(time.perf_counter() - started)
+    seconds = min(timings)
+    print(f"{tokens} tokens in {seconds:6.2f} s, {seconds / tokens * 1e9:6.0f} ns/token")
+
+
+if __name__ == "__main__":
+    main()
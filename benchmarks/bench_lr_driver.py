@@ -0,0 +1,63 @@
+"""
+Benchmark of LR driver: ply LRParser.parseopt_notrack vs specialized LRDriver on the same tables.
+
+    Statements are parsed by both parsers with the same lexer, lexing time is measured separately
+    and subtracted, so the difference is the cost of the driver loop & rules calls.
+
+    Run: python benchmarks/bench_lr_driver.py
+"""
+import logging
+import time
+
+from simple_ddl_parser import DDLParser
+from simple_ddl_parser.grammar import get_grammar
+
+STATEMENTS = 2000
+
+STATEMENT = (
+    "CREATE TABLE IF NOT EXISTS schema.t{num} ( id int NOT NULL , name varchar ( 100 ) DEFAULT 'x' , "
+    "created timestamp DEFAULT now ( ) , amount decimal ( 10 , 2 ) , "
+    "PRIMARY KEY ( id ) , FOREIGN KEY ( name ) REFERENCES other ( name ) )"
+)
+
+
+def measure(parser: DDLParser, parse) -> float:
+    started = time.perf_counter()
+    for num in range(STATEMENTS):
+        parser.set_default_flags_in_lexer()
+        parse(STATEMENT.format(num=num))
+    return time.perf_counter() - started
+
+
+def lex_only(parser: DDLParser):
+    def tokenize(statement: str) -> None:
+        parser.lexer.input(statement)
+        while parser.lexer.token():
+            pass
+
+    return tokenize
+
+
+def main():
+    parser = DDLParser("")
+    ply_parser = get_grammar(DDLParser, logging.getLogger()).bind_ply_parser(parser)
+    # warm up lazy tables
+    measure(parser, lambda statement: parser.yacc.parse(statement, lexer=parser.lexer))
+
+    lexing = min(measure(parser, lex_only(parser)) for _ in range(5))
+    results = {
+        "ply LRParser": min(
+            measure(parser, lambda statement: ply_parser.parse(statement, lexer=parser.lexer)) for _ in range(5)
+        ),
+        "LRDriver": min(
+            measure(parser, lambda statement: parser.yacc.parse(statement, lexer=parser.lexer)) for _ in range(5)
+        ),
+    }
+    print(f"{'lexing only':<20} {lexing / STATEMENTS * 1e6:8.1f} us/statement")
+    for name, seconds in results.items():
+        driver = (seconds - lexing) / STATEMENTS * 1e6
+        print(f"{name:<20} {seconds / STATEMENTS * 1e6:8.1f} us/statement, without lexing {driver:8.1f} us")
+
+
+if __name__ == "__main__":
+    main()
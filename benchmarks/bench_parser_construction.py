@@ -0,0 +1,45 @@
+"""
+Benchmark of lexer & parser construction.
+
+    - lex.lex(): assembly & validation of master regex, that was done on each DDLParser(...) before
+    - lextab: creation of lexer from prebuilt lexer tables (done once per process now)
+    - DDLParser(...): construction of parser instance, that binds itself to shared lexer & parse tables
+
+    Run: python benchmarks/bench_parser_construction.py
+"""
+import logging
+import timeit
+
+from ply import lex
+
+from simple_ddl_parser import DDLParser
+from simple_ddl_parser.grammar import lexer_reflags
+from simple_ddl_parser.parse_tables import lexer_signature, read_lexer_tables
+
+NUMBER = 200
+
+DDL = "CREATE TABLE t (id int NOT NULL, name varchar(100) DEFAULT 'x', PRIMARY KEY (id));"
+
+
+def main():
+    log = logging.getLogger("simple_ddl_parser")
+    module = DDLParser.__new__(DDLParser)
+    reflags = lexer_reflags(DDLParser)
+    signature = lexer_signature(module, reflags)
+    # build shared grammar before measurements
+    DDLParser(DDL)
+
+    cases = {
+        "lex.lex() - assembly & validation": lambda: lex.lex(
+            object=module, reflags=reflags, debug=False, debuglog=log, errorlog=log
+        ),
+        "lexer from lextab": lambda: read_lexer_tables(signature, module),
+        "DDLParser(...) construction": lambda: DDLParser(DDL),
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=NUMBER, repeat=5)) / NUMBER
+        print(f"{name:<40} {seconds * 1e6:10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark of pre-processing of input data (Parser.pre_process_data).
+
+    Compares chain of str.replace() over whole data (how it was done before) with one traversal
+    in windows (simple_ddl_parser.utils.pre_process) on generated dumps: throughput in MB/s
+    & peak of memory allocated during pre-processing (tracemalloc) relative to size of data.
+
+    Run: python benchmarks/bench_pre_process.py
+"""
+import time
+import tracemalloc
+
+from simple_ddl_parser.utils import pre_process, pre_process_escapes, pre_process_padding
+
+SIZES_MB = (10, 50)
+
+TABLE = "CREATE TABLE sales.orders{num} (id int NOT NULL, name varchar(100) DEFAULT 'it\\'s', amount decimal(10,2));\n"
+ROW = "INSERT INTO sales.orders{num} (id, name, amount) VALUES ({num}, 'name\\t{num}', 10.5), ({num}, 'x', NULL);\n"
+
+
+def replace_chain(data: str) -> str:
+    for old, new in pre_process_escapes + pre_process_padding:
+        data = data.replace(old, new)
+    return data
+
+
+def dump(size_mb: int) -> str:
+    lines = []
+    size = 0
+    num = 0
+    while size < size_mb * 1e6:
+        line = (TABLE if num % 100 == 0 else ROW).format(num=num)
+        lines.append(line)
+        size += len(line)
+        num += 1
+    return "".join(lines)
+
+
+def measure(function, data: str):
+    tracemalloc.start()
+    function(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    seconds = min(_timed(function, data) for _ in range(3))
+    return len(data) / 1e6 / seconds, peak / len(data)
+
+
+def _timed(function, data: str) -> float:
+    started = time.perf_counter()
+    function(data)
+    return time.perf_counter() - started
+
+
+def main():
+    for size_mb in SIZES_MB:
+        data = dump(size_mb)
+        assert pre_process(data) == replace_chain(data)
+        for name, function in (("str.replace chain", replace_chain), ("pre_process", pre_process)):
+            throughput, peak = measure(function, data)
+            print(f"{size_mb:4d} MB {name:<20} {throughput:8.1f} MB/s, peak memory x{peak:.2f} of data")
+
+
+if __name__ == "__main__":
+    main()
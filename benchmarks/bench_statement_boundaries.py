@@ -0,0 +1,48 @@
+"""
+Benchmark of search of statement boundaries on files with millions of short lines.
+
+    Data is split on statements (without parsing) line by line with process_line for each line (as before)
+    & with STATEMENT_LINE scanner, where only lines that start or end statement, comments, etc.
+    go through process_line & other lines are added to the statement at once.
+
+    Run: python benchmarks/bench_statement_boundaries.py
+"""
+import time
+
+from simple_ddl_parser import DDLParser
+
+LINES = 1_000_000
+COLUMNS = 50
+
+TABLE = "CREATE TABLE sales.orders{num} (\n{columns}\n    PRIMARY KEY (id)\n);\n"
+COLUMN = "    column_{num} int NOT NULL,"
+
+
+class LineByLineParser(DDLParser):
+    def split_lines(self, data: str):
+        for self.line in data.split("\n"):
+            statement = self.process_line(True)
+            if statement:
+                yield statement
+
+
+def ddl() -> str:
+    columns = "\n".join(COLUMN.format(num=num) for num in range(COLUMNS))
+    return "".join(TABLE.format(num=num, columns=columns) for num in range(LINES // (COLUMNS + 3)))
+
+
+def main():
+    data = ddl()
+    lines = data.count("\n")
+    results = {}
+    for name, parser_class in (("line by line", LineByLineParser), ("statement scanner", DDLParser)):
+        parser = parser_class()
+        started = time.perf_counter()
+        results[name] = list(parser.split_statements([data]))
+        seconds = time.perf_counter() - started
+        print(f"{name:<20} {lines} lines: {seconds:6.2f} s, {seconds / lines * 1e6:6.2f} us/line")
+    assert results["line by line"] == results["statement scanner"]
+
+
+if __name__ == "__main__":
+    main()
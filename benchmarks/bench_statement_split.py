@@ -0,0 +1,38 @@
+"""
+Benchmark of splitting of data on statements (Parser.process_line for each line).
+
+    One CREATE TABLE statement with N lines (one column per line) is split without parsing
+    (parse_statement is replaced by no-op), time per line must not grow with N.
+
+    Run: python benchmarks/bench_statement_split.py
+"""
+import time
+
+from simple_ddl_parser import DDLParser
+
+LINES = (5000, 10000, 20000)
+
+
+def ddl(lines: int) -> str:
+    columns = ",\n".join(f"    column_{num} NUMBER(10, 2) DEFAULT (0) NOT NULL" for num in range(lines))
+    return f"CREATE TABLE sales.wide_table (\n{columns}\n);\n"
+
+
+class SplitOnlyParser(DDLParser):
+    def parse_statement(self) -> None:
+        self.tables.append({"statement_size": len(self.statement)})
+
+
+def main():
+    for lines in LINES:
+        text = ddl(lines)
+        parser = SplitOnlyParser(text)
+        started = time.perf_counter()
+        result = parser.parse_data()
+        seconds = time.perf_counter() - started
+        assert len(result) == 1
+        print(f"{lines:6d} lines: {seconds * 1e3:8.1f} ms, {seconds / lines * 1e6:6.2f} us/line")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Benchmark of include / exclude filters of tables.
+
+    Generated warehouse DDL has tables in many schemas, each with index & foreign key in ALTER TABLE.
+    Report compares full parse with parse of one schema selected by glob: filtered statements are
+    skipped by name in their header & do not go to the lexer.
+
+    Run: python benchmarks/bench_table_filters.py
+"""
+import time
+
+from simple_ddl_parser import DDLParser
+
+SCHEMAS = 50
+TABLES = 100
+
+TABLE = (
+    "CREATE TABLE dw_{schema}.fact_{num} (\n  id int NOT NULL,\n  dim_id int,\n  amount decimal(10, 2),\n"
+    "  created timestamp DEFAULT now(),\n  PRIMARY KEY (id)\n);\n"
+    "CREATE INDEX fact_{num}_idx ON dw_{schema}.fact_{num} (dim_id);\n"
+    "ALTER TABLE dw_{schema}.fact_{num} ADD CONSTRAINT fk_{num} FOREIGN KEY (dim_id) REFERENCES dim (id);\n"
+)
+
+
+def main():
+    ddl = "".join(TABLE.format(schema=schema, num=num) for schema in range(SCHEMAS) for num in range(TABLES))
+    runs = {
+        "all tables": {},
+        "include dw_7.*": {"include_tables": ["dw_7.*"]},
+        "exclude dw_1*": {"exclude_tables": ["dw_1*"]},
+    }
+    for name, kwargs in runs.items():
+        parser = DDLParser(ddl)
+        started = time.perf_counter()
+        result = parser.run(group_by_type=True, **kwargs)
+        seconds = time.perf_counter() - started
+        print(
+            f"{name:<16} {len(result['tables']):6d} tables in {seconds:6.2f} s, "
+            f"skipped {parser.skipped_statements.get('tables', 0)} statements"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Cold start benchmark of parse tables loading.
+
+    Compares import of ply 'parsetab.py' module (format that was shipped before) with loading of compact
+    binary 'parsetab.bin' tables. Each measurement runs in a fresh python process.
+
+    Run: python benchmarks/bench_tables_startup.py
+"""
+import logging
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+
+from simple_ddl_parser import DDLParser
+from simple_ddl_parser.grammar import generate_tables
+
+RUNS = 10
+
+LEGACY_IMPORT = """
+import time
+started = time.perf_counter()
+import parsetab
+from ply import yacc
+yacc.LRTable().read_table(parsetab)
+print(time.perf_counter() - started)
+"""
+
+BINARY_LOAD = """
+import time
+from simple_ddl_parser.parse_tables import read_tables
+started = time.perf_counter()
+read_tables({signature!r})
+print(time.perf_counter() - started)
+"""
+
+FIRST_PARSE = """
+import time
+started = time.perf_counter()
+from simple_ddl_parser import DDLParser
+DDLParser("CREATE TABLE t (id int NOT NULL, name varchar(100) DEFAULT 'x', PRIMARY KEY (id));").run()
+print(time.perf_counter() - started)
+"""
+
+
+def measure(code: str, cwd: str) -> float:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join([cwd, os.getcwd()]))
+    timings = []
+    for _ in range(RUNS):
+        output = subprocess.run(
+            [sys.executable, "-c", textwrap.dedent(code)], cwd=cwd, env=env, check=True, capture_output=True
+        )
+        timings.append(float(output.stdout.decode().strip().splitlines()[-1]))
+    return min(timings)
+
+
+def main():
+    signature, lr_table = generate_tables(DDLParser, logging.getLogger())
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        lr_table.write_table("parsetab", tmp_dir, signature)
+        # first run compiles parsetab.py to bytecode, so measure only warm imports
+        measure(LEGACY_IMPORT, tmp_dir)
+        results = {
+            "ply parsetab.py import": measure(LEGACY_IMPORT, tmp_dir),
+            "binary parsetab.bin load": measure(BINARY_LOAD.format(signature=signature), tmp_dir),
+            "import + first parse (binary tables)": measure(FIRST_PARSE, tmp_dir),
+        }
+    for name, seconds in results.items():
+        print(f"{name:<40} {seconds * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark of lex-only tokenize() vs full run() on the same ddl.
+
+    Report shows throughput of DDLParser.tokenize (split on statements & lexer only) & of DDLParser.run
+    (lexer, parser & output format), and memory of compact token arrays vs list of ply LexToken objects.
+
+    Run: python benchmarks/bench_tokenize.py
+"""
+import time
+import tracemalloc
+
+from simple_ddl_parser import DDLParser
+
+TABLES = 2000
+
+TABLE = (
+    "CREATE TABLE IF NOT EXISTS sales.orders{num} (\n  id int NOT NULL,\n  name varchar(100) DEFAULT 'x',\n"
+    "  created timestamp DEFAULT now(),\n  amount decimal(10, 2),\n  PRIMARY KEY (id),\n"
+    "  FOREIGN KEY (name) REFERENCES other (name)\n);\n"
+)
+
+
+def measure(name: str, ddl: str, parse) -> None:
+    started = time.perf_counter()
+    parse()
+    seconds = time.perf_counter() - started
+    print(f"{name:<10} {seconds:6.2f} s, {len(ddl) / 1e6 / seconds:6.2f} MB/s")
+
+
+def memory_per_token(build) -> float:
+    tracemalloc.start()
+    tokens = build()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size / len(tokens)
+
+
+def lex_tokens(ddl: str) -> list:
+    parser = DDLParser(ddl)
+    tokens = []
+    for statement in parser.split_statements([ddl]):
+        parser.set_default_flags_in_lexer()
+        parser.lexer.input(statement)
+        tokens.extend(iter(parser.lexer.token, None))
+    return tokens
+
+
+def main():
+    ddl = "".join(TABLE.format(num=num) for num in range(TABLES))
+    tokens = DDLParser(ddl).tokenize()
+    print(f"{len(tokens)} tokens in {len(tokens.statements)} statements")
+    measure("tokenize", ddl, DDLParser(ddl).tokenize)
+    measure("run", ddl, DDLParser(ddl).run)
+    arrays = memory_per_token(lambda: DDLParser(ddl).tokenize())
+    objects = memory_per_token(lambda: lex_tokens(ddl))
+    print(f"memory of tokens: arrays {arrays:6.1f} bytes/token, LexToken objects {objects:6.1f} bytes/token")
+
+
+if __name__ == "__main__":
+    main()
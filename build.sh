@@ -7,5 +7,7 @@ mv new_README.md README.md
 m2r README.md
 mv README.rst docs/README.rst
 rm -r dist
+# parse tables are shipped with the package & never generated in runtime
+python -m simple_ddl_parser.build_tables
 poetry build
 twine check dist/*
\ No newline at end of file
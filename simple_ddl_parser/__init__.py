@@ -1,4 +1,5 @@
 from simple_ddl_parser.ddl_parser import (DDLParser, DDLParserError,
                                           parse_from_file)
+from simple_ddl_parser.parse_tables import ParseTablesError
 
-__all__ = ["DDLParser", "parse_from_file", "DDLParserError"]
+__all__ = ["DDLParser", "parse_from_file", "DDLParserError", "ParseTablesError"]
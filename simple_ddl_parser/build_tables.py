@@ -0,0 +1,42 @@
+"""
+Build-time step: regenerate lexer & parse tables that shipped with the package.
+
+    Parser never generates or writes tables in runtime, so after any change in tokens, t_* or p_* rules run:
+
+        python -m simple_ddl_parser.build_tables
+
+"""
+import logging
+import os
+from typing import List
+
+from simple_ddl_parser.ddl_parser import DDLParser, dialect_parser, dialects
+from simple_ddl_parser.grammar import generate_lexer, generate_tables
+from simple_ddl_parser.parse_tables import write_lexer_tables, write_tables
+
+logger = logging.getLogger("simple_ddl_parser")
+
+
+def build_tables(output_dir: str = os.path.dirname(__file__)) -> List[str]:
+    lexer_signature, lexer = generate_lexer(DDLParser, logger)
+    signature, lr_table = generate_tables(DDLParser, logger)
+    paths = [
+        write_lexer_tables(lexer_signature, lexer, output_dir),
+        write_tables(signature, lr_table, output_dir),
+    ]
+    # slim grammars of each dialect have own parse tables, lexer tables are shared
+    for dialect in dialects:
+        parser_class = dialect_parser(DDLParser, dialect)
+        signature, lr_table = generate_tables(parser_class, logger)
+        paths.append(write_tables(signature, lr_table, output_dir, parser_class.parse_tables_file))
+    return paths
+
+
+def main():
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    for path in build_tables():
+        print(f"Tables saved to {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,10 +2,14 @@ import argparse
 import logging
 import os
 import pprint
+import re
 import sys
+from typing import List, Optional
 
 from simple_ddl_parser import parse_from_file
+from simple_ddl_parser.ddl_parser import dialects
 from simple_ddl_parser.output.common import output_modes
+from simple_ddl_parser.utils import compression_of
 
 logger = logging.getLogger('simple_ddl_parser')
 
@@ -39,6 +43,31 @@ def cli():
         default="sql",
         help=f"Output mode that will be used to format result. Possible variants: {output_modes}",
     )
+    sdp_cli.add_argument(
+        "-d",
+        "--dialect",
+        default=None,
+        choices=list(dialects),
+        help="Parse with slim grammar of this dialect only. By default grammar with all dialects is used",
+    )
+    sdp_cli.add_argument(
+        "--include",
+        action="append",
+        default=None,
+        help="Parse only tables with name (schema.table) that matches this glob, could be used several times",
+    )
+    sdp_cli.add_argument(
+        "--exclude",
+        action="append",
+        default=None,
+        help="Skip tables with name (schema.table) that matches this glob, could be used several times",
+    )
+    sdp_cli.add_argument(
+        "--regex",
+        action="store_true",
+        default=False,
+        help="Patterns in --include & --exclude are regular expressions, not globs",
+    )
     return sdp_cli
 
 
@@ -46,9 +75,12 @@ def run_for_file(args):
     logger.info(f"Start parsing file {args.ddl_file_path} \n")
     result = parse_from_file(
         args.ddl_file_path,
+        parser_settings={"dialect": args.dialect},
         dump=not args.no_dump,
         dump_path=args.target,
         output_mode=args.output_mode,
+        include_tables=table_patterns(args.include, args.regex),
+        exclude_tables=table_patterns(args.exclude, args.regex),
     )
 
     logger.info(f"File with result was saved to >> {args.target} folder")
@@ -57,6 +89,12 @@ def run_for_file(args):
         pprint.pprint(result)
 
 
+def table_patterns(patterns: Optional[List[str]], regex: bool) -> Optional[List]:
+    if patterns is None or not regex:
+        return patterns
+    return [re.compile(pattern) for pattern in patterns]
+
+
 def correct_extension(file_name: str) -> bool:
     ext = ["ddl", "sql", "hql", "", "bql"]
     split_name = file_name.split(".")
@@ -67,6 +105,29 @@ def correct_extension(file_name: str) -> bool:
     return False
 
 
+# extensions of compressed files, only files with them or with ddl extension are checked by magic bytes
+compressed_extensions = ("gz", "bz2", "xz", "lzma")
+
+
+def ddl_file(file_path: str) -> bool:
+    """
+    file with ddl extension, compressed file (detected by magic bytes) must have it before extension
+    of compression, like dump.sql.gz. file that can not be read is not ddl file
+    """
+    if not os.path.isfile(file_path):
+        return False
+    file_name = os.path.basename(file_path)
+    if not correct_extension(file_name) and file_name.rsplit(".", 1)[-1] not in compressed_extensions:
+        return False
+    try:
+        compression = compression_of(file_path)
+    except OSError:
+        return False
+    if compression is not None:
+        file_name = file_name.rsplit(".", 1)[0]
+    return correct_extension(file_name)
+
+
 def main():
     sdp_cli = cli()
     args = sdp_cli.parse_args()
@@ -80,7 +141,7 @@ def main():
         files = [
             os.path.join(args.ddl_file_path, file_name)
             for file_name in os.listdir(args.ddl_file_path)
-            if correct_extension(file_name)
+            if ddl_file(os.path.join(args.ddl_file_path, file_name))
         ]
         for file_path in files:
             args.ddl_file_path = file_path
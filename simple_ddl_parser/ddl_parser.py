@@ -1,4 +1,9 @@
-from typing import Dict, List, Optional
+import mmap
+import os
+import re
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 from ply.lex import LexToken
 
@@ -6,7 +11,9 @@ from simple_ddl_parser import tokens as tok
 from simple_ddl_parser.dialects import (HQL, MSSQL, PSQL, BaseSQL, BigQuery,
                                         IBMDb2, MySQL, Oracle, Redshift,
                                         Snowflake, SparkSQL)
-from simple_ddl_parser.parser import Parser
+from simple_ddl_parser.grammar import select_rules, slim_grammar_class, terminals
+from simple_ddl_parser.parser import Parser, Source
+from simple_ddl_parser.utils import compression_of
 
 
 class DDLParserError(Exception):
@@ -19,50 +26,61 @@ class Dialects(
     pass
 
 
+# statements of each dialect, that added to the base SQL grammar in slim dialect grammars,
+# some dialects also use rules that defined in other dialects mixins, for example, table properties
+# like 'ENGINE=InnoDB' or sequence 'AS integer' are parsed by 'expr id id' rule from Redshift
+dialects = {
+    "sql": (Redshift,),
+    "mysql": (MySQL, Redshift, Snowflake),
+    "mssql": (MSSQL,),
+    "oracle": (Oracle,),
+    "hql": (HQL,),
+    "spark_sql": (SparkSQL, HQL),
+    "snowflake": (Snowflake,),
+    "redshift": (Redshift,),
+    "bigquery": (BigQuery, Snowflake),
+    "ibm_db2": (IBMDb2, Redshift, HQL),
+    "psql": (PSQL,),
+}
+
+
 class DDLParser(
     Parser, Dialects
 ):
 
     tokens = tok.tokens
     t_ignore = "\t  \r"
+    # all token rules are case-insensitive (AUTOINCREMENT & etc)
+    lexer_reflags = re.VERBOSE | re.IGNORECASE
+    keywords = tok.Keywords()
+    # otherwise ply takes as start the first rule by line number, that could be dropped in slim grammars
+    start = "expr"
+
+    def __new__(cls, *args, dialect: Optional[str] = None, **kwargs):
+        # parser with dialect= is an instance of subclass with slim grammar of this dialect
+        if dialect is not None:
+            cls = dialect_parser(cls, dialect)
+        return super().__new__(cls)
 
     def get_tag_symbol_value_and_increment(self, t: LexToken) -> LexToken:
+        flags = self.lexer_flags
         # todo: need to find less hacky way to parse HQL structure types
         if "<" in t.value:
             t.type = "LT"
-            self.lexer.lt_open += t.value.count("<")
-        if ">" in t.value and not self.lexer.check:
+            flags.lt_open += t.value.count("<")
+        if ">" in t.value and not flags.check:
             t.type = "RT"
-            self.lexer.lt_open -= t.value.count(">")
-        return t
-
-    def after_columns_tokens(self, t: LexToken) -> LexToken:
-        t.type = tok.after_columns_tokens.get(t.value.upper(), t.type)
-        if t.type != "ID":
-            self.lexer.after_columns = True
-        elif self.lexer.columns_def:
-            t.type = tok.columns_defenition.get(t.value.upper(), t.type)
-        return t
-
-    def process_body_tokens(self, t: LexToken) -> LexToken:
-        if (
-            self.lexer.last_par == "RP" and not self.lexer.lp_open
-        ) or self.lexer.after_columns:
-            t = self.after_columns_tokens(t)
-        elif self.lexer.columns_def:
-            t.type = tok.columns_defenition.get(t.value.upper(), t.type)
-        elif self.lexer.sequence:
-            t.type = tok.sequence_reserved.get(t.value.upper(), "ID")
+            flags.lt_open -= t.value.count(">")
         return t
 
     def parse_tags_symbols(self, t) -> Optional[LexToken]:
         """like symbols < >"""
-        if not self.lexer.check:
+        if not self.lexer_flags.check:
             for key in tok.symbol_tokens_no_check:
                 if key in t.value:
                     return self.get_tag_symbol_value_and_increment(t)
 
-    def tokens_not_columns_names(self, t: LexToken) -> LexToken:
+    def tokens_not_columns_names(self, t: LexToken, upper: str) -> LexToken:
 
         t_tag = self.parse_tags_symbols(t)
         if t_tag:
@@ -71,31 +89,46 @@ class DDLParser(
         if "ARRAY" in t.value:
             t.type = "ARRAY"
             return t
-        elif self.lexer.is_like:
-            t.type = tok.after_columns_tokens.get(t.value.upper(), t.type)
-        elif not self.lexer.is_table:
-            # if is_table mean wi already met INDEX or TABLE statement and
-            # the definition already done and this is a string
-            t.type = tok.defenition_statements.get(
-                t.value.upper(), t.type
-            )  # Check for reserved word
-        elif self.lexer.last_token != "COMMA":
-            t.type = tok.common_statements.get(t.value.upper(), t.type)
-        else:
-            t.type = tok.first_liners.get(t.value.upper(), t.type)
 
-        # get tokens from other token dicts
-        t = self.process_body_tokens(t)
+        # one lookup in table of all reserved words dicts by state of lexer
+        resolved = self.keywords.table[self.keywords_state()].get(upper)
+        if resolved:
+            t.type, after_columns = resolved
+            if after_columns:
+                self.lexer_flags.after_columns = True
 
         self.set_lexer_tags(t)
 
         return t
 
+    def keywords_state(self) -> int:
+        flags = self.lexer_flags
+        if flags.is_like:
+            first = tok.LIKE
+        elif not flags.is_table:
+            # if is_table mean wi already met INDEX or TABLE statement and
+            # the definition already done and this is a string
+            first = tok.DEFENITION
+        elif flags.last_token != "COMMA":
+            first = tok.COMMON
+        else:
+            first = tok.FIRST_LINER
+        if (flags.last_par == "RP" and not flags.lp_open) or flags.after_columns:
+            body = tok.AFTER_COLUMNS_DEFENITION if flags.columns_def else tok.AFTER_COLUMNS
+        elif flags.columns_def:
+            body = tok.COLUMNS_DEFENITION
+        elif flags.sequence:
+            body = tok.SEQUENCE
+        else:
+            body = tok.BODY
+        return first * 5 + body
+
     def set_lexer_tags(self, t: LexToken) -> None:
+        flags = self.lexer_flags
         if t.type == "SEQUENCE":
-            self.lexer.sequence = True
+            flags.sequence = True
         elif t.type == "CHECK":
-            self.lexer.check = True
+            flags.check = True
 
     def t_DOT(self, t: LexToken) -> LexToken:
         r"\."
@@ -103,29 +136,30 @@ class DDLParser(
         return self.set_last_token(t)
 
     def t_STRING(self, t: LexToken) -> LexToken:
-        r"((\')([a-zA-Z_,`0-9:><\=\-\+.\~\%$\!() {}\[\]\/\\\"\#\*&^|?;±§@~]*)(\')){1}"
+        r"'[^'\n]*'"
         t.type = "STRING"
         return self.set_last_token(t)
 
     def t_DQ_STRING(self, t: LexToken) -> LexToken:
-        r"((\")([a-zA-Z_,`0-9:><\=\-\+.\~\%$\!() {}'\[\]\/\\\\#\*&^|?;±§@~]*)(\")){1}"
+        r'"[^"\n]*"'
         t.type = "DQ_STRING"
         return self.set_last_token(t)
 
-    def is_token_column_name(self, t: LexToken) -> bool:
+    def is_token_column_name(self, t: LexToken, upper: str) -> bool:
         """many of reserved words can be used as column name,
         to decide is it a column name or not we need do some checks"""
+        flags = self.lexer_flags
         skip_id_tokens = ["(", ")", ","]
         return (
             t.value not in skip_id_tokens
-            and self.lexer.is_table
-            and self.lexer.lp_open
-            and not self.lexer.is_like
-            and (self.lexer.last_token == "COMMA" or self.lexer.last_token == "LP")
-            and t.value.upper() not in tok.first_liners
+            and flags.is_table
+            and flags.lp_open
+            and not flags.is_like
+            and (flags.last_token == "COMMA" or flags.last_token == "LP")
+            and upper not in self.keywords.first_liners
         )
 
-    def is_creation_name(self, t: LexToken) -> bool:
+    def is_creation_name(self, t: LexToken, upper: str) -> bool:
         """many of reserved words can be used as column name,
         to decide is it a column name or not we need do some checks"""
         skip_id_tokens = ["(", ")", ","]
@@ -142,72 +176,80 @@ class DDLParser(
         ]
         return (
             t.value not in skip_id_tokens
-            and t.value.upper() not in ["IF"]
-            and self.lexer.last_token in exceptional_keys
-            and not self.exceptional_cases(t.value.upper())
+            and upper != "IF"
+            and self.lexer_flags.last_token in exceptional_keys
+            and not self.exceptional_cases(upper)
         )
 
     def exceptional_cases(self, value: str) -> bool:
-        if value == "TABLESPACE" and self.lexer.last_token == "INDEX":
+        if value == "TABLESPACE" and self.lexer_flags.last_token == "INDEX":
             return True
         return False
 
     def t_AUTOINCREMENT(self, t: LexToken):
-        r"(AUTO_INCREMENT|AUTOINCREMENT)(?i)\b"
+        r"(AUTO_INCREMENT|AUTOINCREMENT)\b"
         t.type = "AUTOINCREMENT"
         return self.set_last_token(t)
 
     def t_ID(self, t: LexToken):
-        r"([0-9]+[.][0-9]*([e][+-]?[0-9]+)?|[0-9]\.[0-9])\w|([a-zA-Z_,0-9:><\/\\\=\-\+\~\%$@#\|&?;*\()!{}\[\]\`\[\]]+)"
+        r"""[0-9]+[.][0-9]*(?:e[+-]?[0-9]+)?\w
+        |[a-zA-Z_,0-9:><\/\\\=\-\+\~\%$@#\|&?;*\()!{}\[\]\`\x80-\U0010FFFF]+"""
+        flags = self.lexer_flags
         t.type = tok.symbol_tokens.get(t.value, "ID")
+        # value is uppercased once & used by all checks of reserved words
+        upper = t.value.upper()
 
         if t.type == "LP":
-            self.lexer.lp_open += 1
-            self.lexer.columns_def = True
-            self.lexer.last_token = "LP"
+            flags.lp_open += 1
+            flags.columns_def = True
+            flags.last_token = "LP"
             return t
-        elif self.is_token_column_name(t) or self.lexer.last_token == "DOT":
+        elif self.is_token_column_name(t, upper) or flags.last_token == "DOT":
             t.type = "ID"
-        elif t.type != "DQ_STRING" and self.is_creation_name(t):
+        elif t.type != "DQ_STRING" and self.is_creation_name(t, upper):
             t.type = "ID"
         else:
-            t = self.tokens_not_columns_names(t)
+            t = self.tokens_not_columns_names(t, upper)
 
-        self.capitalize_tokens(t)
+        self.capitalize_tokens(t, upper)
         self.commat_type(t)
+        # names, types & keywords repeat in each statement, all equal values share one object
+        t.value = self.interned.setdefault(t.value, t.value)
 
         self.set_lexx_tags(t)
 
         return self.set_last_token(t)
 
     def commat_type(self, t: LexToken):
-        if t.type == "COMMA" and self.lexer.lt_open:
+        if t.type == "COMMA" and self.lexer_flags.lt_open:
             t.type = "COMMAT"
 
-    def capitalize_tokens(self, t: LexToken):
+    def capitalize_tokens(self, t: LexToken, upper: str):
         if t.type != "ID" and t.type not in ["LT", "RT"]:
-            t.value = t.value.upper()
+            t.value = upper
 
     def set_parathesis_tokens(self, t: LexToken):
+        flags = self.lexer_flags
         if t.type in ["RP", "LP"]:
-            if t.type == "RP" and self.lexer.lp_open:
-                self.lexer.lp_open -= 1
-            self.lexer.last_par = t.type
+            if t.type == "RP" and flags.lp_open:
+                flags.lp_open -= 1
+            flags.last_par = t.type
 
     def set_lexx_tags(self, t: LexToken):
+        flags = self.lexer_flags
         self.set_parathesis_tokens(t)
 
         if t.type == "ALTER":
-            self.lexer.is_alter = True
+            flags.is_alter = True
         if t.type == "LIKE":
-            self.lexer.is_like = True
+            flags.is_like = True
         elif t.type in ["TYPE", "DOMAIN", "TABLESPACE"]:
-            self.lexer.is_table = False
-        elif t.type in ["TABLE", "INDEX"] and not self.lexer.is_alter:
-            self.lexer.is_table = True
+            flags.is_table = False
+        elif t.type in ["TABLE", "INDEX"] and not flags.is_alter:
+            flags.is_table = True
 
     def set_last_token(self, t: LexToken):
-        self.lexer.last_token = t.type
+        self.lexer_flags.last_token = t.type
         return t
 
     def p_id(self, p):
@@ -235,7 +277,82 @@ class DDLParser(
             raise DDLParserError(f"Unknown statement at {p}")
 
 
-def parse_from_file(file_path: str, parser_settings: Optional[dict] = None, **kwargs) -> List[Dict]:
-    """get useful data from ddl"""
-    with open(file_path, "r") as df:
-        return DDLParser(df.read(), **(parser_settings or {})).run(file_path=file_path, **kwargs)
+_dialect_parsers: Dict[Tuple[type, str], type] = {}
+_lock = threading.Lock()
+
+
+def dialect_parser(parser_class: type, dialect: str) -> type:
+    """subclass of parser with grammar & keywords only of base SQL & the dialect, created once per process"""
+    if dialect not in dialects:
+        raise DDLParserError(f"Unknown dialect {dialect!r}, possible variants: {list(dialects)}")
+    with _lock:
+        if (parser_class, dialect) not in _dialect_parsers:
+            optional = {mixin for mixins in dialects.values() for mixin in mixins}
+            rules = select_rules(parser_class, optional, dialects[dialect])
+            slim_class = slim_grammar_class(
+                parser_class,
+                f"{parser_class.__name__}_{dialect}",
+                rules,
+                parse_tables_file=f"parsetab_{dialect}.bin",
+            )
+            slim_class.keywords = tok.Keywords(terminals(slim_class))
+            _dialect_parsers[(parser_class, dialect)] = slim_class
+    return _dialect_parsers[(parser_class, dialect)]
+
+
+def parse_from_file(
+    file_path: str,
+    parser_settings: Optional[dict] = None,
+    stream: bool = False,
+    memory_map: bool = False,
+    encoding: Optional[str] = None,
+    **kwargs,
+) -> Union[List[Dict], Iterator[Dict]]:
+    """
+    get useful data from ddl, with stream=True file is read part by part & parsed with DDLParser.iter_parse,
+    with memory_map=True file is memory-mapped & only slice of each statement is decoded to str.
+    gzip, bz2 & xz files are detected by magic bytes & decompressed part by part while parsing.
+    encoding: encoding of the file in all modes, by default - locale encoding as in open()
+    """
+    # encoding could be also in parser settings, as argument of DDLParser
+    parser_settings = dict(parser_settings or {})
+    encoding = parser_settings.pop("encoding", encoding)
+    if stream:
+        return iter_parse_file(file_path, parser_settings, memory_map, encoding, **kwargs)
+    if memory_map or compression_of(file_path):
+        with open_ddl_file(file_path, memory_map, encoding) as source:
+            parser = DDLParser(encoding=encoding, **parser_settings)
+            return parser.run(fileobj=source, file_path=file_path, **kwargs)
+    with open(file_path, "r", encoding=encoding) as df:
+        return DDLParser(df.read(), encoding=encoding, **parser_settings).run(file_path=file_path, **kwargs)
+
+
+def iter_parse_file(
+    file_path: str,
+    parser_settings: Optional[dict] = None,
+    memory_map: bool = False,
+    encoding: Optional[str] = None,
+    **kwargs,
+) -> Iterator[Dict]:
+    parser_settings = dict(parser_settings or {})
+    encoding = parser_settings.pop("encoding", encoding)
+    with open_ddl_file(file_path, memory_map, encoding) as source:
+        yield from DDLParser(encoding=encoding, **parser_settings).iter_parse(source, **kwargs)
+
+
+@contextmanager
+def open_ddl_file(file_path: str, memory_map: bool = False, encoding: Optional[str] = None) -> Iterator[Source]:
+    """
+    file object or memory-mapped file, empty file could not be mapped - it is opened as usual.
+    compressed file is opened with decompressing file object, it could not be mapped too
+    """
+    compression = compression_of(file_path)
+    if compression:
+        with compression.open(file_path, "rt", encoding=encoding) as df:
+            yield df
+    elif memory_map and os.path.getsize(file_path):
+        with open(file_path, "rb") as df, mmap.mmap(df.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            yield mapped
+    else:
+        with open(file_path, "r", encoding=encoding) as df:
+            yield df
@@ -211,7 +211,7 @@ class Column:
         else:
             _type = self.parse_complex_type(p_list)
         if _type:
-            _type = self.process_type(_type, p_list, p)
+            _type = self.intern(self.process_type(_type, p_list, p))
         p[0]["type"] = _type
 
     def process_type(self, _type: Union[str, List], p_list: List, p: List) -> str:
@@ -329,6 +329,10 @@ class Column:
                 self.get_column_details(p_list, p)
         if not identity:
             self.set_column_size(p_list, p)
+        # same names & types of columns in all tables share one object
+        for key in ("name", "type"):
+            if isinstance(p[0].get(key), str):
+                p[0][key] = self.intern(p[0][key])
 
     def set_column_size(self, p_list: List, p: List):
         if (
@@ -0,0 +1,216 @@
+"""
+LR parsing driver specialized for grammar of the parser class.
+
+    It works on the same LALR tables & gives same results as ply.yacc.LRParser.parseopt_notrack
+    (error recovery included), but grammar symbols are not wrapped in YaccSymbol objects & rules
+    do not get YaccProduction: values of symbols are kept in plain list & p_* rule is called
+    directly with list [None, value_1, ..., value_n] as 'p'. It supports all that rules use:
+    p[n], p[n] = value, len(p), list(p), p[i:j].
+
+    ply also allows to read values of symbols below the rule in the stack with p[-n],
+    only rules that really do it (checked by bytecode) get StackSlice with such indexing.
+"""
+import copy
+import dis
+import sys
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+from ply import lex, yacc
+
+# number of symbols that must be shifted to leave recovery mode, same as in ply
+ERROR_COUNT = yacc.error_count
+
+
+class StackSlice(list):
+    """slice of rule where negative indexes point to the values below the rule in the stack, like in ply"""
+
+    __slots__ = ("stack",)
+
+    def __getitem__(self, n):
+        if type(n) is int and n < 0:
+            return self.stack[n]
+        return list.__getitem__(self, n)
+
+
+def reads_stack(rule: Callable) -> bool:
+    """check does rule read p[-n] - values below the rule"""
+    code = rule.__code__
+    if code.co_argcount < 2:
+        return False
+    p_name = code.co_varnames[1]
+    instructions = list(dis.get_instructions(rule))
+    for instruction, next_instruction in zip(instructions, instructions[1:]):
+        if (
+            instruction.opname == "LOAD_FAST"
+            and instruction.argval == p_name
+            and next_instruction.opname == "LOAD_CONST"
+            and type(next_instruction.argval) is int
+            and next_instruction.argval < 0
+        ):
+            return True
+    return False
+
+
+def make_symbol(type_: str, **attrs) -> yacc.YaccSymbol:
+    symbol = yacc.YaccSymbol()
+    symbol.type = type_
+    for name, value in attrs.items():
+        setattr(symbol, name, value)
+    return symbol
+
+
+class LRDriver:
+    """
+    Shared between all parser instances of the class as ply LRParser, each instance gets own light copy
+    with bind(). Rules are looked up by production names once, so parse calls them without any dispatch.
+    """
+
+    def __init__(self, lr_table: Any, parser_class: type) -> None:
+        self.action = lr_table.lr_action
+        self.goto = lr_table.lr_goto
+        self.defaulted_states = lr_table.defaulted_states
+        # calculated in build time, so error recovery does not unpack all lazy rows of the tables
+        self.error_states: Set[int] = lr_table.error_states
+        self.productions: List[Tuple[str, int, Optional[Callable], bool]] = []
+        for production in lr_table.lr_productions:
+            rule = getattr(parser_class, production.func) if production.func else None
+            self.productions.append((production.name, production.len, rule, bool(rule) and reads_stack(rule)))
+        self.instance = None
+        self.errorfunc = None
+        self.errorok = False
+
+    def bind(self, instance: Any) -> "LRDriver":
+        driver = copy.copy(self)
+        driver.instance = instance
+        driver.errorfunc = getattr(instance, "p_error", None)
+        return driver
+
+    def errok(self) -> None:
+        self.errorok = True
+
+    def parse(self, input: Optional[str] = None, lexer: Optional[lex.Lexer] = None) -> Any:  # noqa: C901
+        actions = self.action
+        goto = self.goto
+        productions = self.productions
+        defaulted_states = self.defaulted_states
+        instance = self.instance
+
+        if input is not None:
+            lexer.input(input)
+        get_token = lexer.token
+
+        # stacks are always aligned: symstack[i] is value of symbol that led to statestack[i]
+        statestack = [0]
+        symstack = [None]
+        lookahead = None
+        lookaheadstack = []
+        errorcount = 0
+        state = 0
+
+        while True:
+            if state not in defaulted_states:
+                if lookahead is None:
+                    lookahead = lookaheadstack.pop() if lookaheadstack else get_token()
+                    if lookahead is None:
+                        lookahead = make_symbol("$end")
+                t = actions[state].get(lookahead.type)
+            else:
+                t = defaulted_states[state]
+
+            if t is not None:
+                if t > 0:
+                    # shift
+                    statestack.append(t)
+                    state = t
+                    symstack.append(lookahead.value)
+                    lookahead = None
+                    if errorcount:
+                        errorcount -= 1
+                    continue
+
+                if t < 0:
+                    # reduce
+                    name, length, rule, stack_slice = productions[-t]
+                    if length:
+                        p = symstack[-length - 1:]
+                        p[0] = None
+                        del symstack[-length:]
+                    else:
+                        p = [None]
+                    if stack_slice:
+                        p = StackSlice(p)
+                        p.stack = symstack
+                    try:
+                        rule(instance, p)
+                    except SyntaxError:
+                        # same as in ply: put back the rule & continue with 'error' as lookahead
+                        lookaheadstack.append(lookahead)
+                        if length:
+                            symstack.extend(p[1:-1])
+                        statestack.pop()
+                        state = statestack[-1]
+                        lookahead = make_symbol("error", value="error")
+                        errorcount = ERROR_COUNT
+                        self.errorok = False
+                        continue
+                    if length:
+                        del statestack[-length:]
+                    symstack.append(p[0])
+                    state = goto[statestack[-1]][name]
+                    statestack.append(state)
+                    continue
+
+                # accept
+                return symstack[-1]
+
+            # syntax error, recovery is the same as in ply
+            if errorcount == 0 or self.errorok:
+                errorcount = ERROR_COUNT
+                self.errorok = False
+                errtoken = lookahead
+                if errtoken.type == "$end":
+                    errtoken = None
+                if self.errorfunc:
+                    if errtoken and not hasattr(errtoken, "lexer"):
+                        errtoken.lexer = lexer
+                    tok = self.errorfunc(errtoken)
+                    if self.errorok:
+                        lookahead = tok
+                        continue
+                elif errtoken:
+                    lineno = getattr(errtoken, "lineno", 0)
+                    if lineno:
+                        sys.stderr.write(f"yacc: Syntax error at line {lineno}, token={errtoken.type}\n")
+                    else:
+                        sys.stderr.write(f"yacc: Syntax error, token={errtoken.type}")
+                else:
+                    sys.stderr.write("yacc: Parse error in input. EOF\n")
+                    return
+            else:
+                errorcount = ERROR_COUNT
+
+            if len(statestack) <= 1 and lookahead.type != "$end":
+                # nothing to pop - discard the token & start from initial state
+                lookahead = None
+                state = 0
+                del lookaheadstack[:]
+                continue
+
+            if lookahead.type == "$end":
+                return
+
+            if lookahead.type != "error":
+                if statestack[-1] in self.error_states:
+                    lookahead = None
+                    continue
+                lookaheadstack.append(lookahead)
+                attrs = {"value": lookahead}
+                if hasattr(lookahead, "lineno"):
+                    attrs["lineno"] = attrs["endlineno"] = lookahead.lineno
+                if hasattr(lookahead, "lexpos"):
+                    attrs["lexpos"] = attrs["endlexpos"] = lookahead.lexpos
+                lookahead = make_symbol("error", **attrs)
+            else:
+                symstack.pop()
+                statestack.pop()
+                state = statestack[-1]
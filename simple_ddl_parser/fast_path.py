@@ -0,0 +1,181 @@
+"""
+Recursive-descent fast path for the most common simple statement:
+
+    CREATE TABLE [IF NOT EXISTS] [schema.]name (
+        column type[(size[, precision])] [NULL | NOT NULL | DEFAULT value] ...,
+        ...,
+        PRIMARY KEY (column, ...)
+    )
+
+It builds exactly the same dict that the grammar produces for such statement, without lexer & LR parser.
+On anything that it does not handle (any reserved word as name, quoted names, other statements & properties)
+it returns None and statement is parsed by the grammar.
+"""
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+
+from simple_ddl_parser import tokens as tok
+
+# statement is already pre-processed: ',', '(' and ')' are separated by spaces,
+# spaces are only that ignored by the lexer - any other symbol means error in the lexer
+TOKEN = re.compile(
+    r"[ \t\r]*(?:('[A-Za-z0-9_ ]*')"
+    r"|([0-9]+)(?=[ \t\r(),]|$)"
+    r"|([A-Za-z_][A-Za-z0-9_]*)(?=[ \t\r(),.]|$)"
+    r"|([(),.])"
+    r"|([^ \t\r]+))"
+)
+# findall() gives tuple of groups for each token, only the group of token kind is not empty.
+# OTHER takes all symbols till space: statement is not in the fast path anyway & search does not
+# start again from each next symbol (time of long run of digits like 111...1x would grow as square)
+STRING, NUMBER, WORD, SYMBOL, OTHER = range(5)
+END = ("",) * 5
+
+# words that lexer could turn into tokens other than ID, or that are handled by rules in special way
+RESERVED = {word.upper() for words in tok.reserved_dicts for word in words} | {
+    "AUTO_INCREMENT",
+    "AUTOINCREMENT",
+    "ASC",
+    "DESC",
+    "NOT",
+    "NULL",
+    "DEFAULT",
+}
+
+
+class Bail(Exception):
+    """statement is not in the subset of the fast path"""
+
+
+class SimpleCreateTable:
+    def __init__(self, statement: str, intern: Optional[Callable[[str], str]] = None) -> None:
+        self.tokens = self.tokenize(statement)
+        self.pos = 0
+        # names & types share one object for equal values, as in the lexer
+        self.intern = intern or str
+
+    @staticmethod
+    def tokenize(statement: str) -> List[Tuple[str, ...]]:
+        tokens = TOKEN.findall(statement)
+        if any(token[OTHER] for token in tokens):
+            raise Bail
+        return tokens
+
+    def peek(self, offset: int = 0) -> Tuple[str, ...]:
+        if self.pos + offset < len(self.tokens):
+            return self.tokens[self.pos + offset]
+        return END
+
+    def keyword(self, *words: str) -> bool:
+        """consume keywords if they are next tokens"""
+        for offset, word in enumerate(words):
+            if self.peek(offset)[WORD].upper() != word:
+                return False
+        self.pos += len(words)
+        return True
+
+    def expect_keyword(self, *words: str) -> None:
+        if not self.keyword(*words):
+            raise Bail
+
+    def symbol(self, value: str) -> bool:
+        if self.peek()[SYMBOL] == value:
+            self.pos += 1
+            return True
+        return False
+
+    def expect_symbol(self, value: str) -> None:
+        if not self.symbol(value):
+            raise Bail
+
+    def name(self) -> str:
+        value = self.peek()[WORD]
+        if not value or value.upper() in RESERVED or "ARRAY" in value.upper():
+            raise Bail
+        self.pos += 1
+        return self.intern(value)
+
+    def number(self) -> str:
+        value = self.peek()[NUMBER]
+        if not value:
+            raise Bail
+        self.pos += 1
+        return value
+
+    def parse(self) -> Dict:
+        self.expect_keyword("CREATE", "TABLE")
+        data = {}
+        if self.keyword("IF", "NOT", "EXISTS"):
+            data["if_not_exists"] = True
+        schema, table_name = None, self.name()
+        if self.symbol("."):
+            schema, table_name = table_name, self.name()
+        data.update({"schema": schema, "table_name": table_name, "columns": [], "checks": []})
+
+        self.expect_symbol("(")
+        data["columns"].append(self.column())
+        while self.symbol(","):
+            if self.keyword("PRIMARY", "KEY"):
+                data["primary_key"] = self.primary_key()
+            else:
+                data["columns"].append(self.column())
+        self.expect_symbol(")")
+        if self.pos != len(self.tokens):
+            raise Bail
+        return data
+
+    def primary_key(self) -> List[str]:
+        self.expect_symbol("(")
+        columns = [self.name()]
+        while self.symbol(","):
+            columns.append(self.name())
+        self.expect_symbol(")")
+        return columns
+
+    def column(self) -> Dict:
+        column = {"name": self.name(), "type": self.name(), "size": None}
+        if self.symbol("("):
+            size = int(self.number())
+            if self.symbol(","):
+                size = (size, int(self.number()))
+            self.expect_symbol(")")
+            column["size"] = size
+        column.update(
+            {
+                "references": None,
+                "unique": False,
+                "primary_key": False,
+                "nullable": True,
+                "default": None,
+                "check": None,
+            }
+        )
+        while True:
+            if self.keyword("NULL"):
+                column["nullable"] = True
+            elif self.keyword("NOT", "NULL"):
+                column["nullable"] = False
+            elif self.keyword("DEFAULT"):
+                column["default"] = self.default()
+            else:
+                return column
+
+    def default(self):
+        token = self.peek()
+        if self.keyword("NULL"):
+            return "NULL"
+        if token[NUMBER]:
+            self.pos += 1
+            return int(token[NUMBER])
+        if token[STRING]:
+            self.pos += 1
+            return token[STRING]
+        return self.name()
+
+
+def parse_simple_create_table(statement: str, intern: Optional[Callable[[str], str]] = None) -> Optional[Dict]:
+    """dict of simple CREATE TABLE statement or None if statement must be parsed by the grammar"""
+    try:
+        return SimpleCreateTable(statement, intern).parse()
+    except Bail:
+        return None
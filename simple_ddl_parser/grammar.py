@@ -0,0 +1,178 @@
+import copy
+import logging
+import re
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Set, Tuple
+
+from ply import lex, yacc
+
+from simple_ddl_parser.driver import LRDriver
+from simple_ddl_parser.parse_tables import (PARSE_TABLES_FILE, lexer_signature,
+                                            read_lexer_tables, read_tables)
+
+
+class Grammar:
+    """
+    Lexer & LALR parser built once per parser class.
+
+        Building them means introspection of all t_* & p_* methods, compiling of prebuilt master token regex
+        and reading of the parse tables - this is heavy, so it done only one time per process.
+
+        Each parser instance gets own light copies of lexer & LR driver that share all tables with this object,
+        so creating of new parser instance costs almost nothing.
+
+        Statements are parsed with specialized LRDriver, ply LRParser on the same tables is kept only to check
+        that results are the same (see 'pytest --check-driver').
+    """
+
+    def __init__(self, lexer: lex.Lexer, lr_parser: yacc.LRParser, driver: LRDriver) -> None:
+        self.lexer = lexer
+        self.lr_parser = lr_parser
+        self.driver = driver
+
+    def bind_lexer(self, instance: Any) -> lex.Lexer:
+        lexer = self.lexer.clone(object=instance)
+        # clone() rebinds only the tables of all states, active state rules must be re-selected
+        lexer.begin(lexer.lexstate)
+        return lexer
+
+    def bind_parser(self, instance: Any) -> LRDriver:
+        return self.driver.bind(instance)
+
+    def bind_ply_parser(self, instance: Any) -> yacc.LRParser:
+        parser = copy.copy(self.lr_parser)
+        # productions are shared, they dispatch rules to the instance that stored in the parser
+        parser.instance = instance
+        parser.errorfunc = getattr(instance, "p_error", None)
+        return parser
+
+
+def dispatch_to_instance(rule: Callable) -> Callable:
+    def call_rule(p: yacc.YaccProduction) -> None:
+        return rule(p.parser.instance, p)
+
+    return call_rule
+
+
+def bind_productions_to_class(productions: List[yacc.MiniProduction], parser_class: type) -> None:
+    for production in productions:
+        if production.func:
+            production.callable = dispatch_to_instance(getattr(parser_class, production.func))
+
+
+def reflect_grammar(module: Any, log: logging.Logger) -> yacc.ParserReflect:
+    """collect tokens & p_* rules from the parser object same way as ply.yacc does"""
+    # rules that switched off in slim grammars are set to None
+    pdict = {name: getattr(module, name) for name in dir(module) if getattr(module, name) is not None}
+    pinfo = yacc.ParserReflect(pdict, log=log)
+    pinfo.get_all()
+    # ply orders rules by line numbers only, so rules of different modules are mixed by their lines.
+    # They are ordered by module & place in it, then tables do not depend on line numbers
+    pinfo.pfuncs.sort(key=lambda pfunc: (getattr(pfunc[1], "__name__", ""), pfunc[0], pfunc[2]))
+    if pinfo.error:
+        raise yacc.YaccError("Unable to build parser")
+    return pinfo
+
+
+def rules_owners(parser_class: type) -> Dict[str, Tuple[type, List[Tuple]]]:
+    """p_* rules of the parser class: name -> (class where rule defined, parsed productions)"""
+    rules = {}
+    for name in dir(parser_class):
+        rule = getattr(parser_class, name)
+        if name.startswith("p_") and name != "p_error" and callable(rule):
+            owner = next(cls for cls in parser_class.__mro__ if name in cls.__dict__)
+            rules[name] = (owner, yacc.parse_grammar(rule.__doc__, name, 1))
+    return rules
+
+
+def select_rules(parser_class: type, optional: Iterable[type], chosen: Iterable[type]) -> Set[str]:
+    """
+    names of p_* rules for slim grammar: all rules except defined in optional classes (mixins),
+    only rules of chosen classes are taken & rules of other optional classes if they define
+    some nonterminal that used in already selected rules
+    """
+    optional, chosen = set(optional), set(chosen)
+    rules = rules_owners(parser_class)
+    selected = {name for name, (owner, _) in rules.items() if owner not in optional or owner in chosen}
+    while True:
+        productions = [prod for name in selected for prod in rules[name][1]]
+        defined = {prod[2] for prod in productions}
+        undefined = {sym for prod in productions for sym in prod[3]} - set(parser_class.tokens) - defined
+        if not undefined:
+            return selected
+        selected |= {name for name, (_, prods) in rules.items() if any(prod[2] in undefined for prod in prods)}
+
+
+def terminals(parser_class: type) -> Set[str]:
+    """tokens that really used in the grammar of the parser class"""
+    used = set()
+    for owner, productions in rules_owners(parser_class).values():
+        for prod in productions:
+            used.update(prod[3])
+    return used & set(parser_class.tokens)
+
+
+def slim_grammar_class(parser_class: type, name: str, rules: Set[str], **attrs) -> type:
+    """subclass of the parser, where all p_* rules that not in 'rules' are switched off"""
+    for rule in rules_owners(parser_class):
+        if rule not in rules:
+            attrs[rule] = None
+    return type(name, (parser_class,), attrs)
+
+
+def lexer_reflags(parser_class: type) -> int:
+    return int(getattr(parser_class, "lexer_reflags", re.VERBOSE))
+
+
+def generate_lexer(parser_class: type, log: logging.Logger) -> Tuple[str, lex.Lexer]:
+    """assemble & validate master regex of the lexer, build-time step - see build_tables.py"""
+    module = parser_class.__new__(parser_class)
+    reflags = lexer_reflags(parser_class)
+    lexer = lex.lex(object=module, reflags=reflags, debug=False, debuglog=log, errorlog=log)
+    return lexer_signature(module, reflags), lexer
+
+
+def generate_tables(parser_class: type, log: logging.Logger) -> Tuple[str, yacc.LRGeneratedTable]:
+    """generate LALR tables from the parser class grammar, build-time step - see build_tables.py"""
+    pinfo = reflect_grammar(parser_class.__new__(parser_class), log)
+    if pinfo.validate_all():
+        raise yacc.YaccError("Unable to build parser")
+
+    grammar = yacc.Grammar(pinfo.tokens)
+    for term, assoc, level in pinfo.preclist:
+        grammar.set_precedence(term, assoc, level)
+    for func_name, (file, line, prod_name, syms) in pinfo.grammar:
+        grammar.add_production(prod_name, syms, func_name, file, line)
+    grammar.set_start(pinfo.start)
+    for symbol, production in grammar.undefined_symbols():
+        raise yacc.YaccError(f"Symbol {symbol!r} is used in rule {production.name!r}, but not defined")
+    return pinfo.signature(), yacc.LRGeneratedTable(grammar, "LALR", log)
+
+
+_grammars: Dict[type, Grammar] = {}
+_lock = threading.Lock()
+
+
+def build_grammar(parser_class: type, log: logging.Logger) -> Grammar:
+    # ply only needs class attributes (tokens, t_* & p_* methods) to build lexer & parser,
+    # so they are built on the bare instance to not keep in memory data of any real parser
+    module = parser_class.__new__(parser_class)
+    lexer = read_lexer_tables(lexer_signature(module, lexer_reflags(parser_class)), module)
+    pinfo = reflect_grammar(module, log)
+    lr_table = read_tables(pinfo.signature(), getattr(parser_class, "parse_tables_file", PARSE_TABLES_FILE))
+    bind_productions_to_class(lr_table.lr_productions, parser_class)
+    lr_parser = yacc.LRParser(lr_table, pinfo.error_func)
+    # rows of the tables are unpacked lazily, so defaulted states are precalculated in build time
+    lr_parser.defaulted_states = lr_table.defaulted_states
+    return Grammar(lexer, lr_parser, LRDriver(lr_table, parser_class))
+
+
+def get_grammar(parser_class: type, log: logging.Logger) -> Grammar:
+    """get shared grammar for parser class, build it on first call"""
+    grammar = _grammars.get(parser_class)
+    if grammar is None:
+        with _lock:
+            grammar = _grammars.get(parser_class)
+            if grammar is None:
+                grammar = _grammars[parser_class] = build_grammar(parser_class, log)
+    return grammar
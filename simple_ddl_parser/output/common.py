@@ -1,8 +1,9 @@
 import json
 import logging
 import os
+from collections import deque
 from copy import deepcopy
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from simple_ddl_parser.output import dialects as d
 
@@ -190,6 +191,47 @@ def result_format(
     return final_result
 
 
+def alter_or_index_table_id(statement: Dict) -> Tuple[str, str]:
+    if "index_name" in statement:
+        return (statement["table_name"], statement["schema"])
+    return (statement["alter_table_name"], statement["schema"])
+
+
+def iter_result_format(
+    result: Iterable[Dict], output_mode: str, lookahead: Optional[int] = 0
+) -> Iterator[Dict]:
+    """
+    same as result_format (without group_by_type), but yields each entity as soon as it is formatted.
+
+    entities are yielded in the same order as in result, each of them only after next 'lookahead' statements
+    are processed: ALTER & INDEX statements in this window are added to the table same way as in result_format,
+    ALTER & INDEX statements to the table that was already yielded are yielded as is.
+    lookahead=None - hold all entities till the end of result (output is the same as result_format gives)
+    """
+    tables_dict = {}
+    yielded_tables = set()
+    held = deque()
+    for num, table in enumerate(result):
+        if "index_name" in table or "alter_table_name" in table:
+            table_id = alter_or_index_table_id(table)
+            if table_id not in tables_dict and table_id in yielded_tables:
+                held.append((num, table))
+            else:
+                tables_dict = process_alter_and_index_result(tables_dict, table, output_mode)
+        else:
+            held.append((num, process_entities(tables_dict, table, output_mode)))
+        while held and lookahead is not None and held[0][0] + lookahead <= num:
+            entity = held.popleft()[1]
+            if "table_name" in entity:
+                table_id = (entity["table_name"], entity["schema"])
+                if tables_dict.get(table_id) is entity:
+                    del tables_dict[table_id]
+                    yielded_tables.add(table_id)
+            yield entity
+    while held:
+        yield held.popleft()[1]
+
+
 def process_is_it_table_item(table_data: Dict, tables_dict: Dict) -> Dict:
     if table_data.get("table_name"):
         tables_dict[(table_data["table_name"], table_data["schema"])] = table_data
@@ -0,0 +1,322 @@
+"""
+Compact binary format of LALR tables that shipped with the package.
+
+    File layout (all numbers are little-endian):
+
+        header   - magic, format version, matrix item type code, states/terminals/nonterminals count,
+                   size of metadata
+        metadata - marshal dump of: ply tables version, grammar signature, names of terminals & nonterminals,
+                   productions, defaulted states & states reached by shift of 'error'
+        action   - dense matrix [states x terminals], item: shift state (> 0), reduce rule (< 0), accept (0)
+                   or EMPTY_ACTION
+        goto     - dense matrix [states x nonterminals], item: state or EMPTY_GOTO
+
+    Matrices are not unpacked on load - file is memory-mapped (if it is a real file on disk) and row of the
+    state turns into dict only when the parser gets to this state first time.
+
+Lexer tables (lextab) - marshal dump of already assembled master regexes of the lexer with names of the t_*
+methods, same information as in ply 'lextab.py' in optimize mode. Loading of them skips regex assembly & validation,
+methods are bound to the parser object by names.
+"""
+import marshal
+import mmap
+import os
+import re
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+from ply import lex, yacc
+
+try:
+    from importlib import resources
+except ImportError:  # python 3.6
+    import pkgutil
+
+    resources = None
+
+# version of the tables file layout, must be changed on any change in write_tables/read_tables
+TABLES_FORMAT_VERSION = 3
+
+PARSE_TABLES_FILE = "parsetab.bin"
+
+LEXER_TABLES_FILE = "lextab.bin"
+
+REBUILD_TABLES_HINT = "Tables must be regenerated with 'python -m simple_ddl_parser.build_tables'"
+
+MAGIC = b"SDPT"
+# magic, format version, item type code, states, terminals, nonterminals, metadata size
+HEADER = struct.Struct("<4sHcxIIII")
+EMPTY_GOTO = -1
+
+
+class ParseTablesError(Exception):
+    pass
+
+
+def empty_action(typecode: str) -> int:
+    return -(2 ** (array(typecode).itemsize * 8 - 1))
+
+
+class LazyTable(dict):
+    """state -> {symbol: value} mapping, that unpacks rows of dense matrix on first access"""
+
+    def __init__(self, matrix: Union[memoryview, array], symbols: List[str], empty: int) -> None:
+        super().__init__()
+        self.matrix = matrix
+        self.symbols = symbols
+        self.empty = empty
+
+    def __missing__(self, state: int) -> Dict[str, int]:
+        row_size = len(self.symbols)
+        row = self.matrix[state * row_size: (state + 1) * row_size]
+        self[state] = unpacked = {
+            symbol: value for symbol, value in zip(self.symbols, row) if value != self.empty
+        }
+        return unpacked
+
+
+def pack_matrix(
+    table: Dict[int, Dict[str, int]], states: int, symbols: List[str], typecode: str, empty: int
+) -> array:
+    columns = {symbol: num for num, symbol in enumerate(symbols)}
+    matrix = array(typecode, [empty]) * (states * len(symbols))
+    for state, row in table.items():
+        for symbol, value in row.items():
+            matrix[state * len(symbols) + columns[symbol]] = value
+    return matrix
+
+
+def choose_typecode(values: Iterable[int]) -> str:
+    values = list(values)
+    # the most negative value is reserved for empty action
+    if values and -(2 ** 15) < min(values) and max(values) < 2 ** 15:
+        return "h"
+    return "i"
+
+
+def defaulted_states(action: Dict[int, Dict[str, int]]) -> Dict[int, int]:
+    """same as ply LRParser.set_defaulted_states, calculated once in build time"""
+    defaulted = {}
+    for state, actions in action.items():
+        rules = list(actions.values())
+        if len(rules) == 1 and rules[0] < 0:
+            defaulted[state] = rules[0]
+    return defaulted
+
+
+def error_states(action: Dict[int, Dict[str, int]]) -> List[int]:
+    """states reached by shift of 'error' symbol, they are needed only in error recovery"""
+    return sorted({actions["error"] for actions in action.values() if actions.get("error", 0) > 0})
+
+
+def dump_tables(signature: str, lr_table: Any) -> bytes:
+    action, goto = lr_table.lr_action, lr_table.lr_goto
+    states = max(action) + 1
+    terminals = sorted({symbol for row in action.values() for symbol in row})
+    nonterminals = sorted({symbol for row in goto.values() for symbol in row})
+
+    typecode = choose_typecode(
+        [value for row in action.values() for value in row.values()]
+        + [value for row in goto.values() for value in row.values()]
+    )
+    action_matrix = pack_matrix(action, states, terminals, typecode, empty_action(typecode))
+    goto_matrix = pack_matrix(goto, states, nonterminals, typecode, EMPTY_GOTO)
+    if sys.byteorder != "little":
+        action_matrix.byteswap()
+        goto_matrix.byteswap()
+
+    metadata = marshal.dumps(
+        {
+            "tabversion": yacc.__tabversion__,
+            "method": lr_table.lr_method,
+            "signature": signature,
+            "terminals": terminals,
+            "nonterminals": nonterminals,
+            # line of rule is not stored (it is only for debug output of ply), so tables are the same
+            # when lines of module are shifted
+            "productions": [
+                (str(p), p.name, p.len, p.func, os.path.basename(p.file), 0) for p in lr_table.lr_productions
+            ],
+            "defaulted_states": defaulted_states(action),
+            "error_states": error_states(action),
+        },
+        # version 4 is supported by all python versions of the package
+        4,
+    )
+    # matrices must be aligned by item size to be used directly from mmap
+    metadata += b"\0" * (-(HEADER.size + len(metadata)) % action_matrix.itemsize)
+    header = HEADER.pack(
+        MAGIC,
+        TABLES_FORMAT_VERSION,
+        typecode.encode(),
+        states,
+        len(terminals),
+        len(nonterminals),
+        len(metadata),
+    )
+    return header + metadata + action_matrix.tobytes() + goto_matrix.tobytes()
+
+
+def write_tables(signature: str, lr_table: Any, output_dir: str, file_name: str = PARSE_TABLES_FILE) -> str:
+    path = os.path.join(output_dir, file_name)
+    with open(path, "wb") as tables_file:
+        tables_file.write(dump_tables(signature, lr_table))
+    return path
+
+
+def read_package_resource(file_name: str) -> bytes:
+    """read file shipped inside the package, works also for zipped installations"""
+    if resources is None:
+        return pkgutil.get_data(__package__, file_name)
+    if hasattr(resources, "files"):
+        return resources.files(__package__).joinpath(file_name).read_bytes()
+    return resources.read_binary(__package__, file_name)
+
+
+def open_package_resource(file_name: str) -> Union[bytes, mmap.mmap]:
+    """memory-map file shipped inside the package or read it if the package is not on disk (zip)"""
+    path = os.path.join(os.path.dirname(__file__), file_name)
+    if os.path.isfile(path):
+        with open(path, "rb") as resource:
+            return mmap.mmap(resource.fileno(), 0, access=mmap.ACCESS_READ)
+    return read_package_resource(file_name)
+
+
+def read_matrix(buffer: Union[bytes, mmap.mmap], offset: int, size: int, typecode: str) -> Union[memoryview, array]:
+    itemsize = array(typecode).itemsize
+    data = memoryview(buffer)[offset: offset + size * itemsize]
+    if sys.byteorder == "little":
+        return data.cast(typecode)
+    matrix = array(typecode, data.tobytes())
+    matrix.byteswap()
+    return matrix
+
+
+def parse_header(buffer: Union[bytes, mmap.mmap], file_name: str) -> Tuple:
+    if len(buffer) < HEADER.size or buffer[: len(MAGIC)] != MAGIC:
+        raise ParseTablesError(f"File {file_name} is not a parse tables file. {REBUILD_TABLES_HINT}")
+    header = HEADER.unpack_from(buffer)
+    if header[1] != TABLES_FORMAT_VERSION:
+        raise ParseTablesError(
+            f"Parse tables {file_name} have unsupported version {header[1]}. {REBUILD_TABLES_HINT}"
+        )
+    return header
+
+
+def read_tables(signature: str, file_name: str = PARSE_TABLES_FILE) -> yacc.LRTable:
+    """load prebuilt parse tables from the package, tables are never generated or written in runtime"""
+    try:
+        buffer = open_package_resource(file_name)
+    except OSError as e:
+        raise ParseTablesError(f"Cannot load parse tables {file_name}: {e}. {REBUILD_TABLES_HINT}")
+
+    _, _, typecode, states, terminals, nonterminals, metadata_size = parse_header(buffer, file_name)
+    typecode = typecode.decode()
+    metadata = marshal.loads(buffer[HEADER.size: HEADER.size + metadata_size])
+    if metadata["tabversion"] != yacc.__tabversion__:
+        raise ParseTablesError(
+            f"Parse tables {file_name} were built for ply tables version {metadata['tabversion']}. "
+            f"{REBUILD_TABLES_HINT}"
+        )
+    if metadata["signature"] != signature:
+        raise ParseTablesError(f"Parse tables {file_name} do not match the parser grammar. {REBUILD_TABLES_HINT}")
+
+    action_offset = HEADER.size + metadata_size
+    goto_offset = action_offset + states * terminals * array(typecode).itemsize
+    action_matrix = read_matrix(buffer, action_offset, states * terminals, typecode)
+    goto_matrix = read_matrix(buffer, goto_offset, states * nonterminals, typecode)
+
+    lr_table = yacc.LRTable()
+    lr_table.lr_method = metadata["method"]
+    lr_table.lr_action = LazyTable(action_matrix, metadata["terminals"], empty_action(typecode))
+    lr_table.lr_goto = LazyTable(goto_matrix, metadata["nonterminals"], EMPTY_GOTO)
+    lr_table.lr_productions = [yacc.MiniProduction(*p) for p in metadata["productions"]]
+    lr_table.defaulted_states = metadata["defaulted_states"]
+    lr_table.error_states = set(metadata["error_states"])
+    return lr_table
+
+
+def lexer_signature(module: Any, reflags: int) -> str:
+    """all that used to assemble master regex: tokens, regex flags & t_* rules in order of definition"""
+    functions = []
+    strings = []
+    for name in dir(module):
+        if name.startswith("t_"):
+            rule = getattr(module, name)
+            if callable(rule):
+                functions.append((rule.__code__.co_firstlineno, name, rule.__doc__))
+            else:
+                strings.append((name, rule))
+    # only order of rules matters, not their line numbers - tables stay valid when lines of module are shifted
+    rules = [(order, name, doc) for order, (_, name, doc) in enumerate(sorted(functions))]
+    return repr((sorted(module.tokens), int(reflags), rules, sorted(strings)))
+
+
+def dump_lexer_tables(signature: str, lexer: lex.Lexer) -> bytes:
+    master_re = {}
+    for state, rules in lexer.lexstatere.items():
+        master_re[state] = [
+            (regex_text, [(name, func[1]) if func and func[0] else func for func, name in zip(funcs, names)])
+            for (_, funcs), regex_text, names in zip(
+                rules, lexer.lexstateretext[state], lexer.lexstaterenames[state]
+            )
+        ]
+    return marshal.dumps(
+        {
+            "format_version": TABLES_FORMAT_VERSION,
+            "signature": signature,
+            "tokens": sorted(lexer.lextokens),
+            "reflags": int(lexer.lexreflags),
+            "literals": lexer.lexliterals,
+            "stateinfo": lexer.lexstateinfo,
+            "master_re": master_re,
+            "ignore": lexer.lexstateignore,
+            "errorf": {state: f.__name__ for state, f in lexer.lexstateerrorf.items() if f},
+            "eoff": {state: f.__name__ for state, f in lexer.lexstateeoff.items() if f},
+        },
+        4,
+    )
+
+
+def write_lexer_tables(
+    signature: str, lexer: lex.Lexer, output_dir: str, file_name: str = LEXER_TABLES_FILE
+) -> str:
+    path = os.path.join(output_dir, file_name)
+    with open(path, "wb") as tables_file:
+        tables_file.write(dump_lexer_tables(signature, lexer))
+    return path
+
+
+def read_lexer_tables(signature: str, module: Any, file_name: str = LEXER_TABLES_FILE) -> lex.Lexer:
+    """create lexer from prebuilt master regexes, same as ply Lexer.readtab() do in optimize mode"""
+    try:
+        tables = marshal.loads(read_package_resource(file_name))
+    except (OSError, EOFError, ValueError, TypeError) as e:
+        raise ParseTablesError(f"Cannot load lexer tables {file_name}: {e}. {REBUILD_TABLES_HINT}")
+    if not isinstance(tables, dict) or tables.get("format_version") != TABLES_FORMAT_VERSION:
+        raise ParseTablesError(f"Lexer tables {file_name} have unsupported version. {REBUILD_TABLES_HINT}")
+    if tables["signature"] != signature:
+        raise ParseTablesError(f"Lexer tables {file_name} do not match the lexer rules. {REBUILD_TABLES_HINT}")
+
+    lexer = lex.Lexer()
+    lexer.lextokens = set(tables["tokens"])
+    lexer.lexreflags = tables["reflags"]
+    lexer.lexliterals = tables["literals"]
+    lexer.lextokens_all = lexer.lextokens | set(lexer.lexliterals)
+    lexer.lexstateinfo = tables["stateinfo"]
+    lexer.lexstateignore = tables["ignore"]
+    for state, rules in tables["master_re"].items():
+        lexer.lexstatere[state] = [
+            (
+                re.compile(regex_text, lexer.lexreflags),
+                [(getattr(module, func[0]), func[1]) if func and func[0] else func for func in funcs],
+            )
+            for regex_text, funcs in rules
+        ]
+        lexer.lexstateretext[state] = [regex_text for regex_text, _ in rules]
+    lexer.lexstateerrorf = {state: getattr(module, name) for state, name in tables["errorf"].items()}
+    lexer.lexstateeoff = {state: getattr(module, name) for state, name in tables["eoff"].items()}
+    lexer.begin("INITIAL")
+    return lexer
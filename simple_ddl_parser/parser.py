@@ -1,13 +1,22 @@
 import json
+import locale
 import logging
+import mmap
 import os
 import re
-from typing import Dict, List, Optional, Tuple, Union
+from typing import IO, Dict, Iterable, Iterator, List, Optional, Pattern, Union
 
-from ply import lex, yacc
+from simple_ddl_parser.fast_path import parse_simple_create_table
+from simple_ddl_parser.grammar import get_grammar
+from simple_ddl_parser.output.common import dump_data_to_file, iter_result_format, result_format
+from simple_ddl_parser.procedural import ProceduralBodies
+from simple_ddl_parser.tokens import TokenArrays
+from simple_ddl_parser.utils import (TableFilter, entity_kinds, find_first_unpair_closed_par, pre_process,
+                                     read_chunks, read_mapped_chunks, skip_data_sections, statement_kind,
+                                     statement_lines, statement_table)
 
-from simple_ddl_parser.output.common import dump_data_to_file, result_format
-from simple_ddl_parser.utils import find_first_unpair_closed_par
+# file object or memory-mapped file to read ddl from
+Source = Union[IO[str], mmap.mmap]
 
 # open comment
 OP_COM = "/*"
@@ -17,6 +26,15 @@ CL_COM = "*/"
 IN_COM = "--"
 MYSQL_COM = "#"
 
+# code till comment: quoted strings & symbols that are not '--' or '/*', stops also at quote that is not closed
+CODE = re.compile(r"""[^'"/-]*(?:(?:'[^']*'|"[^"]*"|-(?!-)|/(?!\*))[^'"/-]*)*""")
+# string of one comma like ',' or ' , ' (separator in HQL). Match starts only at the first quote of run of quotes,
+# otherwise search tries each quote of long run & time grows as square of its length
+COMMA_ONLY_STR = re.compile(r"(?<!')(?<!' )(?:' ?)+,(?:'| ')+\B")
+# IDs & types are interned till there are so many of them, then table of interned values starts again,
+# so memory of iter_parse does not grow with size of dump
+INTERNED_LIMIT = 100000
+
 
 def set_logging_config(
         log_level: Union[str, int],
@@ -36,6 +54,45 @@ def set_logging_config(
         )
 
 
+def table_filter_of(
+    include: Optional[Iterable[Union[str, Pattern]]], exclude: Optional[Iterable[Union[str, Pattern]]]
+) -> Optional[TableFilter]:
+    if include is None and not exclude:
+        return None
+    return TableFilter(include, exclude)
+
+
+class LexerFlags:
+    """flags of the lexer in current statement that token rules set & check, fresh instance for each statement"""
+
+    __slots__ = (
+        "is_table",
+        "sequence",
+        "last_token",
+        "columns_def",
+        "after_columns",
+        "check",
+        "last_par",
+        "lp_open",
+        "is_alter",
+        "is_like",
+        "lt_open",
+    )
+
+    def __init__(self) -> None:
+        self.is_table = False
+        self.sequence = False
+        self.last_token: Optional[str] = None
+        self.columns_def = False
+        self.after_columns = False
+        self.check = False
+        self.last_par: Optional[str] = None
+        self.lp_open = 0
+        self.is_alter = False
+        self.is_like = False
+        self.lt_open = 0
+
+
 class Parser:
     """
     Base class for a lexer/parser that has the rules defined as methods
@@ -56,17 +113,21 @@ class Parser:
 
     def __init__(
         self,
-        content: str,
+        content: str = "",
         silent: bool = True,
         debug: bool = False,
         normalize_names: bool = False,
         log_file: Optional[str] = None,
         log_level: Union[str, int] = logging.INFO,
+        dialect: Optional[str] = None,
+        fast_path: bool = False,
+        include_kinds: Optional[Iterable[str]] = None,
+        encoding: Optional[str] = None,
     ) -> None:
         """
             content: is a file content for processing
             silent: if true - will not raise errors, just return empty output
-            debug: if True - parser will produce huge tokens tree & parser.out file, normally you don't want this enable
+            debug: if True - errors of statements parsing are raised, same as with silent=False
             normalize_names: if flag is True (default 'False') then all identifiers will be returned without
                             '[', '"' and other delimeters that used in different SQL dialects to separate custom names
                             from reserverd words & statements.
@@ -79,82 +140,114 @@ class Parser:
                             In output you will have names like 'dbo' and 'TO_Requests', not '[dbo]' and '[TO_Requests]'.
             log_file: path to file for logging
             log_level: set logging level for parser
+            dialect: use slim grammar only with base SQL & statements of this dialect, for example, 'psql'.
+                            By default (None) parser uses grammar with statements of all dialects.
+            fast_path: parse simple CREATE TABLE statements (columns with type, size, NULL/NOT NULL, DEFAULT
+                            & PRIMARY KEY) without lexer & grammar, all other statements are parsed as usual.
+                            How many statements were parsed by fast path is in 'fast_path_stats'.
+            include_kinds: kinds of entities to parse (as keys of group_by_type output), for example, {'tables'}.
+                            Statements of other kinds are found by their header & skipped before lexer,
+                            how many were skipped of each kind is in 'skipped_statements'.
+                            ALTER TABLE & INDEX statements are parsed with 'tables'. By default all are parsed.
+            encoding: encoding of memory-mapped file that passed as fileobj, by default - locale encoding,
+                            same as open() uses.
         """
         self.tables = []
         self.silent = not debug if debug else silent
-        self.data = content.encode("unicode_escape")
+        self.data = content
         self.paren_count = 0
         self.normalize_names = normalize_names
+        self.dialect = dialect
+        self.fast_path = fast_path
+        unknown_kinds = set(include_kinds or ()) - set(entity_kinds)
+        if unknown_kinds:
+            raise ValueError(f"Unknown kinds {sorted(unknown_kinds)}, possible variants: {entity_kinds}")
+        self.include_kinds = None if include_kinds is None else set(include_kinds)
+        self.reset_stats()
+        self.encoding = encoding or locale.getpreferredencoding(False)
         set_logging_config(log_level, log_file)
         log = logging.getLogger()
-        self.lexer = lex.lex(object=self, debug=False, debuglog=log)
-        self.yacc = yacc.yacc(module=self, debug=False, debuglog=log)
+        # lexer & parser tables are built once per process, instance only binds own methods to them
+        grammar = get_grammar(type(self), log)
+        self.lexer = grammar.bind_lexer(self)
+        self.lexer_flags = LexerFlags()
+        self.yacc = grammar.bind_parser(self)
         self.columns_closed = False
         self.statement = None
-        self.block_comments = []
-        self.comments = []
+        # lines of current statement, joined only when statement is complete
+        self.statement_lines: List[str] = []
+        # IDs, names & types of columns of one parse (see INTERNED_LIMIT): equal strings share one object
+        self.interned: Dict[str, str] = {}
 
-    def catch_comment_or_process_line(self, code_line: str) -> str:
+    def reset_stats(self) -> None:
+        """comments & counters of one parse, they are collected from scratch in each run, iter_parse & tokenize"""
+        self.comments = []
+        self.fast_path_stats = {"hits": 0, "misses": 0}
+        self.skipped_statements: Dict[str, int] = {}
+        # size of data sections of dumps (INSERT, COPY ... FROM stdin, LOCK TABLES) that were skipped
+        # without parsing & size of data that went to the parser
+        self.data_sections_stats = {"skipped": 0, "parsed": 0}
+        # kind & name of procedural bodies (functions, procedures, triggers, packages) skipped without parsing
+        self.procedural_bodies: List[Dict] = []
+
+    def pre_process_line(self) -> None:
+        if "," in self.line:
+            self.line = COMMA_ONLY_STR.sub("_ddl_parser_comma_only_str", self.line)
+        self.line = self.strip_comments(self.line)
+
+    def strip_comments(self, line: str) -> str:
+        """
+        get useful code of line & put comments to self.comments: text after '--', text of line after the first '/*'
+        & each line of multi-line block comment, if comment is started at the start of line.
+        lines that are comments as whole ('--' or '#' at the start) are dropped.
+        comment markers inside quotes are not comments, block comment state is kept between lines
+        """
+        pos = 0
+        block_comment = None
         if self.multi_line_comment:
-            self.comments.append(self.line)
-            if CL_COM in self.line:
-                self.multi_line_comment = False
-            return ''
-
-        elif not (
-            self.line.strip().startswith(MYSQL_COM)
-            or self.line.strip().startswith(IN_COM)
-        ):
-            return self.process_inline_comments(code_line)
-        return code_line
-
-    def pre_process_line(self) -> Tuple[str, List]:
-        code_line = ""
-        comma_only_str = r"((\')|(' ))+(,)((\')|( '))+\B"
-        self.line = re.sub(comma_only_str, "_ddl_parser_comma_only_str", self.line)
-        code_line = self.catch_comment_or_process_line(code_line)
-        if self.line.startswith(OP_COM) and CL_COM not in self.line:
-            self.multi_line_comment = True
-        elif self.line.startswith(CL_COM):
+            end = line.find(CL_COM)
+            if self.comment_lines:
+                self.comments.append(line)
+            else:
+                # inside block comment started in the middle of line only opened comments are comments
+                block_comment = line.find(OP_COM, 0, end if end >= 0 else len(line))
+            if end < 0:
+                self.add_block_comment(line, block_comment)
+                return ""
             self.multi_line_comment = False
-        self.line = code_line
-
-    def process_in_comment(self, line: str) -> str:
-        if re.search(r"((\")|(\'))+(.)*(--)+(.)*((\")|(\'))+", line):
-            code_line = line
-        else:
-            splitted_line = line.split(IN_COM)
-            code_line = splitted_line[0]
-            self.comments.append(splitted_line[1])
-        return code_line
-
-    def process_line_before_comment(self) -> str:
-        """ get useful codeline - remove comment """
-        code_line = ""
-        if IN_COM in self.line:
-            code_line = self.process_in_comment(self.line)
-        elif CL_COM not in self.line and OP_COM not in self.line:
-            code_line = self.line
-        return code_line
-
-    def process_inline_comments(self, code_line: str) -> Tuple[str, List]:
-        """ this method сatches comments like "create table ( # some comment" - inline this statement"""
-        comment = None
-        code_line = self.process_line_before_comment()
-        if OP_COM in self.line:
-            splitted_line = self.line.split(OP_COM)
-            code_line += splitted_line[0]
-            comment = splitted_line[1]
-            self.block_comments.append(OP_COM)
-        if CL_COM in code_line and self.block_comments:
-            splitted_line = self.line.split(CL_COM)
-            self.block_comments.pop(-1)
-            code_line += splitted_line[1]
-            comment = splitted_line[0]
-
+            pos = end + len(CL_COM)
+        elif line.lstrip().startswith((MYSQL_COM, IN_COM)):
+            return ""
+        code = []
+        while pos < len(line):
+            end = CODE.match(line, pos).end()
+            code.append(line[pos:end])
+            if line.startswith(IN_COM, end):
+                comment = line[end + len(IN_COM):]
+                if comment:
+                    self.comments.append(comment)
+                pos = len(line)
+            elif line.startswith(OP_COM, end):
+                if block_comment is None or block_comment < 0:
+                    block_comment = end
+                close = line.find(CL_COM, end + len(OP_COM))
+                self.multi_line_comment = close < 0
+                self.comment_lines = end == 0
+                pos = len(line) if close < 0 else close + len(CL_COM)
+            else:
+                # quote that is not closed till the end of line
+                code.append(line[end:])
+                break
+        self.add_block_comment(line, block_comment)
+        return "".join(code)
+
+    def add_block_comment(self, line: str, start: Optional[int]) -> None:
+        """text of line after '/*' till the end of line or the next '/*'"""
+        if start is None or start < 0:
+            return
+        comment = line[start + len(OP_COM):].split(OP_COM)[0]
         if comment:
             self.comments.append(comment)
-        return code_line
 
     def process_regex_input(self, data):
         regex = data.split('"input.regex"')[1].split("=")[1]
@@ -165,27 +258,12 @@ class Parser:
         self.lexer.state = {"lexer_state_regex": regex}
         return data
 
-    def pre_process_data(self, data):
-        data = data.decode("utf-8")
+    def pre_process_data(self, data: str) -> str:
         # todo: not sure how to workaround ',' normal way
         if "input.regex" in data:
             data = self.process_regex_input(data)
 
-        data = (
-            data.replace(",", " , ")
-            .replace("(", " ( ")
-            .replace(")", " ) ")
-            .replace("\\x", "\\0")
-            .replace("‘", "'")
-            .replace("’", "'")
-            .replace("\\u2018", "'")
-            .replace("\\u2019", "'")
-            .replace("'\\t'", "'pars_m_t'")
-            .replace("'\\n'", "'pars_m_n'")
-            .replace("\\'", "pars_m_single")
-            .replace("\\t", " ")
-        )
-        return data
+        return pre_process(data)
 
     def process_set(self) -> None:
         self.set_line = self.set_line.split()
@@ -194,6 +272,9 @@ class Parser:
         else:
             name = self.set_line[-2]
         value = self.set_line[-1].replace(";", "")
+        if self.include_kinds is not None and "ddl_properties" not in self.include_kinds:
+            self.count_skipped("ddl_properties")
+            return
         self.tables.append({"name": name, "value": value})
 
     def parse_set_statement(self):
@@ -213,7 +294,7 @@ class Parser:
 
     def check_new_statement_start(self, line: str) -> bool:
         self.new_statement = False
-        if self.statement and self.statement.count("(") == self.statement.count(")"):
+        if self.statement_lines and self.paren_count == 0:
             new_statements_tokens = ["ALTER ", "CREATE ", "DROP ", "SET "]
             for key in new_statements_tokens:
                 if line.upper().startswith(key):
@@ -237,32 +318,143 @@ class Parser:
             and not self.set_was_in_line
             and not self.new_statement
         ):
-            if self.statement is None:
-                self.statement = self.line
-            else:
-                self.statement += f" {self.line}"
+            self.statement_lines.append(self.line)
+            self.paren_count += self.line.count("(") - self.line.count(")")
 
-    def parse_data(self) -> List[Dict]:
+    def parse_data(self, fileobj: Optional[Source] = None, table_filter: Optional[TableFilter] = None) -> List[Dict]:
+        self.tables = list(self.iter_parse_data(fileobj, table_filter))
+        return self.tables
+
+    def read_source(self, fileobj: Optional[Source] = None) -> Iterable[str]:
+        """chunks of ddl: content of parser, file object read part by part or memory-mapped file"""
+        if fileobj is None:
+            return [self.data]
+        if isinstance(fileobj, mmap.mmap):
+            return read_mapped_chunks(fileobj, self.encoding)
+        return read_chunks(fileobj)
+
+    def iter_parse_data(
+        self, fileobj: Optional[Source] = None, table_filter: Optional[TableFilter] = None
+    ) -> Iterator[Dict]:
+        """parse content of parser or file object (read part by part) & yield items of parser output"""
         self.tables: List[Dict] = []
-        data = self.pre_process_data(self.data)
-        lines = data.replace("\\t", "").split("\\n")
+        self.interned = {}
+        for self.statement in self.split_statements(self.read_source(fileobj)):
+            if (self.include_kinds is not None or table_filter) and not self.statement_is_included(table_filter):
+                continue
+            self.set_default_flags_in_lexer()
+            self.parse_statement()
+            # parsed statement & SET statements before it
+            parsed, self.tables = self.tables, []
+            yield from parsed
+            if len(self.interned) > INTERNED_LIMIT:
+                self.interned = {}
+        yield from self.tables
+        self.tables = []
+        self.interned = {}
+        if self.fast_path:
+            logging.getLogger().debug(
+                "fast path parsed %(hits)d statements, %(misses)d were parsed by grammar", self.fast_path_stats
+            )
+        if self.data_sections_stats["skipped"]:
+            logging.getLogger().debug(
+                "skipped %(skipped)d symbols of data sections, %(parsed)d symbols were parsed", self.data_sections_stats
+            )
+        if self.comments:
+            yield {"comments": self.comments}
 
+    def tokenize(self, text: Optional[str] = None) -> TokenArrays:
+        """
+        run only the lexer (without parser) on each statement of ddl & get all tokens as compact arrays.
+        text: ddl to tokenize, by default content of parser is used
+        """
+        self.tables = []
+        self.interned = {}
+        tokens = TokenArrays(sorted(self.lexer.lextokens))
+        type_ids, type_id = tokens.type_ids, tokens.type_id
+        add_type, add_value, add_position = tokens.types.append, tokens.values.append, tokens.positions.append
+        for self.statement in self.split_statements([self.data if text is None else text]):
+            tokens.statement_starts.append(len(tokens.types))
+            tokens.statements.append(self.statement)
+            self.set_default_flags_in_lexer()
+            self.lexer.input(self.statement)
+            for token in iter(self.lexer.token, None):
+                add_type(type_ids[token.type] if token.type in type_ids else type_id(token.type))
+                add_value(token.value)
+                add_position(token.lexpos)
+        self.interned = {}
+        return tokens
+
+    def intern(self, value: str) -> str:
+        """the same object for equal strings in one parse"""
+        return self.interned.setdefault(value, value)
+
+    def iter_statements(self, fileobj: Source) -> Iterator[str]:
+        """
+        read ddl from file object part by part & yield each statement (as it goes to the lexer)
+        as soon as it is complete, so the whole data is never kept in memory.
+        SET statements & comments are collected in self.tables & self.comments as in run()
+        """
+        return self.split_statements(self.read_source(fileobj))
+
+    def split_statements(self, chunks: Iterable[str]) -> Iterator[str]:
+        """complete statements from chunks of data, each chunk (except the last one) must end with new line"""
+        self.reset_stats()
         self.set_line: Optional[str] = None
 
         self.set_was_in_line: bool = False
 
         self.multi_line_comment = False
-
+        # lines of block comment go to comments, if it is started at the start of line
+        self.comment_lines = False
+
+        tail = ""
+        chunks = ProceduralBodies(self.procedural_bodies).cut(chunks)
+        for chunk in skip_data_sections(chunks, self.data_sections_stats, self.dialect == "mysql"):
+            data = tail + self.pre_process_data(chunk)
+            end = data.rfind("\n")
+            tail = data[end + 1:]
+            if end >= 0:
+                yield from self.split_lines(data[:end])
+        self.line = tail
+        statement = self.process_line(False)
+        if statement:
+            yield statement
+
+    def split_lines(self, data: str) -> Iterator[str]:
+        """
+        complete statements from lines of data: only lines found by statement_lines go through process_line,
+        lines between them are added to the statement at once
+        """
+        start = 0
+        for line_start in statement_lines(data):
+            yield from self.process_plain_lines(data[start:line_start].split("\n")[:-1])
+            end = data.find("\n", line_start)
+            start = end + 1 if end >= 0 else len(data) + 1
+            self.line = data[line_start: start - 1]
+            statement = self.process_line(True)
+            if statement:
+                yield statement
+        if start <= len(data):
+            yield from self.process_plain_lines(data[start:].split("\n"))
+
+    def process_plain_lines(self, lines: List[str]) -> Iterator[str]:
         for num, self.line in enumerate(lines):
-            self.process_line(num != len(lines) - 1)
-        if self.comments:
-            self.tables.append({"comments": self.comments})
-        return self.tables
+            if not (self.multi_line_comment or self.set_line or self.set_was_in_line):
+                # nothing to catch in these lines - same as add_line_to_statement for each one
+                plain = lines[num:]
+                self.statement_lines.extend(filter(None, map(str.strip, plain)))
+                text = "".join(plain)
+                self.paren_count += text.count("(") - text.count(")")
+                return
+            statement = self.process_line(True)
+            if statement:
+                yield statement
 
     def process_line(
         self,
         last_line: bool,
-    ) -> Tuple[Optional[str], bool]:
+    ) -> Optional[str]:
         self.pre_process_line()
 
         self.line = self.line.strip().replace("\n", "").replace("\t", "")
@@ -275,49 +467,81 @@ class Parser:
         final_line = self.line.endswith(";") and not self.set_was_in_line
         self.add_line_to_statement()
 
-        if (final_line or self.new_statement) and self.statement:
+        if (final_line or self.new_statement) and self.statement_lines:
             # end of sql operation, remove ; from end of line
-            self.statement = self.statement[:-1]
+            self.statement_lines[-1] = self.statement_lines[-1][:-1]
         elif last_line and not self.skip:
             # continue combine lines in one massive
-            return
-
-        self.set_default_flags_in_lexer()
+            return None
 
-        self.process_statement()
+        return self.process_statement()
 
-    def process_statement(self) -> None:
-
-        if not self.set_line and self.statement:
-            self.parse_statement()
+    def process_statement(self) -> Optional[str]:
+        statement = None
+        if not self.set_line:
+            statement = " ".join(self.statement_lines) or None
+        self.statement_lines = []
+        self.paren_count = 0
         if self.new_statement:
-            self.statement = self.line
-        else:
-            self.statement = None
+            self.statement_lines.append(self.line)
+            self.paren_count = self.line.count("(") - self.line.count(")")
+        return statement
+
+    def statement_is_included(self, table_filter: Optional[TableFilter] = None) -> bool:
+        kind = statement_kind(self.statement)
+        # statement of unknown kind is parsed
+        if kind is None:
+            return True
+        included = self.include_kinds is None or kind in self.include_kinds
+        if included and kind == "tables" and table_filter:
+            # ALTER & INDEX statements are filtered by name of their table, same as CREATE TABLE
+            included = table_filter.match(statement_table(self.statement))
+        if not included:
+            self.count_skipped(kind)
+        return included
+
+    def count_skipped(self, kind: str) -> None:
+        self.skipped_statements[kind] = self.skipped_statements.get(kind, 0) + 1
+
+    def fast_path_hit_rate(self) -> Optional[float]:
+        """share of statements parsed by fast path, None if fast path was not used"""
+        statements = self.fast_path_stats["hits"] + self.fast_path_stats["misses"]
+        return self.fast_path_stats["hits"] / statements if statements else None
 
     def parse_statement(self) -> None:
-
-        _parse_result = yacc.parse(self.statement)
+        _parse_result = None
+        if self.fast_path:
+            _parse_result = parse_simple_create_table(self.statement, self.intern)
+            self.fast_path_stats["hits" if _parse_result else "misses"] += 1
+        if _parse_result is None:
+            _parse_result = self.yacc.parse(self.statement, lexer=self.lexer)
         if _parse_result:
             self.tables.append(_parse_result)
 
     def set_default_flags_in_lexer(self) -> None:
-        attrs = [
-            "is_table",
-            "sequence",
-            "last_token",
-            "columns_def",
-            "after_columns",
-            "check",
-            "is_table",
-            "last_par",
-            "lp_open",
-            "is_alter",
-            "is_like",
-        ]
-        for attr in attrs:
-            setattr(self.lexer, attr, False)
-        self.lexer.lt_open = 0
+        self.lexer_flags = LexerFlags()
+
+    def iter_parse(
+        self,
+        fileobj: Optional[Source] = None,
+        *,
+        output_mode: str = "sql",
+        lookahead: Optional[int] = 0,
+        include_tables: Optional[Iterable[Union[str, Pattern]]] = None,
+        exclude_tables: Optional[Iterable[Union[str, Pattern]]] = None,
+    ) -> Iterator[Dict]:
+        """
+        parse ddl & yield each entity (table, sequence, type & etc) as soon as it is parsed, in the same format as run()
+
+        fileobj: file object (or mmap) to read ddl from part by part, by default content of parser is parsed
+        output_mode: same as in run()
+        lookahead: number of next statements to wait before yield the table, ALTER & INDEX statements
+            to the table in them are added to the table as in run(). ALTER & INDEX statements to already
+            yielded table are yielded as separate items. None - hold all entities till the end of ddl.
+        include_tables, exclude_tables: same as in run()
+        """
+        table_filter = table_filter_of(include_tables, exclude_tables)
+        return iter_result_format(self.iter_parse_data(fileobj, table_filter), output_mode, lookahead)
 
     def run(
         self,
@@ -328,6 +552,9 @@ class Parser:
         output_mode: str = "sql",
         group_by_type: bool = False,
         json_dump=False,
+        fileobj: Optional[Source] = None,
+        include_tables: Optional[Iterable[Union[str, Pattern]]] = None,
+        exclude_tables: Optional[Iterable[Union[str, Pattern]]] = None,
     ) -> List[Dict]:
         """
         dump: provide 'True' if you need to dump output in file
@@ -341,8 +568,13 @@ class Parser:
                 'sequences', 'types', 'domains']
             and each dict will contain list of parsed entities. Without it output is a List with Dicts where each
             Dict == one entity from ddl - one table or sequence or type.
+        fileobj: file object (or mmap) to read ddl from part by part instead of content of parser
+        include_tables: patterns of tables to parse - globs like 'sales.*' (case-insensitive) or compiled regexes,
+            they are matched with 'schema.table' ('table' if schema is not set). Name is taken from header of
+            statement, so other CREATE TABLE statements & ALTER / INDEX statements to them are skipped before lexer.
+        exclude_tables: patterns of tables to skip, in the same format as include_tables
         """
-        self.tables = self.parse_data()
+        self.tables = self.parse_data(fileobj, table_filter_of(include_tables, exclude_tables))
         self.tables = result_format(self.tables, output_mode, group_by_type)
         if dump:
             if file_path:
@@ -1,404 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'ADD ALTER ARRAY AS AUTOINCREMENT BY CACHE CHECK CLONE CLUSTER CLUSTERED COLLATE COLLECTION COMMA COMMAT COMMENT CONSTRAINT CREATE DATABASE DEFAULT DEFERRABLE DELETE DOMAIN DOT DQ_STRING DROP ENCODE ENCRYPT ENFORCED EXISTS FOR FOREIGN FORMAT GENERATED ID IF INCREMENT INDEX INHERITS INITIALLY INTO ITEMS KEY KEYS LIKE LOCATION LP LT MAP MAXVALUE MINVALUE NO NOT NULL ON OPTIONS OR PARTITION PARTITIONED PRIMARY REFERENCES REPLACE ROW RP RT SALT SCHEMA SEQUENCE SERDE SERDEPROPERTIES SKEWED START STORAGE STORED STRING TABLE TABLESPACE TBLPROPERTIES TERMINATED TEXTIMAGE_ON TRUNCATE TYPE UNIQUE UPDATE USING WITHexpr : expr multiple_optionsexpr : expr id LP id RPexpr : expr usingexpr : expr INDEX id id\n        expr : expr LOCATION STRING\n        | expr LOCATION DQ_STRINGpkey_constraint : constraint pkey_statement id LP index_pid RP\n        | constraint pkey_statement LP index_pid RP\n        | pkey_constraint with\n        | pkey_constraint with ON id\n        on_update : ON UPDATE id\n        | ON UPDATE STRING\n        | ON UPDATE f_call\n        encrypt : ENCRYPT\n        | encrypt NO SALT\n        | encrypt SALT\n        | encrypt USING STRING\n        | encrypt STRING\n        clone : CLONE idexpr : expr INHERITS LP t_name RP\n        multiple_options : options\n        | multiple_options options\n        using : USING idencode : ENCODE idexpr : expr CLUSTER BY LP pid RP\n        | expr CLUSTER BY pid\n        expr : expr ID ON LP pid RP\n        | expr ID by_smthgexpr : expr PARTITION BY LP pid RP\n        | expr PARTITION BY id LP pid RP\n        | expr PARTITION BY pid\n        | expr PARTITION BY id pidexpr : expr id id\n        | expr id KEY\n        options : OPTIONS LP id_equals RPexpr : expr option_comment\n        expr : expr INTO ID IDwith : WITH with_argsexpr : expr id id LP pid RPoption_comment : ID STRING\n        | ID DQ_STRING\n        | COMMENT ID STRING\n        | COMMENT ID DQ_STRING\n        row_format : ROW FORMAT SERDE\n        | ROW FORMAT\n        expr : expr database_baseequals : id id id\n        | id id ON\n        | id id id DOT id\n        storage : STORAGE LP\n        | storage id id\n        | storage id id RP\n        expr : expr row_format id\n        | expr row_format STRING\n        database_base : CREATE DATABASE id\n        | CREATE ID DATABASE id\n        | database_base clone\n        with_args : LP equals\n        | with_args COMMA equals\n        | with_args with_args\n        | with_args RP\n        expr : expr storageexpr : expr WITH SERDEPROPERTIES multi_assigmentsexpr : expr ID INDEXexpr : expr TBLPROPERTIES multi_assigmentsperiod_for : id FOR id LP pid RPmulti_assigments : LP assigment\n        | multi_assigments RP\n        | multi_assigments COMMA assigmentexpr : expr ON idexpr : expr withassigment : id id id\n        |  STRING id STRING\n        |  id id STRING\n        |  STRING id id\n        |  STRING idexpr : expr TEXTIMAGE_ON idexpr : CREATE TABLESPACE id properties\n        | CREATE id TABLESPACE id properties\n        | CREATE id TABLESPACE id\n        | CREATE TABLESPACE id\n        | CREATE id id TABLESPACE id\n        | CREATE id id TABLESPACE id properties\n        expr : expr COMMENT STRINGexpr : expr id TERMINATED BY id\n        | expr id TERMINATED BY STRING\n        properties : property\n        | properties propertyexpr : expr MAP KEYS TERMINATED BY id\n        | expr MAP KEYS TERMINATED BY STRING\n        property : id id\n        | id STRING\n        | id ON\n        | id STORAGE\n        | id ROW\n        expr : expr SKEWED BY LP id RP ON LP pid RPexpr : expr COLLECTION ITEMS TERMINATED BY id\n        | expr COLLECTION ITEMS TERMINATED BY STRING\n        expr : expr STORED AS id\n        |  expr STORED AS id STRING\n        |  expr STORED AS id STRING id STRING\n        create_table : CREATE TABLE IF NOT EXISTS\n        | CREATE TABLE\n        | CREATE OR REPLACE TABLE IF NOT EXISTS\n        | CREATE OR REPLACE TABLE\n        | CREATE id TABLE IF NOT EXISTS\n        | CREATE id TABLE\n        | CREATE OR REPLACE id TABLE IF NOT EXISTS\n        | CREATE OR REPLACE id TABLE\n\n        expr : expr PARTITIONED BY pid_with_type\n        | expr PARTITIONED BY LP pid RP\n        | expr PARTITIONED BY LP multiple_funct RP\n        pid_with_type :  LP column\n        | pid_with_type COMMA column\n        | pid_with_type RP\n        c_property : id idc_type : id\n        | id id\n        | id id id id\n        | id id id\n        | c_type pid\n        | id DOT id\n        | tid\n        | ARRAY\n        | c_type ARRAY\n        | c_type tid\n        id : ID\n        | DQ_STRINGid_or_string : id\n        | STRINGcolumn : id c_type\n        | column comment\n        | column LP id RP\n        | column LP id id RP\n        | column LP id RP c_type\n        | column LP id COMMA id RP\n        | column LP id COMMA id RP c_type\n         autoincrement : AUTOINCREMENTdefcolumn : column\n        | defcolumn comment\n        | defcolumn null\n        | defcolumn encode\n        | defcolumn PRIMARY KEY\n        | defcolumn UNIQUE KEY\n        | defcolumn UNIQUE\n        | defcolumn check_ex\n        | defcolumn default\n        | defcolumn collate\n        | defcolumn enforced\n        | defcolumn ref\n        | defcolumn foreign ref\n        | defcolumn encrypt\n        | defcolumn generated\n        | defcolumn c_property\n        | defcolumn on_update\n        | defcolumn options\n        | defcolumn autoincrement\n        check_ex :  check_st\n        | constraint check_st\n        expr : create_schema\n        | create_database\n        | expr id\n        | expr clone\n        c_schema : CREATE SCHEMA\n        | CREATE ID SCHEMAcreate_schema : c_schema id id\n        | c_schema id id id\n        | c_schema id\n        | c_schema id DOT id\n        | c_schema id option_comment\n        | c_schema id DOT id option_comment\n        | c_schema IF NOT EXISTS id\n        | c_schema IF NOT EXISTS id DOT id\n        | create_schema id id id\n        | create_schema id id STRING\n        | create_schema options\n        create_database : database_base\n        | create_database id id id\n        | create_database id id STRING\n        | create_database options\n        expr : DROP TABLE id\n        | DROP TABLE id DOT id\n        multiple_column_names : column\n        | multiple_column_names COMMA\n        | multiple_column_names column\n        type_definition : type_name id LP pid RP\n        | type_name id LP multiple_column_names RP\n        | type_name LP id_equals RP\n        | type_name TABLE LP defcolumn\n        | type_definition COMMA defcolumn\n        | type_definition RP\n        expr : type_definitiontype_name : type_create id AS\n        | type_create id DOT id AS\n        | type_create id DOT id\n        | type_create id\n        type_create : CREATE TYPE\n        | CREATE OR REPLACE TYPE\n        expr : domain_name id LP pid RPdomain_name : CREATE DOMAIN id AS\n        | CREATE DOMAIN id DOT id AS\n        | CREATE DOMAIN id DOT id\n        | CREATE DOMAIN id\n        id_equals : id id id_or_string\n        | id id_or_string\n        | id_equals COMMA\n        | id_equals COMMA id id id_or_string\n        | id\n        | id_equals LP pid RP\n        | id_equals LP pid RP id\n        | id_equals COMMA id id\n        | id_equals COMMA id\n        expr : index_table_name LP index_pid RPindex_table_name : create_index ON id\n        | create_index ON id DOT id\n        create_index : CREATE INDEX id\n        | CREATE UNIQUE INDEX id\n        | create_index ON id\n        | CREATE CLUSTERED INDEX id\n        expr : table_name defcolumn\n        | table_name LP defcolumn\n        | table_name\n        | expr COMMA defcolumn\n        | expr COMMA\n        | expr COMMA constraint\n        | expr COMMA check_ex\n        | expr COMMA foreign\n        | expr COMMA pkey\n        | expr COMMA uniq\n        | expr COMMA statem_by_id\n        | expr COMMA constraint uniq\n        | expr COMMA period_for\n        | expr COMMA pkey_constraint\n        | expr COMMA constraint pkey\n        | expr COMMA constraint pkey enforced\n        | expr COMMA constraint foreign ref\n        | expr COMMA foreign ref\n        | expr encode\n        | expr DEFAULT id id id\n        | expr RP\n        likke : LIKE\n        | CLONE\n        expr : table_name likke id\n        | table_name likke id DOT id\n        | table_name LP likke id DOT id RP\n        | table_name LP likke id RP\n        t_name : id DOT id\n        | id\n        | id DOT id DOT id\n        table_name : create_table t_name\n        | table_name likke id\n        expr : seq_name\n        | expr INCREMENT id\n        | expr INCREMENT id id\n        | expr START id\n        | expr START id id\n        | expr MINVALUE id\n        | expr NO MINVALUE\n        | expr NO MAXVALUE\n        | expr MAXVALUE id\n        | expr CACHE id\n        | expr CACHE\n        seq_name : create_seq id DOT id\n        | create_seq id\n        create_seq : CREATE SEQUENCE IF NOT EXISTS\n        | CREATE SEQUENCE\n\n        tid : LT id\n        | LT\n        | tid LT\n        | tid id\n        | tid COMMAT\n        | tid RT\n        null : NULL\n        | NOT NULL\n        f_call : id LP RP\n        | id LP f_call RP\n        | id LP multi_id RP\n        | id LP pid RP\n        multi_id : id\n        | multi_id id\n        | f_call\n        | multi_id f_call\n        funct_args : LP multi_id RPfunct : id LP multi_id RPmultiple_funct : funct\n        | multiple_funct COMMA funct\n        | multiple_funct COMMA\n        funct_expr : LP multi_id RP\n        | multi_id\n        dot_id : id DOT iddefault : DEFAULT id\n        | DEFAULT STRING\n        | DEFAULT NULL\n        | default FOR dot_id\n        | DEFAULT funct_expr\n        | DEFAULT LP pid RP\n        | DEFAULT LP funct_expr pid RP\n        | default id\n        | default LP RP\n        enforced : ENFORCED\n        | NOT ENFORCED\n        collate : COLLATE id\n        | COLLATE STRING\n        \n        constraint : CONSTRAINT id\n        \n        generated : gen_always funct_expr\n        | gen_always funct_expr id\n        | gen_always LP multi_id RP\n        | gen_always f_call\n        \n        gen_always : GENERATED id AS\n        check_st : CHECK LP id\n        | check_st id\n        | check_st STRING\n        | check_st id STRING\n        | check_st id RP\n        | check_st STRING RP\n        | check_st funct_args\n        | check_st LP pid RP\n        using_tablespace : USING INDEX tablespaceexpr : alter_foreign ref\n        | alter_check\n        | alter_unique\n        | alter_default\n        | alter_primary_key\n        | alter_primary_key using_tablespace\n        alter_primary_key : alt_table PRIMARY KEY LP pid RP\n        | alt_table constraint PRIMARY KEY LP pid RP\n        alter_unique : alt_table UNIQUE LP pid RP\n        | alt_table constraint UNIQUE LP pid RP\n        alter_default : alt_table id id\n        | alt_table constraint id id\n        | alt_table id STRING\n        | alt_table constraint id STRING\n        | alter_default id\n        | alter_default FOR pid\n        pid :  id\n        | STRING\n        | pid id\n        | pid STRING\n        | STRING LP RP\n        | id LP RP\n        | pid COMMA id\n        | pid COMMA STRING\n        alter_check : alt_table check_st\n        | alt_table constraint check_st\n        index_pid :  id\n        | index_pid id\n        | index_pid COMMA index_pid\n        alter_foreign : alt_table foreign\n        | alt_table constraint foreign\n        alt_table : ALTER TABLE t_name ADD\n        | ALTER TABLE IF EXISTS t_name ADD\n        | ALTER TABLE ID t_name ADDforeign : FOREIGN KEY LP pid RP\n        | FOREIGN KEYref : REFERENCES t_name\n        | ref LP pid RP\n        | ref ON DELETE id\n        | ref ON UPDATE id\n        | ref DEFERRABLE INITIALLY id\n        | ref NOT DEFERRABLE\n        expr : pkeyuniq : UNIQUE LP pid RPstatem_by_id : id LP pid RP\n        | id KEY LP pid RP\n        pkey : pkey_statement LP pid RP\n        | pkey_statement ID LP pid RP\n        pkey_statement : PRIMARY KEYcomment : COMMENT STRINGtablespace : TABLESPACE id\n        | TABLESPACE id properties\n        expr : expr tablespaceby_smthg : BY id\n        | BY ROW\n        | BY LP pid RP\n        '
-    
-_lr_action_items = {'CREATE':([0,1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[3,68,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'DROP':([0,],[6,]),'ALTER':([0,],[27,]),'PRIMARY':([0,23,34,56,91,99,103,119,122,170,171,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,295,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,469,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,589,628,633,635,636,638,639,640,645,651,665,667,668,669,670,672,685,],[24,126,-128,24,-127,222,-139,-248,285,222,24,-158,-24,222,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,222,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-304,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,222,-247,-313,-314,-315,-310,-350,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-352,-275,-296,-288,-288,-119,-134,-135,-249,-351,-290,-276,-277,-278,-297,-136,-137,]),'$end':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[0,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'INDEX':([1,2,3,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,83,84,90,91,93,96,99,103,106,108,110,111,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[32,-177,82,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,147,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,207,208,-176,-127,-180,-191,-220,-139,-319,-333,-324,267,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'LOCATION':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[33,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'INHERITS':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[35,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'CLUSTER':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[36,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'ID':([1,2,3,4,5,7,8,10,11,12,14,15,16,17,18,19,21,22,23,25,26,28,29,30,31,32,34,37,38,40,41,42,43,44,47,48,49,55,56,57,58,59,60,61,63,64,65,66,67,68,71,72,73,75,76,77,78,79,80,81,82,85,87,88,89,90,91,92,93,94,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,112,115,117,118,119,120,122,123,125,128,130,131,133,134,135,136,137,138,140,141,142,143,144,146,147,148,149,150,151,152,153,154,155,156,158,159,160,161,162,163,168,170,171,172,173,174,175,176,177,178,180,181,182,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,200,201,202,203,204,205,207,208,210,212,213,214,215,216,217,218,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,239,241,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,263,264,265,266,268,269,270,271,272,274,276,277,279,280,282,284,286,287,288,289,290,291,292,294,295,296,297,298,299,300,303,304,306,307,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,334,336,337,338,339,340,342,343,344,345,347,348,350,351,352,353,354,355,356,357,359,360,361,363,364,365,369,371,373,374,375,376,377,378,379,380,381,382,383,384,385,387,389,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,434,435,436,437,438,439,440,441,442,443,444,445,448,449,450,451,452,453,454,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,491,492,493,494,495,497,498,500,502,504,506,507,508,509,511,512,513,514,515,516,517,518,519,520,522,523,525,526,527,528,529,530,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,555,556,557,558,559,560,561,562,563,564,565,567,568,569,570,571,572,573,577,578,579,580,581,582,583,584,585,586,587,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,605,606,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,626,627,628,629,630,631,632,633,634,635,636,638,639,640,642,643,644,645,646,647,648,649,650,651,652,653,655,658,659,660,661,662,663,665,666,667,668,669,670,671,672,673,676,677,678,679,681,682,683,684,685,686,687,],[37,-177,80,91,91,-192,91,91,-361,-252,-320,-321,91,-323,91,91,91,91,91,132,91,-1,91,-240,-3,91,-128,-127,91,-36,153,-46,91,91,-71,91,164,-163,91,-238,91,91,91,91,91,91,-371,-21,91,191,91,91,91,-57,91,91,91,-164,-127,91,91,-103,-266,-197,91,-176,-127,91,-180,91,91,-191,91,91,91,91,91,-139,-241,-242,-319,91,-333,91,-324,271,91,91,-250,-248,-264,91,91,91,91,-367,91,-196,303,-22,-33,91,-34,91,-5,-6,91,91,-28,-64,-40,-41,91,-70,91,318,-53,-54,91,-38,91,-65,91,-77,-84,91,91,-225,-226,-227,-228,-229,-230,-232,-233,91,91,91,91,91,-257,-258,-259,-260,-261,-23,-45,-50,-19,-24,91,91,91,91,-107,-203,-165,91,-55,91,91,91,91,91,-181,91,91,91,-345,-140,-141,-142,-145,-146,91,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,91,91,91,-300,-14,91,-138,91,91,91,-243,91,91,91,-124,91,-132,91,91,-355,91,-335,-336,91,91,-170,-127,164,91,91,91,91,91,91,91,-311,-312,-316,91,91,-329,-331,-354,-304,91,91,91,-193,91,91,91,91,-4,91,91,91,-372,-373,91,91,91,91,-37,-51,-63,-60,91,-61,-58,91,-68,91,-67,91,91,-42,-43,91,-99,-110,91,-231,-234,91,505,-237,-9,91,91,91,91,-254,-256,-44,91,91,-87,91,91,91,-200,91,-56,-105,-198,-174,-175,-178,-179,91,91,-213,-346,91,-143,-144,91,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,91,91,-281,-302,-303,91,91,-279,91,-281,91,91,91,91,-125,91,-269,-270,-271,-272,-267,91,91,91,91,91,-360,-337,-338,91,-318,-167,566,91,91,91,91,-183,91,-188,91,91,91,91,-247,-263,91,-330,-332,-313,-314,-315,91,91,-279,91,91,91,-310,-365,91,-195,-350,91,91,-2,-85,-86,-20,91,91,91,91,91,91,-52,-59,91,-69,91,91,91,91,91,91,-115,91,-113,91,-235,-236,91,91,91,91,91,-239,-91,-92,-93,-94,-95,-88,-35,91,91,-202,-102,-109,-265,-182,-199,91,-294,-299,-15,-17,91,91,91,91,91,-280,-282,-11,-12,-13,-306,91,-279,-309,91,-246,-244,91,-122,91,91,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-184,-185,91,91,91,91,91,-317,-283,91,-327,91,91,-366,-194,-352,-39,-25,-27,-374,-29,91,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,91,91,91,91,-335,-10,-362,-363,91,91,91,-106,-201,91,-279,-275,-281,91,91,91,-296,91,-288,-288,-119,-134,91,91,91,91,-249,-328,91,-275,-325,-353,-351,-30,91,-101,91,91,-8,-364,91,-104,-290,91,-276,-277,-278,-297,-245,91,-173,-326,-49,91,91,-7,-66,-108,-275,91,91,-96,]),'PARTITION':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[39,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'INTO':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[41,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'WITH':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[45,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,346,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'TBLPROPERTIES':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[46,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'ON':([1,2,4,5,7,10,11,12,14,15,16,17,20,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,206,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,278,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,355,356,357,359,361,365,366,367,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,485,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,604,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[38,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,117,-1,-162,-240,-3,-128,145,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,244,-139,260,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,244,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-216,-181,244,-140,-141,-142,-145,-146,-147,-148,-149,260,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,244,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-218,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,260,506,-254,-256,514,-370,-87,-78,-80,-56,-217,-219,-174,-175,-178,-179,-213,-143,-144,-298,260,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,244,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,597,-69,-76,-100,-115,-113,-235,260,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,654,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'TEXTIMAGE_ON':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[48,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'COMMENT':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,441,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,571,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[49,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,236,236,-319,-333,-324,272,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,236,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,236,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,236,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,272,236,-188,236,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,236,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,236,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,236,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'MAP':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[50,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'SKEWED':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[51,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'COLLECTION':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[52,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'STORED':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[53,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'PARTITIONED':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[54,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'COMMA':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,217,218,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,275,276,282,286,287,288,291,292,294,295,297,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,358,359,361,365,373,374,375,376,378,379,380,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,423,424,428,429,430,434,435,436,438,439,440,441,443,444,445,446,447,448,450,451,453,454,456,457,458,459,461,462,465,466,467,472,473,474,475,476,477,478,479,480,482,483,484,486,488,492,494,495,496,497,498,499,500,502,507,508,511,512,513,514,515,516,517,518,519,520,527,528,529,530,532,533,534,537,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,570,571,572,573,574,575,578,580,581,583,584,585,586,590,591,592,593,594,595,596,597,598,599,600,601,602,603,605,606,608,609,610,611,614,615,616,617,618,619,621,627,628,631,633,634,635,636,638,639,640,643,644,645,646,647,648,649,650,652,655,656,659,660,661,662,665,667,668,669,670,671,672,673,674,675,676,677,680,681,682,684,685,686,687,],[56,-177,-160,-161,95,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,322,327,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,381,-345,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,431,-335,-336,-166,-170,-127,444,-208,-344,-311,-312,-316,-329,-331,-354,-304,431,-4,431,-372,-373,431,-335,-37,-51,327,322,-61,-58,-68,-67,-42,-43,-99,493,-231,-234,-159,-237,-9,-254,-256,-370,-87,444,-78,-80,-56,-174,-175,-178,-179,431,-213,-346,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,431,-125,-126,-269,-270,-271,-272,-267,556,431,-360,-337,-338,-318,-167,-169,-335,431,570,-183,-188,-206,-129,-205,-130,-189,-247,-263,-330,-332,-313,-314,-315,431,-335,431,-310,-365,431,431,-2,-85,-86,-20,431,431,431,431,431,-52,-59,-69,-76,-100,-115,431,611,-113,-335,-285,-235,-236,431,431,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,381,-294,-299,-15,-17,431,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-184,-185,431,-212,-129,-204,431,-317,-283,-327,431,431,-366,-39,-25,-27,-374,-29,431,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-287,381,-335,-10,-362,-363,431,-83,-335,-275,431,-296,431,-288,-288,-119,-134,-135,-209,-211,-249,-328,431,-340,-325,-353,-30,-101,-286,381,-8,-364,431,-290,-276,-277,-278,-297,-245,-136,-173,-210,-207,-326,-49,-284,-7,-66,-340,-137,431,-96,]),'DEFAULT':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[58,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,241,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,241,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,241,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,241,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,241,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'RP':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,217,218,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,275,276,282,286,287,288,291,292,294,295,297,305,307,308,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,358,359,361,365,373,374,375,376,378,379,380,382,383,385,386,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,411,413,415,416,417,418,419,420,421,422,423,424,428,429,430,432,433,434,435,436,438,439,440,441,443,444,445,446,447,448,450,451,453,454,456,457,458,459,460,461,462,465,466,467,472,473,474,475,476,477,478,479,480,481,482,483,484,486,488,490,492,494,495,496,497,498,499,500,502,507,508,511,512,513,514,515,516,517,518,519,520,527,528,529,530,532,533,534,535,537,539,540,541,542,543,544,545,546,547,550,551,552,553,554,555,557,558,559,560,561,562,563,564,565,567,568,569,570,571,572,573,574,575,578,580,581,582,583,584,585,586,590,591,592,593,594,595,596,597,598,599,600,601,602,603,605,606,608,609,610,611,612,614,615,616,617,618,619,621,627,628,629,630,631,632,633,634,635,636,637,638,639,640,641,643,644,645,646,647,648,649,650,652,655,656,658,659,660,661,662,665,666,667,668,669,670,671,672,673,674,675,676,677,680,681,682,684,685,686,687,],[30,-177,-160,-161,96,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,323,326,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,379,-345,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,443,-208,-344,457,458,-316,-329,-331,-354,-304,466,473,-4,476,-26,-372,-373,-31,-335,-37,483,326,323,-61,-58,-68,-67,-42,-43,-99,494,-231,-234,-159,-237,-9,-254,-256,-370,-87,518,-78,-80,-56,-174,-175,-178,-179,528,-213,-346,-143,-144,-298,532,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,550,-118,-121,-125,-126,-269,-270,-271,-272,-267,555,557,-360,-337,-338,563,564,-318,-167,-169,-335,568,569,-183,-188,-206,-129,-205,-130,-189,-247,-263,-330,-332,-313,-314,-315,580,581,-279,583,-310,-365,586,590,-2,-85,-86,-20,591,592,593,594,563,-32,-52,-59,-69,-76,604,-100,-115,609,610,-113,-335,-285,-235,-236,617,618,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-347,-294,-299,-15,-17,628,633,635,-280,-282,-11,-12,-13,-306,636,-279,-246,-244,-120,-122,639,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-184,-185,643,-212,-129,-204,646,-317,-283,648,-327,649,650,-366,-39,-25,-27,-374,-29,652,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-287,563,660,-335,-10,-362,-363,661,-83,-279,-275,667,668,669,635,-296,670,-288,-288,671,-119,-134,-135,672,-209,-211,-249,-328,676,-275,-325,-353,-30,-101,-286,680,681,-8,-364,682,-290,684,-276,-277,-278,-297,-245,-136,-173,-210,-207,-326,-49,-284,-7,-66,-275,-137,687,-96,]),'INCREMENT':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[59,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'START':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[60,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'MINVALUE':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,62,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[61,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,186,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'NO':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[62,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,388,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'MAXVALUE':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,62,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[63,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,187,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'CACHE':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[64,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'DQ_STRING':([1,2,3,4,5,7,8,10,11,12,14,15,16,17,18,19,21,22,23,26,28,29,30,31,32,33,34,37,38,40,42,43,44,47,48,55,56,57,58,59,60,61,63,64,65,66,67,71,72,73,75,76,77,78,79,80,81,82,85,87,88,89,90,91,92,93,94,95,96,98,99,100,101,102,103,104,105,106,107,108,109,110,112,115,117,118,119,120,122,123,125,128,130,131,133,134,135,136,137,138,140,141,142,143,144,146,147,148,149,150,151,152,154,155,156,158,159,160,161,162,163,164,168,170,171,172,173,174,175,176,177,178,180,181,182,183,184,185,186,187,188,189,190,192,193,194,195,196,197,198,200,201,202,203,204,205,207,208,210,212,213,214,215,216,217,218,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,239,241,242,243,245,246,247,248,249,250,251,252,253,254,255,256,257,258,259,263,264,265,266,268,269,270,271,274,276,277,279,280,282,284,286,287,288,289,290,291,292,294,295,296,297,298,299,300,303,304,306,307,309,310,311,312,313,314,315,316,317,318,319,320,321,322,323,324,325,326,327,328,329,330,331,332,334,336,337,338,339,340,342,343,344,345,347,348,350,351,352,353,354,355,356,357,359,360,361,363,364,365,369,371,373,374,375,376,377,378,379,380,381,382,383,384,385,387,389,391,392,393,394,395,396,397,398,399,400,401,402,403,404,405,406,407,408,409,412,413,414,415,416,417,418,419,420,421,422,423,424,425,426,427,428,429,430,431,434,435,436,437,438,439,440,441,442,443,444,445,448,449,450,451,452,453,454,456,457,458,459,460,461,462,463,464,465,466,467,468,469,470,472,473,474,475,476,477,478,479,480,481,482,483,484,485,486,487,488,489,491,492,493,494,495,497,498,500,502,504,506,507,508,509,511,512,513,514,515,516,517,518,519,520,522,523,525,526,527,528,529,530,532,533,534,535,536,537,538,539,540,541,542,543,544,545,546,547,548,549,550,551,552,553,555,556,557,558,559,560,561,562,563,564,565,566,567,568,569,570,571,572,573,577,578,579,580,581,582,583,584,585,586,587,589,590,591,592,593,594,595,596,597,598,599,600,601,602,603,605,606,608,609,610,611,612,613,614,615,616,617,618,619,620,621,622,623,626,627,628,629,630,631,632,633,634,635,636,638,639,640,642,643,644,645,646,647,648,649,650,651,652,653,655,658,659,660,661,662,663,665,666,667,668,669,670,671,672,673,676,677,678,679,681,682,683,684,685,686,687,],[34,-177,34,34,34,-192,34,34,-361,-252,-320,-321,34,-323,34,34,34,34,34,34,-1,34,-240,-3,34,142,-128,149,34,-36,-46,34,34,-71,34,-163,34,-238,34,34,34,34,34,34,-371,-21,34,34,34,34,-57,34,34,34,-164,-127,34,34,-103,-266,-197,34,-176,-127,34,-180,34,34,-191,34,34,34,34,34,-139,-241,-242,-319,34,-333,34,-324,34,34,34,-250,-248,-264,34,34,34,34,-367,34,-196,34,-22,-33,34,-34,34,-5,-6,34,34,-28,-64,-40,-41,34,-70,34,-53,-54,34,-38,34,-65,34,-77,-84,332,34,34,-225,-226,-227,-228,-229,-230,-232,-233,34,34,34,34,34,-257,-258,-259,-260,-261,-23,-45,-50,-19,-24,34,34,34,34,-107,-203,-165,34,-55,34,34,34,34,34,-181,34,34,34,-345,-140,-141,-142,-145,-146,34,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,34,34,34,-300,-14,34,-138,34,34,34,-243,34,34,34,-124,34,-132,34,34,-355,34,-335,-336,34,34,-170,149,34,34,34,34,34,34,34,-311,-312,-316,34,34,-329,-331,-354,-304,34,34,34,-193,34,34,34,34,-4,34,34,34,-372,-373,34,34,34,34,-37,-51,-63,-60,34,-61,-58,34,-68,34,-67,34,34,-42,-43,34,-99,-110,34,-231,-234,34,34,-237,-9,34,34,34,34,-254,-256,-44,34,34,-87,34,34,34,-200,34,-56,-105,-198,-174,-175,-178,-179,34,34,-213,-346,34,-143,-144,34,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,34,34,-281,-302,-303,34,34,-279,34,-281,34,34,34,34,-125,34,-269,-270,-271,-272,-267,34,34,34,34,34,-360,-337,-338,34,-318,-167,-169,34,34,34,34,-183,34,-188,34,34,34,34,-247,-263,34,-330,-332,-313,-314,-315,34,34,-279,34,34,34,-310,-365,34,-195,-350,34,34,-2,-85,-86,-20,34,34,34,34,34,34,-52,-59,34,-69,34,34,34,34,34,34,-115,34,-113,34,-235,-236,34,34,34,34,34,-239,-91,-92,-93,-94,-95,-88,-35,34,34,-202,-102,-109,-265,-182,-199,34,-294,-299,-15,-17,34,34,34,34,34,-280,-282,-11,-12,-13,-306,34,-279,-309,34,-246,-244,34,-122,34,34,-356,-357,-358,-359,-341,-342,-340,-339,-171,149,-172,-186,-187,-184,-185,34,34,34,34,34,-317,-283,34,-327,34,34,-366,-194,-352,-39,-25,-27,-374,-29,34,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,34,34,34,34,-335,-10,-362,-363,34,34,34,-106,-201,34,-279,-275,-281,34,34,34,-296,34,-288,-288,-119,-134,34,34,34,34,-249,-328,34,-275,-325,-353,-351,-30,34,-101,34,34,-8,-364,34,-104,-290,34,-276,-277,-278,-297,-245,34,-173,-326,-49,34,34,-7,-66,-108,-275,34,34,-96,]),'USING':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[67,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,111,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,390,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'ROW':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,150,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,355,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[69,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,313,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,516,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'STORAGE':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,355,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[70,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,515,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'CLONE':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,100,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[71,71,-160,-161,-192,105,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,71,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,-220,105,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'ENCODE':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[72,-177,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,72,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,72,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,72,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,72,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,72,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'TABLESPACE':([1,2,3,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,77,80,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,199,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,267,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[73,-177,76,-160,-161,-192,-222,-361,-252,-320,-321,-322,-323,-1,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,200,-127,-176,-127,-180,-191,-220,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,-223,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,360,-55,-181,-190,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,-221,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,73,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,-189,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'OPTIONS':([1,2,4,5,7,10,11,12,14,15,16,17,28,29,30,31,34,37,40,42,44,47,55,56,57,64,65,66,75,90,91,93,96,99,103,106,108,110,112,118,119,120,123,135,136,138,141,142,146,147,148,149,151,154,155,158,160,162,163,170,171,172,173,174,175,176,177,178,181,183,184,185,186,187,188,189,190,193,194,195,196,198,205,214,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,251,252,253,254,255,256,257,263,264,265,266,268,270,271,282,286,287,288,291,292,294,295,307,310,312,313,316,317,318,319,320,321,323,324,326,328,331,332,336,337,339,340,342,344,345,352,353,356,357,359,361,365,373,374,375,376,379,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,434,435,436,443,448,450,451,453,454,456,457,458,465,466,473,474,475,476,482,483,484,486,488,492,494,497,500,502,511,512,513,514,515,516,517,518,519,520,527,528,530,532,533,534,540,541,542,543,544,545,550,551,552,553,555,557,558,559,560,561,562,563,564,565,567,568,569,580,581,583,586,590,591,592,593,594,596,597,598,599,600,601,602,603,605,606,608,609,610,616,617,618,621,628,633,635,636,638,639,640,645,646,649,650,652,655,660,661,665,667,668,669,670,671,672,673,676,677,681,682,685,687,],[74,-177,74,74,-192,-222,-361,-252,-320,-321,-322,-323,74,-162,-240,-3,-128,-127,-36,-46,-62,-71,-163,-224,-238,-262,-371,-21,-57,-176,-127,-180,-191,74,-139,-319,-333,-324,-168,-250,-248,-264,-343,-22,-33,-34,-5,-6,-28,-64,-40,-41,-70,-53,-54,-38,-65,-77,-84,74,-225,-226,-227,-228,-229,-230,-232,-233,-158,-253,-255,-257,-258,-259,-260,-261,-23,-50,-19,-24,-369,-81,-55,-181,74,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,74,-243,-117,-131,-123,-124,-268,-132,-355,-334,-335,-336,-166,-170,-127,-344,-311,-312,-316,-329,-331,-354,-304,-4,-26,-372,-373,-31,-335,-37,-51,-63,-60,-61,-58,-68,-67,-42,-43,-99,-110,-231,-234,-159,-237,-9,-254,-256,-370,-87,-78,-80,-56,-174,-175,-178,-179,-213,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,-318,-167,-169,-188,74,-247,-263,-330,-332,-313,-314,-315,-310,-365,-2,-85,-86,-20,-32,-52,-59,-69,-76,-100,-115,-113,-235,-236,-239,-91,-92,-93,-94,-95,-88,-35,-82,-79,-182,-199,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-246,-244,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-171,-172,-186,-187,-317,-283,-327,-366,-39,-25,-27,-374,-29,-47,-48,-72,-74,-73,-75,-89,-90,-97,-98,-114,-111,-112,-10,-362,-363,-83,-275,-296,-288,-288,-119,-134,-135,-249,-328,-325,-353,-30,-101,-8,-364,-290,-276,-277,-278,-297,-245,-136,-173,-326,-49,-7,-66,-137,-96,]),'DOMAIN':([3,],[78,]),'SCHEMA':([3,80,],[79,203,]),'DATABASE':([3,68,80,191,],[81,81,204,204,]),'UNIQUE':([3,23,34,56,91,99,103,119,122,170,171,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,295,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,469,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,589,628,633,635,636,638,639,640,645,651,665,667,668,669,670,672,685,],[83,124,-128,179,-127,223,-139,-248,283,223,179,-158,-24,223,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,223,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-304,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,223,-247,-313,-314,-315,-310,-350,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-352,-275,-296,-288,-288,-119,-134,-135,-249,-351,-290,-276,-277,-278,-297,-136,-137,]),'CLUSTERED':([3,],[84,]),'TABLE':([3,6,19,27,34,77,80,91,133,210,299,370,468,587,],[85,94,116,134,-128,201,-127,-127,-196,369,-193,525,-195,-194,]),'OR':([3,],[86,]),'SEQUENCE':([3,],[87,]),'TYPE':([3,210,],[88,371,]),'LP':([9,10,19,25,29,34,35,37,45,46,70,74,91,97,103,106,114,116,118,119,123,124,129,130,132,133,136,144,145,150,152,157,158,166,169,179,180,181,225,228,241,246,251,252,253,254,255,256,257,263,265,266,275,276,278,282,283,286,287,288,293,294,299,317,321,323,324,342,343,344,346,349,358,385,387,392,396,397,398,399,400,401,402,407,413,415,416,417,418,419,420,421,422,428,429,430,438,441,444,445,446,447,450,455,456,457,458,461,465,468,484,497,498,502,503,505,510,530,532,540,541,542,547,548,552,553,555,557,558,559,560,561,562,563,564,571,573,574,575,576,580,581,587,596,597,608,615,627,628,633,635,638,639,640,643,644,645,654,657,665,667,668,669,670,672,674,675,677,685,],[98,100,115,131,137,-128,143,-127,159,161,193,197,-127,216,258,259,274,277,-250,-248,289,290,296,-367,298,-196,304,309,311,314,315,161,159,334,338,347,348,289,386,259,400,408,-251,-117,-131,-123,-124,-268,-132,-355,432,433,442,-208,-214,289,452,-311,-312,-316,463,464,-193,481,159,-61,-58,289,504,259,159,509,442,-298,259,-368,535,-292,-293,-295,536,-289,-281,535,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,432,258,-206,-129,-205,-130,-247,579,-313,-314,-315,582,-310,-195,-59,258,612,259,613,298,620,-294,-299,535,-282,535,535,-309,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,258,-212,-129,-204,-215,-317,-283,-194,-47,-48,258,432,666,-275,-296,-288,-119,-134,-135,-209,-211,-249,678,679,-290,-276,-277,-278,-297,-136,-210,-207,-49,-137,]),'LIKE':([10,34,91,100,118,119,251,450,645,],[104,-128,-127,104,-250,-248,-251,-247,-249,]),'REFERENCES':([13,34,91,99,103,119,121,170,173,181,195,215,219,220,221,223,224,225,226,227,228,229,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,281,286,287,288,294,341,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,628,633,635,636,638,639,640,645,650,665,667,668,669,670,672,685,],[107,-128,-127,107,-139,-248,-348,107,107,-158,-24,107,-140,-141,-142,-145,-146,-147,-148,-149,-150,107,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,107,-117,-131,-123,-124,-268,-132,-355,-335,-336,-349,-311,-312,-316,-354,107,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,107,-247,-313,-314,-315,-310,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-275,-296,-288,-288,-119,-134,-135,-249,-353,-290,-276,-277,-278,-297,-136,-137,]),'FOR':([16,34,91,108,180,225,264,265,266,291,292,385,396,397,398,399,401,402,429,430,453,454,530,532,540,541,561,562,563,564,628,633,635,665,667,668,669,670,],[109,-128,-127,-333,350,384,-334,-335,-336,-329,-331,-298,-279,-292,-293,-295,-289,-281,-337,-338,-330,-332,-294,-299,-280,-282,-341,-342,-340,-339,-275,-296,-288,-290,-276,-277,-278,-297,]),'IF':([18,79,85,87,134,201,203,369,525,],[113,-164,209,211,302,362,-165,524,625,]),'FOREIGN':([23,34,56,91,99,103,119,122,170,171,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,295,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,469,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,589,628,633,635,636,638,639,640,645,651,665,667,668,669,670,672,685,],[127,-128,127,-127,127,-139,-248,127,127,127,-158,-24,127,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,127,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-304,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,127,-247,-313,-314,-315,-310,-350,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-352,-275,-296,-288,-288,-119,-134,-135,-249,-351,-290,-276,-277,-278,-297,-136,-137,]),'CONSTRAINT':([23,34,56,91,99,103,119,170,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,469,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,589,628,633,635,636,638,639,640,645,651,665,667,668,669,670,672,685,],[128,-128,128,-127,128,-139,-248,128,-158,-24,128,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,128,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,128,-247,-313,-314,-315,-310,-350,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-352,-275,-296,-288,-288,-119,-134,-135,-249,-351,-290,-276,-277,-278,-297,-136,-137,]),'CHECK':([23,34,56,91,99,103,119,122,170,171,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,240,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,295,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,469,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,589,628,633,635,636,638,639,640,645,651,665,667,668,669,670,672,685,],[129,-128,129,-127,129,-139,-248,129,129,129,-158,-24,129,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,129,-300,-14,-138,129,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-304,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,129,-247,-313,-314,-315,-310,-350,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-352,-275,-296,-288,-288,-119,-134,-135,-249,-351,-290,-276,-277,-278,-297,-136,-137,]),'KEY':([24,29,34,37,91,126,127,180,222,223,285,],[130,138,-128,-127,-127,293,294,349,382,383,455,]),'TERMINATED':([29,34,37,165,167,],[139,-128,-127,333,335,]),'STRING':([33,34,37,43,49,91,109,123,125,131,144,152,161,164,181,192,212,213,216,230,236,241,242,245,252,253,254,255,256,259,264,265,266,271,274,276,282,284,286,287,288,289,290,297,298,304,306,309,310,311,314,315,316,317,327,336,338,342,347,348,354,355,378,389,390,391,400,402,405,413,415,416,417,418,419,420,421,422,424,429,430,431,438,439,442,445,452,456,457,458,459,461,462,463,464,465,467,472,477,478,479,480,481,482,487,488,489,491,495,498,504,507,508,509,533,534,535,537,538,539,540,541,552,553,561,562,563,564,566,572,578,579,580,581,582,584,585,595,607,615,619,620,627,628,631,634,635,638,640,644,647,648,662,666,667,668,669,678,684,685,686,],[141,-128,148,155,163,-127,266,287,292,266,266,266,330,331,287,-45,374,376,266,391,392,397,404,-14,-117,266,-123,-124,-268,266,430,-335,-336,148,266,447,287,454,456,-312,-316,266,266,430,266,266,475,266,430,266,266,266,430,266,330,492,266,287,266,266,-44,513,430,-16,534,-18,266,-281,543,-118,430,-125,-126,-269,-270,-271,-272,-267,430,-337,-338,562,-335,430,266,447,266,-313,-314,-315,430,-279,430,266,266,-310,430,430,430,430,430,430,266,430,599,600,603,606,430,-335,266,430,430,266,-15,-17,266,430,266,-289,-280,-282,-120,-122,-341,-342,-340,-339,148,430,430,266,-317,-283,266,430,430,430,655,-335,430,266,-335,-275,430,430,-288,-119,266,447,430,-275,430,266,-276,-277,-278,266,-340,266,430,]),'ARRAY':([34,91,102,180,252,253,254,255,256,265,266,413,415,416,417,418,419,420,421,422,429,430,438,498,552,553,555,561,562,563,564,638,640,672,685,],[-128,-127,255,255,-117,416,-123,-124,-268,-335,-336,-118,-121,-125,-126,-269,-270,-271,-272,-267,-337,-338,255,255,-120,-122,255,-341,-342,-340,-339,-119,416,255,416,]),'LT':([34,91,102,180,252,253,254,255,256,265,266,413,415,416,417,418,419,420,421,422,429,430,438,498,552,553,555,561,562,563,564,638,640,672,685,],[-128,-127,256,256,-117,256,418,-124,-268,-335,-336,-118,-121,-125,418,-269,-270,-271,-272,-267,-337,-338,256,256,-120,-122,256,-341,-342,-340,-339,-119,256,256,256,]),'DOT':([34,91,112,119,120,133,202,214,251,252,278,303,411,450,531,567,596,],[-128,-127,269,279,280,300,364,377,412,414,449,-127,549,577,626,642,653,]),'AS':([34,53,91,133,202,410,468,522,],[-128,168,-127,299,363,548,587,623,]),'NULL':([34,91,99,103,119,170,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,238,241,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,628,633,635,636,638,639,640,645,665,667,668,669,670,672,685,],[-128,-127,237,-139,-248,237,-158,-24,237,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,393,398,-300,-14,-138,237,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,237,-247,-313,-314,-315,-310,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-275,-296,-288,-288,-119,-134,-135,-249,-290,-276,-277,-278,-297,-136,-137,]),'NOT':([34,91,99,103,106,113,119,170,181,195,209,211,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,340,342,344,362,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,466,502,518,524,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,586,625,628,633,635,636,638,639,640,645,665,667,668,669,670,672,685,],[-128,-127,238,-139,262,273,-248,238,-158,-24,368,372,238,-140,-141,-142,-145,-146,-147,-148,-149,262,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,238,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,501,-159,262,521,-143,-144,-298,262,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,238,-247,-313,-314,-315,-310,-365,262,-35,624,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-366,664,-275,-296,-288,-288,-119,-134,-135,-249,-290,-276,-277,-278,-297,-136,-137,]),'COLLATE':([34,91,99,103,119,170,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,628,633,635,636,638,639,640,645,665,667,668,669,670,672,685,],[-128,-127,242,-139,-248,242,-158,-24,242,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,242,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,242,-247,-313,-314,-315,-310,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-275,-296,-288,-288,-119,-134,-135,-249,-290,-276,-277,-278,-297,-136,-137,]),'ENFORCED':([34,91,99,103,119,170,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,238,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,340,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,466,501,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,586,628,633,635,636,638,639,640,645,665,667,668,669,670,672,685,],[-128,-127,243,-139,-248,243,-158,-24,243,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,394,-300,-14,-138,243,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,243,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,243,-247,-313,-314,-315,-310,-365,394,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-366,-275,-296,-288,-288,-119,-134,-135,-249,-290,-276,-277,-278,-297,-136,-137,]),'ENCRYPT':([34,91,99,103,119,170,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,628,633,635,636,638,639,640,645,665,667,668,669,670,672,685,],[-128,-127,245,-139,-248,245,-158,-24,245,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,245,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,245,-247,-313,-314,-315,-310,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-275,-296,-288,-288,-119,-134,-135,-249,-290,-276,-277,-278,-297,-136,-137,]),'AUTOINCREMENT':([34,91,99,103,119,170,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,628,633,635,636,638,639,640,645,665,667,668,669,670,672,685,],[-128,-127,247,-139,-248,247,-158,-24,247,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,247,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,247,-247,-313,-314,-315,-310,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-275,-296,-288,-288,-119,-134,-135,-249,-290,-276,-277,-278,-297,-136,-137,]),'GENERATED':([34,91,99,103,119,170,181,195,215,219,220,221,223,224,225,226,227,228,230,231,232,233,234,235,237,243,245,247,249,252,253,254,255,256,257,263,265,266,286,287,288,342,382,383,385,387,389,391,392,393,394,395,396,397,398,399,401,402,403,404,406,407,409,413,415,416,417,418,419,420,421,422,428,429,430,448,450,456,457,458,465,518,530,532,533,534,540,541,542,543,544,545,552,553,555,557,558,559,560,561,562,563,564,580,581,628,633,635,636,638,639,640,645,665,667,668,669,670,672,685,],[-128,-127,248,-139,-248,248,-158,-24,248,-140,-141,-142,-145,-146,-147,-148,-149,-150,-152,-153,-154,-155,-156,-157,-273,-300,-14,-138,248,-117,-131,-123,-124,-268,-132,-355,-335,-336,-311,-312,-316,-159,-143,-144,-298,-151,-16,-18,-368,-274,-301,-116,-279,-292,-293,-295,-289,-281,-302,-303,-305,-279,-281,-118,-121,-125,-126,-269,-270,-271,-272,-267,-360,-337,-338,248,-247,-313,-314,-315,-310,-35,-294,-299,-15,-17,-280,-282,-11,-12,-13,-306,-120,-122,-133,-356,-357,-358,-359,-341,-342,-340,-339,-317,-283,-275,-296,-288,-288,-119,-134,-135,-249,-290,-276,-277,-278,-297,-136,-137,]),'DEFERRABLE':([34,91,106,119,228,262,263,344,387,428,450,502,557,558,559,560,645,],[-128,-127,261,-248,261,428,-355,261,261,-360,-247,261,-356,-357,-358,-359,-249,]),'ADD':([34,91,119,301,303,450,471,588,645,],[-128,-127,-248,469,-127,-247,589,651,-249,]),'COMMAT':([34,91,254,256,417,418,419,420,421,422,],[-128,-127,420,-268,420,-269,-270,-271,-272,-267,]),'RT':([34,91,254,256,417,418,419,420,421,422,],[-128,-127,421,-268,421,-269,-270,-271,-272,-267,]),'BY':([36,37,39,51,54,139,333,335,],[144,150,152,166,169,306,489,491,]),'SERDEPROPERTIES':([45,],[157,]),'KEYS':([50,],[165,]),'ITEMS':([52,],[167,]),'FORMAT':([69,],[192,]),'REPLACE':([86,],[210,]),'SERDE':([192,],[354,]),'SALT':([230,245,388,389,391,533,534,],[389,-14,533,-16,-18,-15,-17,]),'UPDATE':([244,260,],[405,426,]),'DELETE':([260,],[425,]),'INITIALLY':([261,],[427,]),'EXISTS':([273,302,368,372,521,624,664,],[437,470,523,526,622,663,683,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'expr':([0,],[1,]),'database_base':([0,1,],[2,42,]),'create_schema':([0,],[4,]),'create_database':([0,],[5,]),'type_definition':([0,],[7,]),'domain_name':([0,],[8,]),'index_table_name':([0,],[9,]),'table_name':([0,],[10,]),'pkey':([0,56,171,],[11,174,340,]),'seq_name':([0,],[12,]),'alter_foreign':([0,],[13,]),'alter_check':([0,],[14,]),'alter_unique':([0,],[15,]),'alter_default':([0,],[16,]),'alter_primary_key':([0,],[17,]),'c_schema':([0,],[18,]),'type_name':([0,],[19,]),'create_index':([0,],[20,]),'create_table':([0,],[21,]),'create_seq':([0,],[22,]),'alt_table':([0,],[23,]),'pkey_statement':([0,56,171,],[25,25,343,]),'type_create':([0,],[26,]),'multiple_options':([1,],[28,]),'id':([1,3,4,5,8,10,16,18,19,21,22,23,26,29,32,38,43,44,48,56,58,59,60,61,63,64,67,71,72,73,76,77,78,81,82,89,92,94,95,98,99,100,101,102,107,109,112,115,117,122,123,125,128,131,134,137,140,143,144,150,152,156,159,161,168,170,180,181,182,183,184,196,197,198,200,204,207,208,210,212,213,215,216,217,225,239,241,242,246,248,249,250,252,253,254,256,258,259,264,268,269,274,276,277,279,280,282,284,289,290,296,297,298,300,303,304,306,309,310,311,314,315,316,317,322,325,327,329,330,334,338,342,343,347,348,350,351,355,356,359,360,361,364,377,378,381,384,400,401,405,406,408,412,413,414,415,417,423,424,425,426,427,431,437,438,439,440,442,444,445,448,449,452,459,460,462,463,464,467,470,472,477,478,479,480,481,482,485,487,488,489,491,492,493,495,498,504,506,507,508,509,519,520,529,535,536,537,538,539,546,549,552,555,556,572,573,577,578,579,582,584,585,595,611,612,613,614,619,620,621,626,630,631,632,634,640,642,643,644,647,653,658,659,662,666,672,678,679,685,686,],[29,77,89,92,97,102,108,112,114,119,120,125,133,136,140,151,154,156,162,180,182,183,184,185,188,189,190,194,195,196,198,199,202,205,206,212,213,214,102,218,239,102,251,252,119,265,268,276,278,284,286,291,295,265,119,305,307,119,265,312,317,319,325,329,336,239,252,286,351,352,353,355,276,355,361,365,366,367,370,373,375,239,265,380,385,395,396,403,407,410,239,411,413,265,419,422,423,265,429,435,436,438,445,102,450,451,286,453,461,265,465,429,265,468,119,265,474,265,429,265,265,265,429,265,325,485,329,487,488,490,498,286,503,265,265,510,511,512,355,355,519,355,522,527,429,218,531,461,540,542,545,547,551,552,553,429,419,554,429,558,559,560,561,567,252,429,102,265,573,574,239,576,265,429,540,429,265,265,429,119,429,429,429,429,429,265,429,596,598,601,602,605,607,102,429,252,615,616,429,429,265,355,355,380,627,547,429,265,540,540,637,638,252,641,429,644,645,429,265,627,429,429,429,657,547,218,380,429,265,355,665,540,429,540,429,265,673,674,574,429,677,540,380,429,627,252,265,547,265,429,]),'using':([1,],[31,]),'option_comment':([1,112,436,],[40,270,565,]),'row_format':([1,],[43,]),'storage':([1,],[44,]),'with':([1,178,],[47,345,]),'clone':([1,2,42,],[55,75,75,]),'encode':([1,99,170,215,249,448,],[57,221,221,221,221,221,]),'tablespace':([1,267,],[65,434,]),'options':([1,4,5,28,99,170,215,249,448,],[66,90,93,135,234,234,234,234,234,]),'defcolumn':([10,56,95,100,277,],[99,170,215,249,448,]),'likke':([10,100,],[101,250,]),'column':([10,56,95,100,274,277,338,440,493,],[103,103,103,103,441,103,497,571,608,]),'ref':([13,99,170,173,215,229,249,341,448,],[106,228,228,344,228,387,228,502,228,]),'using_tablespace':([17,],[110,]),'t_name':([21,107,134,143,303,470,],[118,263,301,308,471,588,]),'foreign':([23,56,99,122,170,171,215,249,448,],[121,173,229,281,229,341,229,229,229,]),'constraint':([23,56,99,170,215,249,448,],[122,171,240,240,240,240,240,]),'check_st':([23,56,99,122,170,171,215,240,249,448,],[123,181,181,282,181,342,181,342,181,181,]),'by_smthg':([37,],[146,]),'with_args':([45,158,321,346,],[158,321,321,158,]),'multi_assigments':([46,157,],[160,320,]),'check_ex':([56,99,170,215,249,448,],[172,224,224,224,224,224,]),'uniq':([56,171,],[175,339,]),'statem_by_id':([56,],[176,]),'period_for':([56,],[177,]),'pkey_constraint':([56,],[178,]),'index_pid':([98,381,504,613,],[217,529,614,659,]),'comment':([99,103,170,215,249,441,448,497,571,608,],[219,257,219,219,219,257,219,257,257,257,]),'null':([99,170,215,249,448,],[220,220,220,220,220,]),'default':([99,170,215,249,448,],[225,225,225,225,225,]),'collate':([99,170,215,249,448,],[226,226,226,226,226,]),'enforced':([99,170,215,249,340,448,],[227,227,227,227,500,227,]),'encrypt':([99,170,215,249,448,],[230,230,230,230,230,]),'generated':([99,170,215,249,448,],[231,231,231,231,231,]),'c_property':([99,170,215,249,448,],[232,232,232,232,232,]),'on_update':([99,170,215,249,448,],[233,233,233,233,233,]),'autoincrement':([99,170,215,249,448,],[235,235,235,235,235,]),'gen_always':([99,170,215,249,448,],[246,246,246,246,246,]),'c_type':([102,180,438,498,555,672,],[253,253,253,253,640,685,]),'tid':([102,180,253,438,498,555,640,672,685,],[254,254,417,254,254,254,417,254,417,]),'pid':([109,131,144,152,216,253,259,274,289,290,298,304,309,311,314,315,317,338,347,348,400,442,452,463,464,481,504,509,535,538,579,582,620,640,666,678,685,],[264,297,310,316,378,415,424,439,459,462,467,472,477,478,479,480,482,495,507,508,537,572,578,584,585,595,297,619,631,634,647,631,662,415,631,686,415,]),'id_equals':([115,197,],[275,358,]),'funct_args':([123,181,282,342,],[288,288,288,288,]),'equals':([159,322,],[324,484,]),'assigment':([161,327,],[328,486,]),'pid_with_type':([169,],[337,]),'properties':([196,198,361,519,],[356,359,520,621,]),'property':([196,198,356,359,361,519,520,621,],[357,357,517,517,357,357,517,517,]),'funct_expr':([241,246,400,],[399,406,538,]),'multi_id':([241,246,289,400,408,535,536,582,612,666,679,],[401,401,460,539,546,630,632,630,658,630,658,]),'f_call':([241,246,289,400,401,405,408,460,535,536,539,546,582,612,630,632,658,666,679,],[402,409,402,402,541,544,402,541,629,402,541,541,629,402,541,541,541,629,402,]),'multiple_column_names':([274,],[440,]),'id_or_string':([276,445,644,],[446,575,675,]),'multiple_funct':([338,],[496,]),'funct':([338,611,],[499,656,]),'dot_id':([384,],[530,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> expr","S'",1,None,None,None),
-  ('expr -> expr multiple_options','expr',2,'p_expression_options','bigquery.py',3),
-  ('expr -> expr id LP id RP','expr',5,'p_expression_distkey','redshift.py',3),
-  ('expr -> expr using','expr',2,'p_expression_using','spark_sql.py',3),
-  ('expr -> expr INDEX id id','expr',4,'p_expr_index_in','ibm.py',5),
-  ('expr -> expr LOCATION STRING','expr',3,'p_expression_location','hql.py',6),
-  ('expr -> expr LOCATION DQ_STRING','expr',3,'p_expression_location','hql.py',7),
-  ('pkey_constraint -> constraint pkey_statement id LP index_pid RP','pkey_constraint',6,'p_pkey_constraint','mssql.py',6),
-  ('pkey_constraint -> constraint pkey_statement LP index_pid RP','pkey_constraint',5,'p_pkey_constraint','mssql.py',7),
-  ('pkey_constraint -> pkey_constraint with','pkey_constraint',2,'p_pkey_constraint','mssql.py',8),
-  ('pkey_constraint -> pkey_constraint with ON id','pkey_constraint',4,'p_pkey_constraint','mssql.py',9),
-  ('on_update -> ON UPDATE id','on_update',3,'p_on_update','mysql.py',6),
-  ('on_update -> ON UPDATE STRING','on_update',3,'p_on_update','mysql.py',7),
-  ('on_update -> ON UPDATE f_call','on_update',3,'p_on_update','mysql.py',8),
-  ('encrypt -> ENCRYPT','encrypt',1,'p_encrypt','oracle.py',6),
-  ('encrypt -> encrypt NO SALT','encrypt',3,'p_encrypt','oracle.py',7),
-  ('encrypt -> encrypt SALT','encrypt',2,'p_encrypt','oracle.py',8),
-  ('encrypt -> encrypt USING STRING','encrypt',3,'p_encrypt','oracle.py',9),
-  ('encrypt -> encrypt STRING','encrypt',2,'p_encrypt','oracle.py',10),
-  ('clone -> CLONE id','clone',2,'p_clone','snowflake.py',6),
-  ('expr -> expr INHERITS LP t_name RP','expr',5,'p_expr_inherits','psql.py',7),
-  ('multiple_options -> options','multiple_options',1,'p_multiple_options','bigquery.py',8),
-  ('multiple_options -> multiple_options options','multiple_options',2,'p_multiple_options','bigquery.py',9),
-  ('using -> USING id','using',2,'p_using','spark_sql.py',8),
-  ('encode -> ENCODE id','encode',2,'p_encode','redshift.py',9),
-  ('expr -> expr CLUSTER BY LP pid RP','expr',6,'p_expression_cluster_by','snowflake.py',11),
-  ('expr -> expr CLUSTER BY pid','expr',4,'p_expression_cluster_by','snowflake.py',12),
-  ('expr -> expr ID ON LP pid RP','expr',6,'p_expression_clustered','hql.py',13),
-  ('expr -> expr ID by_smthg','expr',3,'p_expression_clustered','hql.py',14),
-  ('expr -> expr PARTITION BY LP pid RP','expr',6,'p_expression_partition_by','sql.py',13),
-  ('expr -> expr PARTITION BY id LP pid RP','expr',7,'p_expression_partition_by','sql.py',14),
-  ('expr -> expr PARTITION BY pid','expr',4,'p_expression_partition_by','sql.py',15),
-  ('expr -> expr PARTITION BY id pid','expr',5,'p_expression_partition_by','sql.py',16),
-  ('expr -> expr id id','expr',3,'p_expression_diststyle','redshift.py',14),
-  ('expr -> expr id KEY','expr',3,'p_expression_diststyle','redshift.py',15),
-  ('options -> OPTIONS LP id_equals RP','options',4,'p_options','bigquery.py',18),
-  ('expr -> expr option_comment','expr',2,'p_table_comment','snowflake.py',19),
-  ('expr -> expr INTO ID ID','expr',4,'p_expression_into_buckets','hql.py',24),
-  ('with -> WITH with_args','with',2,'p_with','mssql.py',25),
-  ('expr -> expr id id LP pid RP','expr',6,'p_expression_sortkey','redshift.py',26),
-  ('option_comment -> ID STRING','option_comment',2,'p_option_comment','snowflake.py',26),
-  ('option_comment -> ID DQ_STRING','option_comment',2,'p_option_comment','snowflake.py',27),
-  ('option_comment -> COMMENT ID STRING','option_comment',3,'p_option_comment','snowflake.py',28),
-  ('option_comment -> COMMENT ID DQ_STRING','option_comment',3,'p_option_comment','snowflake.py',29),
-  ('row_format -> ROW FORMAT SERDE','row_format',3,'p_row_format','hql.py',30),
-  ('row_format -> ROW FORMAT','row_format',2,'p_row_format','hql.py',31),
-  ('expr -> expr database_base','expr',2,'p_expression_create_database','sql.py',31),
-  ('equals -> id id id','equals',3,'p_equals','mssql.py',32),
-  ('equals -> id id ON','equals',3,'p_equals','mssql.py',33),
-  ('equals -> id id id DOT id','equals',5,'p_equals','mssql.py',34),
-  ('storage -> STORAGE LP','storage',2,'p_storage','oracle.py',32),
-  ('storage -> storage id id','storage',3,'p_storage','oracle.py',33),
-  ('storage -> storage id id RP','storage',4,'p_storage','oracle.py',34),
-  ('expr -> expr row_format id','expr',3,'p_expression_row_format','hql.py',37),
-  ('expr -> expr row_format STRING','expr',3,'p_expression_row_format','hql.py',38),
-  ('database_base -> CREATE DATABASE id','database_base',3,'p_database_base','sql.py',37),
-  ('database_base -> CREATE ID DATABASE id','database_base',4,'p_database_base','sql.py',38),
-  ('database_base -> database_base clone','database_base',2,'p_database_base','sql.py',39),
-  ('with_args -> LP equals','with_args',2,'p_with_args','mssql.py',43),
-  ('with_args -> with_args COMMA equals','with_args',3,'p_with_args','mssql.py',44),
-  ('with_args -> with_args with_args','with_args',2,'p_with_args','mssql.py',45),
-  ('with_args -> with_args RP','with_args',2,'p_with_args','mssql.py',46),
-  ('expr -> expr storage','expr',2,'p_expr_storage','oracle.py',48),
-  ('expr -> expr WITH SERDEPROPERTIES multi_assigments','expr',4,'p_expression_with_serde','hql.py',50),
-  ('expr -> expr ID INDEX','expr',3,'p_expr_index','oracle.py',54),
-  ('expr -> expr TBLPROPERTIES multi_assigments','expr',3,'p_expression_tblproperties','hql.py',59),
-  ('period_for -> id FOR id LP pid RP','period_for',6,'p_period_for','mssql.py',60),
-  ('multi_assigments -> LP assigment','multi_assigments',2,'p_multi_assigments','hql.py',64),
-  ('multi_assigments -> multi_assigments RP','multi_assigments',2,'p_multi_assigments','hql.py',65),
-  ('multi_assigments -> multi_assigments COMMA assigment','multi_assigments',3,'p_multi_assigments','hql.py',66),
-  ('expr -> expr ON id','expr',3,'p_expression_on_primary','mssql.py',64),
-  ('expr -> expr with','expr',2,'p_expression_with','mssql.py',69),
-  ('assigment -> id id id','assigment',3,'p_assigment','hql.py',72),
-  ('assigment -> STRING id STRING','assigment',3,'p_assigment','hql.py',73),
-  ('assigment -> id id STRING','assigment',3,'p_assigment','hql.py',74),
-  ('assigment -> STRING id id','assigment',3,'p_assigment','hql.py',75),
-  ('assigment -> STRING id','assigment',2,'p_assigment','hql.py',76),
-  ('expr -> expr TEXTIMAGE_ON id','expr',3,'p_expression_text_image_on','mssql.py',74),
-  ('expr -> CREATE TABLESPACE id properties','expr',4,'p_expression_create_tablespace','sql.py',85),
-  ('expr -> CREATE id TABLESPACE id properties','expr',5,'p_expression_create_tablespace','sql.py',86),
-  ('expr -> CREATE id TABLESPACE id','expr',4,'p_expression_create_tablespace','sql.py',87),
-  ('expr -> CREATE TABLESPACE id','expr',3,'p_expression_create_tablespace','sql.py',88),
-  ('expr -> CREATE id id TABLESPACE id','expr',5,'p_expression_create_tablespace','sql.py',89),
-  ('expr -> CREATE id id TABLESPACE id properties','expr',6,'p_expression_create_tablespace','sql.py',90),
-  ('expr -> expr COMMENT STRING','expr',3,'p_expression_comment','hql.py',86),
-  ('expr -> expr id TERMINATED BY id','expr',5,'p_expression_terminated_by','hql.py',92),
-  ('expr -> expr id TERMINATED BY STRING','expr',5,'p_expression_terminated_by','hql.py',93),
-  ('properties -> property','properties',1,'p_properties','sql.py',96),
-  ('properties -> properties property','properties',2,'p_properties','sql.py',97),
-  ('expr -> expr MAP KEYS TERMINATED BY id','expr',6,'p_expression_map_keys_terminated_by','hql.py',100),
-  ('expr -> expr MAP KEYS TERMINATED BY STRING','expr',6,'p_expression_map_keys_terminated_by','hql.py',101),
-  ('property -> id id','property',2,'p_property','sql.py',106),
-  ('property -> id STRING','property',2,'p_property','sql.py',107),
-  ('property -> id ON','property',2,'p_property','sql.py',108),
-  ('property -> id STORAGE','property',2,'p_property','sql.py',109),
-  ('property -> id ROW','property',2,'p_property','sql.py',110),
-  ('expr -> expr SKEWED BY LP id RP ON LP pid RP','expr',10,'p_expression_skewed_by','hql.py',108),
-  ('expr -> expr COLLECTION ITEMS TERMINATED BY id','expr',6,'p_expression_collection_terminated_by','hql.py',114),
-  ('expr -> expr COLLECTION ITEMS TERMINATED BY STRING','expr',6,'p_expression_collection_terminated_by','hql.py',115),
-  ('expr -> expr STORED AS id','expr',4,'p_expression_stored_as','hql.py',122),
-  ('expr -> expr STORED AS id STRING','expr',5,'p_expression_stored_as','hql.py',123),
-  ('expr -> expr STORED AS id STRING id STRING','expr',7,'p_expression_stored_as','hql.py',124),
-  ('create_table -> CREATE TABLE IF NOT EXISTS','create_table',5,'p_create_table','sql.py',123),
-  ('create_table -> CREATE TABLE','create_table',2,'p_create_table','sql.py',124),
-  ('create_table -> CREATE OR REPLACE TABLE IF NOT EXISTS','create_table',7,'p_create_table','sql.py',125),
-  ('create_table -> CREATE OR REPLACE TABLE','create_table',4,'p_create_table','sql.py',126),
-  ('create_table -> CREATE id TABLE IF NOT EXISTS','create_table',6,'p_create_table','sql.py',127),
-  ('create_table -> CREATE id TABLE','create_table',3,'p_create_table','sql.py',128),
-  ('create_table -> CREATE OR REPLACE id TABLE IF NOT EXISTS','create_table',8,'p_create_table','sql.py',129),
-  ('create_table -> CREATE OR REPLACE id TABLE','create_table',5,'p_create_table','sql.py',130),
-  ('expr -> expr PARTITIONED BY pid_with_type','expr',4,'p_expression_partitioned_by_hql','hql.py',138),
-  ('expr -> expr PARTITIONED BY LP pid RP','expr',6,'p_expression_partitioned_by_hql','hql.py',139),
-  ('expr -> expr PARTITIONED BY LP multiple_funct RP','expr',6,'p_expression_partitioned_by_hql','hql.py',140),
-  ('pid_with_type -> LP column','pid_with_type',2,'p_pid_with_type','hql.py',147),
-  ('pid_with_type -> pid_with_type COMMA column','pid_with_type',3,'p_pid_with_type','hql.py',148),
-  ('pid_with_type -> pid_with_type RP','pid_with_type',2,'p_pid_with_type','hql.py',149),
-  ('c_property -> id id','c_property',2,'p_column_property','sql.py',153),
-  ('c_type -> id','c_type',1,'p_c_type','sql.py',192),
-  ('c_type -> id id','c_type',2,'p_c_type','sql.py',193),
-  ('c_type -> id id id id','c_type',4,'p_c_type','sql.py',194),
-  ('c_type -> id id id','c_type',3,'p_c_type','sql.py',195),
-  ('c_type -> c_type pid','c_type',2,'p_c_type','sql.py',196),
-  ('c_type -> id DOT id','c_type',3,'p_c_type','sql.py',197),
-  ('c_type -> tid','c_type',1,'p_c_type','sql.py',198),
-  ('c_type -> ARRAY','c_type',1,'p_c_type','sql.py',199),
-  ('c_type -> c_type ARRAY','c_type',2,'p_c_type','sql.py',200),
-  ('c_type -> c_type tid','c_type',2,'p_c_type','sql.py',201),
-  ('id -> ID','id',1,'p_id','ddl_parser.py',214),
-  ('id -> DQ_STRING','id',1,'p_id','ddl_parser.py',215),
-  ('id_or_string -> id','id_or_string',1,'p_id_or_string','ddl_parser.py',226),
-  ('id_or_string -> STRING','id_or_string',1,'p_id_or_string','ddl_parser.py',227),
-  ('column -> id c_type','column',2,'p_column','sql.py',290),
-  ('column -> column comment','column',2,'p_column','sql.py',291),
-  ('column -> column LP id RP','column',4,'p_column','sql.py',292),
-  ('column -> column LP id id RP','column',5,'p_column','sql.py',293),
-  ('column -> column LP id RP c_type','column',5,'p_column','sql.py',294),
-  ('column -> column LP id COMMA id RP','column',6,'p_column','sql.py',295),
-  ('column -> column LP id COMMA id RP c_type','column',7,'p_column','sql.py',296),
-  ('autoincrement -> AUTOINCREMENT','autoincrement',1,'p_autoincrement','sql.py',370),
-  ('defcolumn -> column','defcolumn',1,'p_defcolumn','sql.py',374),
-  ('defcolumn -> defcolumn comment','defcolumn',2,'p_defcolumn','sql.py',375),
-  ('defcolumn -> defcolumn null','defcolumn',2,'p_defcolumn','sql.py',376),
-  ('defcolumn -> defcolumn encode','defcolumn',2,'p_defcolumn','sql.py',377),
-  ('defcolumn -> defcolumn PRIMARY KEY','defcolumn',3,'p_defcolumn','sql.py',378),
-  ('defcolumn -> defcolumn UNIQUE KEY','defcolumn',3,'p_defcolumn','sql.py',379),
-  ('defcolumn -> defcolumn UNIQUE','defcolumn',2,'p_defcolumn','sql.py',380),
-  ('defcolumn -> defcolumn check_ex','defcolumn',2,'p_defcolumn','sql.py',381),
-  ('defcolumn -> defcolumn default','defcolumn',2,'p_defcolumn','sql.py',382),
-  ('defcolumn -> defcolumn collate','defcolumn',2,'p_defcolumn','sql.py',383),
-  ('defcolumn -> defcolumn enforced','defcolumn',2,'p_defcolumn','sql.py',384),
-  ('defcolumn -> defcolumn ref','defcolumn',2,'p_defcolumn','sql.py',385),
-  ('defcolumn -> defcolumn foreign ref','defcolumn',3,'p_defcolumn','sql.py',386),
-  ('defcolumn -> defcolumn encrypt','defcolumn',2,'p_defcolumn','sql.py',387),
-  ('defcolumn -> defcolumn generated','defcolumn',2,'p_defcolumn','sql.py',388),
-  ('defcolumn -> defcolumn c_property','defcolumn',2,'p_defcolumn','sql.py',389),
-  ('defcolumn -> defcolumn on_update','defcolumn',2,'p_defcolumn','sql.py',390),
-  ('defcolumn -> defcolumn options','defcolumn',2,'p_defcolumn','sql.py',391),
-  ('defcolumn -> defcolumn autoincrement','defcolumn',2,'p_defcolumn','sql.py',392),
-  ('check_ex -> check_st','check_ex',1,'p_check_ex','sql.py',427),
-  ('check_ex -> constraint check_st','check_ex',2,'p_check_ex','sql.py',428),
-  ('expr -> create_schema','expr',1,'p_expression_schema','sql.py',454),
-  ('expr -> create_database','expr',1,'p_expression_schema','sql.py',455),
-  ('expr -> expr id','expr',2,'p_expression_schema','sql.py',456),
-  ('expr -> expr clone','expr',2,'p_expression_schema','sql.py',457),
-  ('c_schema -> CREATE SCHEMA','c_schema',2,'p_c_schema','sql.py',487),
-  ('c_schema -> CREATE ID SCHEMA','c_schema',3,'p_c_schema','sql.py',488),
-  ('create_schema -> c_schema id id','create_schema',3,'p_create_schema','sql.py',494),
-  ('create_schema -> c_schema id id id','create_schema',4,'p_create_schema','sql.py',495),
-  ('create_schema -> c_schema id','create_schema',2,'p_create_schema','sql.py',496),
-  ('create_schema -> c_schema id DOT id','create_schema',4,'p_create_schema','sql.py',497),
-  ('create_schema -> c_schema id option_comment','create_schema',3,'p_create_schema','sql.py',498),
-  ('create_schema -> c_schema id DOT id option_comment','create_schema',5,'p_create_schema','sql.py',499),
-  ('create_schema -> c_schema IF NOT EXISTS id','create_schema',5,'p_create_schema','sql.py',500),
-  ('create_schema -> c_schema IF NOT EXISTS id DOT id','create_schema',7,'p_create_schema','sql.py',501),
-  ('create_schema -> create_schema id id id','create_schema',4,'p_create_schema','sql.py',502),
-  ('create_schema -> create_schema id id STRING','create_schema',4,'p_create_schema','sql.py',503),
-  ('create_schema -> create_schema options','create_schema',2,'p_create_schema','sql.py',504),
-  ('create_database -> database_base','create_database',1,'p_create_database','sql.py',541),
-  ('create_database -> create_database id id id','create_database',4,'p_create_database','sql.py',542),
-  ('create_database -> create_database id id STRING','create_database',4,'p_create_database','sql.py',543),
-  ('create_database -> create_database options','create_database',2,'p_create_database','sql.py',544),
-  ('expr -> DROP TABLE id','expr',3,'p_expression_drop_table','sql.py',565),
-  ('expr -> DROP TABLE id DOT id','expr',5,'p_expression_drop_table','sql.py',566),
-  ('multiple_column_names -> column','multiple_column_names',1,'p_multiple_column_names','sql.py',582),
-  ('multiple_column_names -> multiple_column_names COMMA','multiple_column_names',2,'p_multiple_column_names','sql.py',583),
-  ('multiple_column_names -> multiple_column_names column','multiple_column_names',2,'p_multiple_column_names','sql.py',584),
-  ('type_definition -> type_name id LP pid RP','type_definition',5,'p_type_definition','sql.py',621),
-  ('type_definition -> type_name id LP multiple_column_names RP','type_definition',5,'p_type_definition','sql.py',622),
-  ('type_definition -> type_name LP id_equals RP','type_definition',4,'p_type_definition','sql.py',623),
-  ('type_definition -> type_name TABLE LP defcolumn','type_definition',4,'p_type_definition','sql.py',624),
-  ('type_definition -> type_definition COMMA defcolumn','type_definition',3,'p_type_definition','sql.py',625),
-  ('type_definition -> type_definition RP','type_definition',2,'p_type_definition','sql.py',626),
-  ('expr -> type_definition','expr',1,'p_expression_type_as','sql.py',644),
-  ('type_name -> type_create id AS','type_name',3,'p_type_name','sql.py',648),
-  ('type_name -> type_create id DOT id AS','type_name',5,'p_type_name','sql.py',649),
-  ('type_name -> type_create id DOT id','type_name',4,'p_type_name','sql.py',650),
-  ('type_name -> type_create id','type_name',2,'p_type_name','sql.py',651),
-  ('type_create -> CREATE TYPE','type_create',2,'p_type_create','sql.py',663),
-  ('type_create -> CREATE OR REPLACE TYPE','type_create',4,'p_type_create','sql.py',664),
-  ('expr -> domain_name id LP pid RP','expr',5,'p_expression_domain_as','sql.py',671),
-  ('domain_name -> CREATE DOMAIN id AS','domain_name',4,'p_domain_name','sql.py',680),
-  ('domain_name -> CREATE DOMAIN id DOT id AS','domain_name',6,'p_domain_name','sql.py',681),
-  ('domain_name -> CREATE DOMAIN id DOT id','domain_name',5,'p_domain_name','sql.py',682),
-  ('domain_name -> CREATE DOMAIN id','domain_name',3,'p_domain_name','sql.py',683),
-  ('id_equals -> id id id_or_string','id_equals',3,'p_id_equals','sql.py',736),
-  ('id_equals -> id id_or_string','id_equals',2,'p_id_equals','sql.py',737),
-  ('id_equals -> id_equals COMMA','id_equals',2,'p_id_equals','sql.py',738),
-  ('id_equals -> id_equals COMMA id id id_or_string','id_equals',5,'p_id_equals','sql.py',739),
-  ('id_equals -> id','id_equals',1,'p_id_equals','sql.py',740),
-  ('id_equals -> id_equals LP pid RP','id_equals',4,'p_id_equals','sql.py',741),
-  ('id_equals -> id_equals LP pid RP id','id_equals',5,'p_id_equals','sql.py',742),
-  ('id_equals -> id_equals COMMA id id','id_equals',4,'p_id_equals','sql.py',743),
-  ('id_equals -> id_equals COMMA id','id_equals',3,'p_id_equals','sql.py',744),
-  ('expr -> index_table_name LP index_pid RP','expr',4,'p_expression_index','sql.py',765),
-  ('index_table_name -> create_index ON id','index_table_name',3,'p_index_table_name','sql.py',775),
-  ('index_table_name -> create_index ON id DOT id','index_table_name',5,'p_index_table_name','sql.py',776),
-  ('create_index -> CREATE INDEX id','create_index',3,'p_create_index','sql.py',789),
-  ('create_index -> CREATE UNIQUE INDEX id','create_index',4,'p_create_index','sql.py',790),
-  ('create_index -> create_index ON id','create_index',3,'p_create_index','sql.py',791),
-  ('create_index -> CREATE CLUSTERED INDEX id','create_index',4,'p_create_index','sql.py',792),
-  ('expr -> table_name defcolumn','expr',2,'p_expression_table','sql.py',823),
-  ('expr -> table_name LP defcolumn','expr',3,'p_expression_table','sql.py',824),
-  ('expr -> table_name','expr',1,'p_expression_table','sql.py',825),
-  ('expr -> expr COMMA defcolumn','expr',3,'p_expression_table','sql.py',826),
-  ('expr -> expr COMMA','expr',2,'p_expression_table','sql.py',827),
-  ('expr -> expr COMMA constraint','expr',3,'p_expression_table','sql.py',828),
-  ('expr -> expr COMMA check_ex','expr',3,'p_expression_table','sql.py',829),
-  ('expr -> expr COMMA foreign','expr',3,'p_expression_table','sql.py',830),
-  ('expr -> expr COMMA pkey','expr',3,'p_expression_table','sql.py',831),
-  ('expr -> expr COMMA uniq','expr',3,'p_expression_table','sql.py',832),
-  ('expr -> expr COMMA statem_by_id','expr',3,'p_expression_table','sql.py',833),
-  ('expr -> expr COMMA constraint uniq','expr',4,'p_expression_table','sql.py',834),
-  ('expr -> expr COMMA period_for','expr',3,'p_expression_table','sql.py',835),
-  ('expr -> expr COMMA pkey_constraint','expr',3,'p_expression_table','sql.py',836),
-  ('expr -> expr COMMA constraint pkey','expr',4,'p_expression_table','sql.py',837),
-  ('expr -> expr COMMA constraint pkey enforced','expr',5,'p_expression_table','sql.py',838),
-  ('expr -> expr COMMA constraint foreign ref','expr',5,'p_expression_table','sql.py',839),
-  ('expr -> expr COMMA foreign ref','expr',4,'p_expression_table','sql.py',840),
-  ('expr -> expr encode','expr',2,'p_expression_table','sql.py',841),
-  ('expr -> expr DEFAULT id id id','expr',5,'p_expression_table','sql.py',842),
-  ('expr -> expr RP','expr',2,'p_expression_table','sql.py',843),
-  ('likke -> LIKE','likke',1,'p_likke','sql.py',939),
-  ('likke -> CLONE','likke',1,'p_likke','sql.py',940),
-  ('expr -> table_name likke id','expr',3,'p_expression_like_table','sql.py',945),
-  ('expr -> table_name likke id DOT id','expr',5,'p_expression_like_table','sql.py',946),
-  ('expr -> table_name LP likke id DOT id RP','expr',7,'p_expression_like_table','sql.py',947),
-  ('expr -> table_name LP likke id RP','expr',5,'p_expression_like_table','sql.py',948),
-  ('t_name -> id DOT id','t_name',3,'p_t_name','sql.py',963),
-  ('t_name -> id','t_name',1,'p_t_name','sql.py',964),
-  ('t_name -> id DOT id DOT id','t_name',5,'p_t_name','sql.py',965),
-  ('table_name -> create_table t_name','table_name',2,'p_table_name','sql.py',987),
-  ('table_name -> table_name likke id','table_name',3,'p_table_name','sql.py',988),
-  ('expr -> seq_name','expr',1,'p_expression_seq','sql.py',996),
-  ('expr -> expr INCREMENT id','expr',3,'p_expression_seq','sql.py',997),
-  ('expr -> expr INCREMENT id id','expr',4,'p_expression_seq','sql.py',998),
-  ('expr -> expr START id','expr',3,'p_expression_seq','sql.py',999),
-  ('expr -> expr START id id','expr',4,'p_expression_seq','sql.py',1000),
-  ('expr -> expr MINVALUE id','expr',3,'p_expression_seq','sql.py',1001),
-  ('expr -> expr NO MINVALUE','expr',3,'p_expression_seq','sql.py',1002),
-  ('expr -> expr NO MAXVALUE','expr',3,'p_expression_seq','sql.py',1003),
-  ('expr -> expr MAXVALUE id','expr',3,'p_expression_seq','sql.py',1004),
-  ('expr -> expr CACHE id','expr',3,'p_expression_seq','sql.py',1005),
-  ('expr -> expr CACHE','expr',2,'p_expression_seq','sql.py',1006),
-  ('seq_name -> create_seq id DOT id','seq_name',4,'p_seq_name','sql.py',1025),
-  ('seq_name -> create_seq id','seq_name',2,'p_seq_name','sql.py',1026),
-  ('create_seq -> CREATE SEQUENCE IF NOT EXISTS','create_seq',5,'p_create_seq','sql.py',1040),
-  ('create_seq -> CREATE SEQUENCE','create_seq',2,'p_create_seq','sql.py',1041),
-  ('tid -> LT id','tid',2,'p_tid','sql.py',1049),
-  ('tid -> LT','tid',1,'p_tid','sql.py',1050),
-  ('tid -> tid LT','tid',2,'p_tid','sql.py',1051),
-  ('tid -> tid id','tid',2,'p_tid','sql.py',1052),
-  ('tid -> tid COMMAT','tid',2,'p_tid','sql.py',1053),
-  ('tid -> tid RT','tid',2,'p_tid','sql.py',1054),
-  ('null -> NULL','null',1,'p_null','sql.py',1095),
-  ('null -> NOT NULL','null',2,'p_null','sql.py',1096),
-  ('f_call -> id LP RP','f_call',3,'p_f_call','sql.py',1105),
-  ('f_call -> id LP f_call RP','f_call',4,'p_f_call','sql.py',1106),
-  ('f_call -> id LP multi_id RP','f_call',4,'p_f_call','sql.py',1107),
-  ('f_call -> id LP pid RP','f_call',4,'p_f_call','sql.py',1108),
-  ('multi_id -> id','multi_id',1,'p_multi_id','sql.py',1123),
-  ('multi_id -> multi_id id','multi_id',2,'p_multi_id','sql.py',1124),
-  ('multi_id -> f_call','multi_id',1,'p_multi_id','sql.py',1125),
-  ('multi_id -> multi_id f_call','multi_id',2,'p_multi_id','sql.py',1126),
-  ('funct_args -> LP multi_id RP','funct_args',3,'p_funct_args','sql.py',1137),
-  ('funct -> id LP multi_id RP','funct',4,'p_funct','sql.py',1141),
-  ('multiple_funct -> funct','multiple_funct',1,'p_multiple_funct','sql.py',1145),
-  ('multiple_funct -> multiple_funct COMMA funct','multiple_funct',3,'p_multiple_funct','sql.py',1146),
-  ('multiple_funct -> multiple_funct COMMA','multiple_funct',2,'p_multiple_funct','sql.py',1147),
-  ('funct_expr -> LP multi_id RP','funct_expr',3,'p_funct_expr','sql.py',1156),
-  ('funct_expr -> multi_id','funct_expr',1,'p_funct_expr','sql.py',1157),
-  ('dot_id -> id DOT id','dot_id',3,'p_dot_id','sql.py',1165),
-  ('default -> DEFAULT id','default',2,'p_default','sql.py',1169),
-  ('default -> DEFAULT STRING','default',2,'p_default','sql.py',1170),
-  ('default -> DEFAULT NULL','default',2,'p_default','sql.py',1171),
-  ('default -> default FOR dot_id','default',3,'p_default','sql.py',1172),
-  ('default -> DEFAULT funct_expr','default',2,'p_default','sql.py',1173),
-  ('default -> DEFAULT LP pid RP','default',4,'p_default','sql.py',1174),
-  ('default -> DEFAULT LP funct_expr pid RP','default',5,'p_default','sql.py',1175),
-  ('default -> default id','default',2,'p_default','sql.py',1176),
-  ('default -> default LP RP','default',3,'p_default','sql.py',1177),
-  ('enforced -> ENFORCED','enforced',1,'p_enforced','sql.py',1221),
-  ('enforced -> NOT ENFORCED','enforced',2,'p_enforced','sql.py',1222),
-  ('collate -> COLLATE id','collate',2,'p_collate','sql.py',1228),
-  ('collate -> COLLATE STRING','collate',2,'p_collate','sql.py',1229),
-  ('constraint -> CONSTRAINT id','constraint',2,'p_constraint','sql.py',1236),
-  ('generated -> gen_always funct_expr','generated',2,'p_generated','sql.py',1245),
-  ('generated -> gen_always funct_expr id','generated',3,'p_generated','sql.py',1246),
-  ('generated -> gen_always LP multi_id RP','generated',4,'p_generated','sql.py',1247),
-  ('generated -> gen_always f_call','generated',2,'p_generated','sql.py',1248),
-  ('gen_always -> GENERATED id AS','gen_always',3,'p_gen_always','sql.py',1259),
-  ('check_st -> CHECK LP id','check_st',3,'p_check_st','sql.py',1264),
-  ('check_st -> check_st id','check_st',2,'p_check_st','sql.py',1265),
-  ('check_st -> check_st STRING','check_st',2,'p_check_st','sql.py',1266),
-  ('check_st -> check_st id STRING','check_st',3,'p_check_st','sql.py',1267),
-  ('check_st -> check_st id RP','check_st',3,'p_check_st','sql.py',1268),
-  ('check_st -> check_st STRING RP','check_st',3,'p_check_st','sql.py',1269),
-  ('check_st -> check_st funct_args','check_st',2,'p_check_st','sql.py',1270),
-  ('check_st -> check_st LP pid RP','check_st',4,'p_check_st','sql.py',1271),
-  ('using_tablespace -> USING INDEX tablespace','using_tablespace',3,'p_using_tablespace','sql.py',1287),
-  ('expr -> alter_foreign ref','expr',2,'p_expression_alter','sql.py',1292),
-  ('expr -> alter_check','expr',1,'p_expression_alter','sql.py',1293),
-  ('expr -> alter_unique','expr',1,'p_expression_alter','sql.py',1294),
-  ('expr -> alter_default','expr',1,'p_expression_alter','sql.py',1295),
-  ('expr -> alter_primary_key','expr',1,'p_expression_alter','sql.py',1296),
-  ('expr -> alter_primary_key using_tablespace','expr',2,'p_expression_alter','sql.py',1297),
-  ('alter_primary_key -> alt_table PRIMARY KEY LP pid RP','alter_primary_key',6,'p_alter_primary_key','sql.py',1304),
-  ('alter_primary_key -> alt_table constraint PRIMARY KEY LP pid RP','alter_primary_key',7,'p_alter_primary_key','sql.py',1305),
-  ('alter_unique -> alt_table UNIQUE LP pid RP','alter_unique',5,'p_alter_unique','sql.py',1315),
-  ('alter_unique -> alt_table constraint UNIQUE LP pid RP','alter_unique',6,'p_alter_unique','sql.py',1316),
-  ('alter_default -> alt_table id id','alter_default',3,'p_alter_default','sql.py',1342),
-  ('alter_default -> alt_table constraint id id','alter_default',4,'p_alter_default','sql.py',1343),
-  ('alter_default -> alt_table id STRING','alter_default',3,'p_alter_default','sql.py',1344),
-  ('alter_default -> alt_table constraint id STRING','alter_default',4,'p_alter_default','sql.py',1345),
-  ('alter_default -> alter_default id','alter_default',2,'p_alter_default','sql.py',1346),
-  ('alter_default -> alter_default FOR pid','alter_default',3,'p_alter_default','sql.py',1347),
-  ('pid -> id','pid',1,'p_pid','sql.py',1371),
-  ('pid -> STRING','pid',1,'p_pid','sql.py',1372),
-  ('pid -> pid id','pid',2,'p_pid','sql.py',1373),
-  ('pid -> pid STRING','pid',2,'p_pid','sql.py',1374),
-  ('pid -> STRING LP RP','pid',3,'p_pid','sql.py',1375),
-  ('pid -> id LP RP','pid',3,'p_pid','sql.py',1376),
-  ('pid -> pid COMMA id','pid',3,'p_pid','sql.py',1377),
-  ('pid -> pid COMMA STRING','pid',3,'p_pid','sql.py',1378),
-  ('alter_check -> alt_table check_st','alter_check',2,'p_alter_check','sql.py',1391),
-  ('alter_check -> alt_table constraint check_st','alter_check',3,'p_alter_check','sql.py',1392),
-  ('index_pid -> id','index_pid',1,'p_index_pid','sql.py',1405),
-  ('index_pid -> index_pid id','index_pid',2,'p_index_pid','sql.py',1406),
-  ('index_pid -> index_pid COMMA index_pid','index_pid',3,'p_index_pid','sql.py',1407),
-  ('alter_foreign -> alt_table foreign','alter_foreign',2,'p_alter_foreign','sql.py',1430),
-  ('alter_foreign -> alt_table constraint foreign','alter_foreign',3,'p_alter_foreign','sql.py',1431),
-  ('alt_table -> ALTER TABLE t_name ADD','alt_table',4,'p_alt_table_name','sql.py',1451),
-  ('alt_table -> ALTER TABLE IF EXISTS t_name ADD','alt_table',6,'p_alt_table_name','sql.py',1452),
-  ('alt_table -> ALTER TABLE ID t_name ADD','alt_table',5,'p_alt_table_name','sql.py',1453),
-  ('foreign -> FOREIGN KEY LP pid RP','foreign',5,'p_foreign','sql.py',1468),
-  ('foreign -> FOREIGN KEY','foreign',2,'p_foreign','sql.py',1469),
-  ('ref -> REFERENCES t_name','ref',2,'p_ref','sql.py',1477),
-  ('ref -> ref LP pid RP','ref',4,'p_ref','sql.py',1478),
-  ('ref -> ref ON DELETE id','ref',4,'p_ref','sql.py',1479),
-  ('ref -> ref ON UPDATE id','ref',4,'p_ref','sql.py',1480),
-  ('ref -> ref DEFERRABLE INITIALLY id','ref',4,'p_ref','sql.py',1481),
-  ('ref -> ref NOT DEFERRABLE','ref',3,'p_ref','sql.py',1482),
-  ('expr -> pkey','expr',1,'p_expression_primary_key','sql.py',1513),
-  ('uniq -> UNIQUE LP pid RP','uniq',4,'p_uniq','sql.py',1517),
-  ('statem_by_id -> id LP pid RP','statem_by_id',4,'p_statem_by_id','sql.py',1522),
-  ('statem_by_id -> id KEY LP pid RP','statem_by_id',5,'p_statem_by_id','sql.py',1523),
-  ('pkey -> pkey_statement LP pid RP','pkey',4,'p_pkey','sql.py',1534),
-  ('pkey -> pkey_statement ID LP pid RP','pkey',5,'p_pkey','sql.py',1535),
-  ('pkey_statement -> PRIMARY KEY','pkey_statement',2,'p_pkey_statement','sql.py',1569),
-  ('comment -> COMMENT STRING','comment',2,'p_comment','sql.py',1573),
-  ('tablespace -> TABLESPACE id','tablespace',2,'p_tablespace','sql.py',1578),
-  ('tablespace -> TABLESPACE id properties','tablespace',3,'p_tablespace','sql.py',1579),
-  ('expr -> expr tablespace','expr',2,'p_expr_tablespace','sql.py',1585),
-  ('by_smthg -> BY id','by_smthg',2,'p_by_smthg','sql.py',1591),
-  ('by_smthg -> BY ROW','by_smthg',2,'p_by_smthg','sql.py',1592),
-  ('by_smthg -> BY LP pid RP','by_smthg',4,'p_by_smthg','sql.py',1593),
-]
@@ -0,0 +1,143 @@
+"""
+Recognizer of procedural bodies that the grammar does not parse:
+
+    - PostgreSQL functions & DO blocks with $$-quoted (or '-quoted) body
+    - Oracle procedures, functions, triggers, PACKAGE [BODY] & TYPE BODY (ended with END; or '/' line)
+    - MSSQL procedures & functions (ended with GO line)
+    - MySQL routines & triggers between DELIMITER lines
+
+Body is found by its delimiters in one pass over raw chunks of data (before lines processing), inner ';'
+do not split it on statements & it never goes to the lexer. Kind & name of each skipped body are recorded.
+"""
+import re
+from typing import Dict, Iterable, Iterator, List, Match, Optional
+
+from simple_ddl_parser.utils import NOT_CODE, CodeSearch, data_section_mark
+
+HEAD = (
+    r"CREATE(?:[ \t]+OR[ \t]+(?:REPLACE|ALTER))?(?:[ \t]+DEFINER[ \t]*=[ \t]*\S+)?"
+    r"(?:[ \t]+(?:NON)?EDITIONABLE)?(?:[ \t]+CONSTRAINT)?[ \t]+"
+    r"(?P<kind>FUNCTION|PROCEDURE|PROC|TRIGGER|PACKAGE[ \t]+BODY|PACKAGE|TYPE[ \t]+BODY)\b"
+    r"[ \t]*(?P<name>[^\s(;]*)"
+)
+head = re.compile(HEAD, re.MULTILINE | re.IGNORECASE)
+body_start = re.compile(
+    r"^[ \t]*(?:DELIMITER[ \t]+(?P<delimiter>\S+)[^\n]*(?:\n|$)|" + HEAD + r"|(?P<do>DO)[ \t]*(?=\$))|" + NOT_CODE,
+    re.MULTILINE | re.IGNORECASE,
+)
+delimiter_end = re.compile(r"^[ \t]*DELIMITER[ \t]+;[^\n]*(?:\n|$)", re.MULTILINE | re.IGNORECASE)
+
+# tokens of body that matter for search of its end, everything between them is skipped by regex search
+body_token = re.compile(
+    r"""(?P<open>'|"|/\*|\$(?:[A-Za-z_][A-Za-z0-9_]*)?\$)
+    |--[^\n]*
+    |(?P<end_line>^[ \t]*(?:/|GO)[ \t\r]*(?:\n|$))
+    |(?P<declare>\b(?:IS|AS)\b(?![ \t\r\n]*[$'])|\bDECLARE\b)
+    |(?P<begin>\bBEGIN\b(?![ \t]+(?:TRAN|TRANSACTION|WORK)\b))
+    |(?P<case>\bCASE\b)
+    |(?P<end>\bEND\b(?:[ \t]+CASE\b)?(?![ \t]+(?:IF|LOOP|WHILE|REPEAT|FOR)\b))
+    |(?P<semicolon>;)
+    |(?P<statement>^[ \t]*(?:CREATE|ALTER|DROP)\b)""",
+    re.MULTILINE | re.IGNORECASE | re.VERBOSE,
+)
+closing = {"/*": "*/"}
+# quick check before search of bodies, it is slow on chunks with many lines
+body_keywords = ("FUNCTION", "PROC", "TRIGGER", "PACKAGE", "BODY", "DELIMITER", "$")
+
+
+class ProceduralBodies:
+    """cut procedural bodies from chunks of data (body could be continued in next chunks)"""
+
+    def __init__(self, bodies: List[Dict]) -> None:
+        # kind & name of each found body
+        self.bodies = bodies
+        # None (not in body), 'body' or 'delimiter' (between DELIMITER x & DELIMITER ;)
+        self.state: Optional[str] = None
+        self.depth = 0
+        # block was opened with IS / AS / DECLARE & BEGIN of this block is not met yet
+        self.declaration = False
+        # end of quote, comment or $$-quote that was not closed in previous chunk
+        self.closing: Optional[str] = None
+        self.search = CodeSearch(body_start)
+
+    def cut(self, chunks: Iterable[str]) -> Iterator[str]:
+        for chunk in chunks:
+            if self.state is None and self.search.skip(chunk, body_keywords):
+                yield chunk
+                continue
+            result = []
+            pos = 0
+            while pos < len(chunk):
+                if self.state is None:
+                    match = self.search.search(chunk, pos)
+                    if not match:
+                        result.append(chunk[pos:])
+                        break
+                    result.append(chunk[pos: match.start()])
+                    result.append(data_section_mark)
+                    pos = self.start(match)
+                elif self.state == "delimiter":
+                    pos = self.skip_delimiter_block(chunk, pos)
+                else:
+                    pos = self.skip_body(chunk, pos)
+            yield "".join(result)
+
+    def start(self, match: Match) -> int:
+        if match.group("delimiter"):
+            if match.group("delimiter") != ";":
+                self.state = "delimiter"
+            return match.end()
+        kind = " ".join((match.group("kind") or "DO").lower().split())
+        self.bodies.append({"kind": kind, "name": match.group("name") or None})
+        self.state = "body"
+        # package & type body are blocks closed with END name;
+        self.depth = 1 if kind.startswith(("package", "type")) else 0
+        self.declaration = False
+        self.closing = None
+        return match.end()
+
+    def skip_delimiter_block(self, chunk: str, pos: int) -> int:
+        match = delimiter_end.search(chunk, pos)
+        end = match.end() if match else len(chunk)
+        for body in head.finditer(chunk, pos, end):
+            self.bodies.append({"kind": " ".join(body.group("kind").lower().split()), "name": body.group("name")})
+        if match:
+            self.state = None
+        return end
+
+    def skip_body(self, chunk: str, pos: int) -> int:
+        """skip body from pos till its end or till the end of chunk"""
+        while True:
+            if self.closing:
+                end = chunk.find(self.closing, pos)
+                if end < 0:
+                    return len(chunk)
+                pos = end + len(self.closing)
+                self.closing = None
+            match = body_token.search(chunk, pos)
+            if not match:
+                return len(chunk)
+            pos = self.body_token(match)
+            if self.state is None:
+                return pos
+
+    def body_token(self, match: Match) -> int:  # noqa: C901
+        """process token of body & get position to continue, state is reset when body is ended"""
+        kind = match.lastgroup
+        if kind == "open":
+            self.closing = closing.get(match.group(), match.group())
+        elif kind == "end_line" or (kind == "semicolon" and self.depth <= 0):
+            self.state = None
+        elif kind == "statement" and (self.depth <= 0 or self.declaration):
+            # statement after body that is not ended with ';', GO or '/'
+            self.state = None
+            return match.start()
+        elif kind == "declare" and self.depth <= 0:
+            self.depth, self.declaration = 1, True
+        elif kind == "begin" and self.declaration:
+            self.declaration = False
+        elif kind in ("begin", "case"):
+            self.depth += 1
+        elif kind == "end":
+            self.depth -= 1
+        return match.end()
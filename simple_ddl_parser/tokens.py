@@ -1,3 +1,6 @@
+from array import array
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
 # statements that used at the start of defenition or in statements without columns
 defenition_statements = {
     "DROP": "DROP",
@@ -117,3 +120,114 @@ symbol_tokens = {
 }
 
 symbol_tokens_no_check = {"<": "LT", ">": "RT"}
+
+
+# all dicts of reserved words, word that is not in them is always ID
+reserved_dicts = (
+    defenition_statements,
+    common_statements,
+    columns_defenition,
+    first_liners,
+    after_columns_tokens,
+    sequence_reserved,
+)
+
+# lexer states for resolution of words: which dict is checked first (by place in statement)
+LIKE, DEFENITION, COMMON, FIRST_LINER = range(4)
+# & which dict is checked after it (by place in body of statement)
+AFTER_COLUMNS, AFTER_COLUMNS_DEFENITION, COLUMNS_DEFENITION, SEQUENCE, BODY = range(5)
+STATES = 4 * 5
+
+
+class Keywords:
+    """
+    reserved words dicts that used by lexer, if terminals are passed - only words of them are left.
+    All dicts are compiled to one table: for each lexer state (first * 5 + body) - upper word to
+    (token type, should lexer be switched to 'after columns'), words that stay ID are not in the table
+    """
+
+    def __init__(self, terminals: Optional[Iterable[str]] = None) -> None:
+        terminals = set(terminals) if terminals is not None else None
+
+        def used(words: Dict[str, str]) -> Dict[str, str]:
+            if terminals is None:
+                return dict(words)
+            return {word: token for word, token in words.items() if token in terminals}
+
+        self.reserved = tuple(used(words) for words in reserved_dicts)
+        (
+            self.defenition_statements,
+            self.common_statements,
+            self.columns_defenition,
+            self.first_liners,
+            self.after_columns_tokens,
+            self.sequence_reserved,
+        ) = self.reserved
+        self.table = self.build_table()
+
+    def build_table(self) -> List[Dict[str, Tuple[str, bool]]]:
+        # ')' comes to resolution as RP, all words as ID
+        words = {")": "RP"}
+        for words_dict in self.reserved:
+            words.update(dict.fromkeys(words_dict, "ID"))
+        table = []
+        for state in range(STATES):
+            resolved = {word: self.resolve(state, word, token) for word, token in words.items()}
+            table.append({word: value for word, value in resolved.items() if value != (words[word], False)})
+        return table
+
+    def resolve(self, state: int, word: str, token: str) -> Tuple[str, bool]:
+        """token of word by lookups in dicts one by one, as lexer did it before the table"""
+        first, body = divmod(state, 5)
+        first_dict = (self.after_columns_tokens, self.defenition_statements, self.common_statements, self.first_liners)
+        token = first_dict[first].get(word, token)
+        after_columns = False
+        if body in (AFTER_COLUMNS, AFTER_COLUMNS_DEFENITION):
+            token = self.after_columns_tokens.get(word, token)
+            after_columns = token != "ID"
+            if not after_columns and body == AFTER_COLUMNS_DEFENITION:
+                token = self.columns_defenition.get(word, token)
+        elif body == COLUMNS_DEFENITION:
+            token = self.columns_defenition.get(word, token)
+        elif body == SEQUENCE:
+            token = self.sequence_reserved.get(word, "ID")
+        return token, after_columns
+
+
+class TokenArrays:
+    """
+    tokens of ddl as parallel arrays (result of DDLParser.tokenize), token number i has:
+    type id - types[i] (name of type is type_names[types[i]]), value - values[i] (str, IDs are interned)
+    & position in text of its statement - positions[i]. Tokens of statement number n are
+    from statement_starts[n] till statement_starts[n + 1], text of statement is statements[n]
+    """
+
+    __slots__ = ("type_names", "type_ids", "types", "values", "positions", "statement_starts", "statements")
+
+    def __init__(self, type_names: Iterable[str]) -> None:
+        self.type_names: List[str] = list(type_names)
+        self.type_ids = {name: num for num, name in enumerate(self.type_names)}
+        self.types = array("H")
+        self.values: List[str] = []
+        self.positions = array("I")
+        self.statement_starts = array("I")
+        self.statements: List[str] = []
+
+    def type_id(self, name: str) -> int:
+        """id of token type, type that is not in the list yet gets next id"""
+        if name not in self.type_ids:
+            self.type_ids[name] = len(self.type_names)
+            self.type_names.append(name)
+        return self.type_ids[name]
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+    def __iter__(self) -> Iterator[Tuple[str, str]]:
+        """(type name, value) of each token"""
+        type_names = self.type_names
+        return ((type_names[type_id], value) for type_id, value in zip(self.types, self.values))
+
+    def statement_tokens(self, num: int) -> List[Tuple[str, str]]:
+        end = self.statement_starts[num + 1] if num + 1 < len(self.statement_starts) else len(self.types)
+        return [(self.type_names[self.types[i]], self.values[i]) for i in range(self.statement_starts[num], end)]
@@ -1,4 +1,11 @@
-from typing import List
+import bz2
+import fnmatch
+import gzip
+import lzma
+import mmap
+import re
+from types import ModuleType
+from typing import IO, Dict, Iterable, Iterator, List, Match, Optional, Pattern, Tuple, Union
 
 
 def remove_par(p_list: List[str]) -> List[str]:
@@ -41,3 +48,358 @@ def find_first_unpair_closed_par(str_: str) -> int:
                 stack.pop(-1)
         elif i == "(":
             stack.append(i)
+
+
+# rewrites of pre-processing in order of applying, escapes go first - padding makes text longer.
+# string literals of one tab or new line symbol are replaced by placeholders from spec_mapper,
+# so they survive splitting of data on lines & replacing of tabs
+pre_process_escapes = (
+    ("‘", "'"),
+    ("’", "'"),
+    ("'\t'", "'pars_m_t'"),
+    ("'\n'", "'pars_m_n'"),
+    ("\\'", "\\pars_m_single"),
+    ("\t", " "),
+)
+pre_process_padding = ((",", " , "), ("(", " ( "), (")", " ) "))
+# size of window that is rewritten at once, small enough to stay in CPU cache
+pre_process_window = 1 << 16
+
+
+def pre_process(data: str) -> str:
+    """
+    apply all rewrites of pre-processing in one traversal of data.
+
+    data is cut in windows only at spaces: none of rewritten sequences (string literals with escaped quote
+    or new line included) contains space, so each of them is always inside one window & result is the same
+    as rewrite of whole data, but without full copy of data per each rewrite.
+    """
+    result = []
+    start = 0
+    size = len(data)
+    while start < size:
+        end = start + pre_process_window
+        if end < size:
+            cut = data.rfind(" ", start, end)
+            if cut < start:
+                cut = data.find(" ", end)
+            end = cut + 1 if cut >= 0 else size
+        window = data[start:end]
+        for old, new in pre_process_escapes + pre_process_padding:
+            window = window.replace(old, new)
+        result.append(window)
+        start = end
+    return "".join(result)
+
+
+# minimal size of part of file that read_chunks gives at once
+read_chunk_size = 1 << 20
+new_statement_start = ("ALTER ", "CREATE ", "DROP ", "SET ")
+
+
+def read_chunks(fileobj: IO[str]) -> Iterator[str]:
+    """
+    read file object by lines & yield parts of at least read_chunk_size symbols.
+
+    part is cut only after line that ends statement (with ';' or GO) or before line that starts new statement,
+    so string literal or regex never split between parts & each part is pre-processed separately.
+    """
+    lines = []
+    size = 0
+    for line in fileobj:
+        if size >= read_chunk_size and line.lstrip().upper().startswith(new_statement_start):
+            yield "".join(lines)
+            lines, size = [], 0
+        lines.append(line)
+        size += len(line)
+        if size >= read_chunk_size and line.endswith("\n"):
+            end = line.rstrip().upper()
+            if end.endswith(";") or end == "GO":
+                yield "".join(lines)
+                lines, size = [], 0
+    if lines:
+        yield "".join(lines)
+
+
+# end of statement in memory-mapped file: line that ends with ';' or GO line
+mapped_statement_end = re.compile(rb"(?:;|^[ \t]*GO)[ \t\r]*\n", re.MULTILINE | re.IGNORECASE)
+
+
+def read_mapped_chunks(mapped: mmap.mmap, encoding: str) -> Iterator[str]:
+    """
+    find ends of statements right in bytes of memory-mapped file & decode to str only slice of each statement,
+    new lines are translated to '\\n' same way as in file opened in text mode
+    """
+    start = 0
+    for match in mapped_statement_end.finditer(mapped):
+        yield decode_lines(mapped[start: match.end()], encoding)
+        start = match.end()
+    if start < len(mapped):
+        yield decode_lines(mapped[start:], encoding)
+
+
+def decode_lines(data: bytes, encoding: str) -> str:
+    text = data.decode(encoding)
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+# lines that must be processed line by line: start or end of statement, skip words, comments, tabs & quotes,
+# all other lines are only added to the statement as is. Search is done in upper-cased data
+statement_line_start = re.compile(r"\n[^\S\n]*(?:ALTER |CREATE |DROP |SET |(?:GO|USE|INSERT)\b|#)")
+statement_line_start_ignorecase = re.compile(statement_line_start.pattern, re.IGNORECASE)
+statement_line_special = re.compile(r"--|/\*|\*/|\t|'")
+statement_line_end = re.compile(r";[^\S\n]*(?:\n|$)")
+
+
+def statement_lines(data: str) -> List[int]:
+    """sorted starts of lines (separated by '\\n') that could start or end statement or have comments & quotes"""
+    upper = data.upper()
+    # upper() could change length of text with some symbols like 'ß', then case is ignored by regex
+    if len(upper) == len(data):
+        starts = {match.start() for match in statement_line_start.finditer("\n" + upper)}
+    else:
+        starts = {match.start() for match in statement_line_start_ignorecase.finditer("\n" + data)}
+    for pattern in (statement_line_special, statement_line_end):
+        for match in pattern.finditer(data):
+            starts.add(data.rfind("\n", 0, match.start()) + 1)
+    return sorted(starts)
+
+
+# kind of entity (key in group_by_type output) by the noun in header of statement,
+# ALTER TABLE & INDEX statements are parts of tables
+statement_kinds = {
+    "TABLE": "tables",
+    "INDEX": "tables",
+    "SEQUENCE": "sequences",
+    "TYPE": "types",
+    "DOMAIN": "domains",
+    "SCHEMA": "schemas",
+    "DATABASE": "databases",
+    "TABLESPACE": "tablespaces",
+}
+entity_kinds = sorted(set(statement_kinds.values()) | {"ddl_properties"})
+statement_header = re.compile(
+    r"\s*(?:CREATE|ALTER)(?:\s+[A-Z_]+){0,4}?\s+(TABLE|INDEX|SEQUENCE|TYPE|DOMAIN|SCHEMA|DATABASE|TABLESPACE)\b",
+    re.IGNORECASE,
+)
+
+
+def statement_kind(statement: str) -> Optional[str]:
+    """kind of entity from header of statement, None if kind is not known (statement must be parsed)"""
+    match = statement_header.match(statement)
+    return statement_kinds[match.group(1).upper()] if match else None
+
+
+# name in header of statement: parts in quotes, backticks, brackets or without them, separated by '.'
+IDENTIFIER = r'(?:"[^"]*"|`[^`]*`|\[[^\]]*\]|[^\s."`\[\](),;]+)'
+name_part = re.compile(IDENTIFIER)
+table_header = re.compile(
+    r"\s*(?:(?:CREATE(?:\s+[A-Z_]+){0,4}?|ALTER)\s+TABLE(?:\s+IF(?:\s+NOT)?\s+EXISTS|\s+ONLY)*"
+    r"|CREATE(?:\s+[A-Z_]+){0,4}?\s+INDEX\b[^(]*?\sON(?:\s+ONLY)?)"
+    rf"\s+({IDENTIFIER}(?:\s*\.\s*{IDENTIFIER})*)",
+    re.IGNORECASE,
+)
+
+
+def statement_table(statement: str) -> Optional[str]:
+    """name of table (schema.table) created or changed by statement (or by index), None if it is not found"""
+    match = table_header.match(statement)
+    if not match:
+        return None
+    return ".".join(part.strip('"`[]') for part in name_part.findall(match.group(1)))
+
+
+class TableFilter:
+    """
+    include & exclude patterns for names of tables: glob (str, case-insensitive) or compiled regular expression,
+    name is 'schema.table' ('table' if schema is not set) & it must match the whole pattern
+    """
+
+    def __init__(
+        self,
+        include: Optional[Iterable[Union[str, Pattern]]] = None,
+        exclude: Optional[Iterable[Union[str, Pattern]]] = None,
+    ) -> None:
+        self.include = None if include is None else self.compile(include)
+        self.exclude = self.compile(exclude or ())
+
+    @staticmethod
+    def compile(patterns: Iterable[Union[str, Pattern]]) -> List[Pattern]:
+        if isinstance(patterns, str) or hasattr(patterns, "fullmatch"):
+            patterns = [patterns]
+        globs = [pattern for pattern in patterns if isinstance(pattern, str)]
+        regexes = [pattern for pattern in patterns if not isinstance(pattern, str)]
+        # all globs are checked with one regex, so hundreds of them cost as one
+        if globs:
+            regexes.append(re.compile("|".join(fnmatch.translate(glob) for glob in globs), re.IGNORECASE))
+        return regexes
+
+    def match(self, name: Optional[str]) -> bool:
+        """is table included, table with unknown name is always included"""
+        if name is None:
+            return True
+        if self.include is not None and not any(regex.fullmatch(name) for regex in self.include):
+            return False
+        return not any(regex.fullmatch(name) for regex in self.exclude)
+
+
+# comments & one-line strings of ddl, starts of data sections & procedural bodies are not searched inside them
+NOT_CODE = r"""(?P<not_code>--[^\n]*|'[^'\n]*'|"[^"\n]*")|(?P<comment>/\*)"""
+
+
+class CodeSearch:
+    """search of pattern in chunks outside of comments & strings, block comment could be continued in next chunk"""
+
+    def __init__(self, pattern: Pattern) -> None:
+        # pattern must have NOT_CODE as last alternatives
+        self.pattern = pattern
+        self.in_comment = False
+
+    def search(self, chunk: str, pos: int) -> Optional[Match]:
+        while True:
+            if self.in_comment:
+                end = chunk.find("*/", pos)
+                if end < 0:
+                    return None
+                pos, self.in_comment = end + 2, False
+            match = self.pattern.search(chunk, pos)
+            if not match or match.lastgroup not in ("not_code", "comment"):
+                return match
+            pos, self.in_comment = match.end(), match.lastgroup == "comment"
+
+    def skip(self, chunk: str, keywords: Iterable[str]) -> bool:
+        """chunk could be passed as is: there are no keywords of pattern & block comments"""
+        return not self.in_comment and not has_keyword(chunk, keywords) and "/*" not in chunk
+
+
+# start of data section of pg_dump / mysqldump: INSERT statement, COPY ... FROM stdin block
+# or LOCK / UNLOCK TABLES line
+data_section_start = re.compile(
+    r"^[ \t]*(?:(INSERT)\b"
+    r"|(COPY)\b[^;\n]*\bFROM[ \t]+STDIN\b[^\n]*\n"
+    r"|(?:UN)?LOCK[ \t]+TABLES?\b[^\n]*)|" + NOT_CODE,
+    re.MULTILINE | re.IGNORECASE,
+)
+# quick check before search of sections, it is slow on chunks with many lines
+data_section_keywords = ("INSERT", "COPY", "LOCK")
+# line that starts new statement, it ends INSERT without ';' (like in MSSQL)
+statement_start_line = r"[ \t]*(?:GO|CREATE|ALTER|DROP|SET)\b"
+statement_start = re.compile(statement_start_line, re.IGNORECASE)
+# line break inside INSERT, line that starts new statement ends INSERT (even inside not closed string)
+insert_line_break = r"\n(?!" + statement_start_line + r")"
+# ';' that is not at the end of line does not end INSERT, so line with INSERT is skipped whole as before
+insert_semicolon = r";(?![ \t\r]*(?:--[^\n]*)?(?:\n|\Z))"
+# rest of INSERT till ';' at the end of line, new statement or string that is not closed in the chunk,
+# strings (with ';' & quotes inside) are skipped whole. Quote inside string is doubled ('it''s') in standard SQL,
+# mysqldump escapes it with backslash ('it\'s') - by key: are backslash escapes used
+string_content = {
+    False: r"[^'\n]*(?:" + insert_line_break + r"[^'\n]*)*",
+    True: r"[^'\\\n]*(?:(?:\\[^\n]|\\?" + insert_line_break + r")[^'\\\n]*)*",
+}
+insert_body = {
+    escapes: re.compile(
+        r"[^';\n]*(?:(?:'" + string + r"'|" + insert_line_break + "|" + insert_semicolon + r")[^';\n]*)*",
+        re.IGNORECASE,
+    )
+    for escapes, string in string_content.items()
+}
+string_body = {escapes: re.compile(string, re.IGNORECASE) for escapes, string in string_content.items()}
+# versioned comments are written only by mysqldump (at the start of dump), so backslash escapes are used
+mysql_dump_mark = "/*!"
+# COPY data ends with line '\.'
+copy_end = re.compile(r"^\\\.[ \t\r]*(?:\n|$)", re.MULTILINE)
+# skipped section is replaced with line that ends current statement same way as old skip of INSERT line
+data_section_mark = "GO\n"
+
+
+def skip_data_sections(
+    chunks: Iterable[str], stats: Dict[str, int], backslash_escapes: bool = False
+) -> Iterator[str]:
+    """
+    cut data sections of dumps from chunks (section could be continued in next chunks),
+    stats['skipped'] & stats['parsed'] are increased on size of skipped & passed data.
+    backslash_escapes: backslash escapes quote in strings (MySQL), it is turned on also by mysqldump comments
+    """
+    # None, 'insert', 'string' (string inside INSERT) or 'copy'
+    state = None
+    search = CodeSearch(data_section_start)
+    for chunk in chunks:
+        if state is None and search.skip(chunk, data_section_keywords):
+            stats["parsed"] += len(chunk)
+            yield chunk
+            continue
+        result = []
+        marks = pos = 0
+        while pos < len(chunk):
+            start = pos
+            if state is None:
+                match = search.search(chunk, pos)
+                # mysqldump comments are at the start of dump, escapes are used in all sections after them
+                end = match.start() if match else len(chunk)
+                backslash_escapes = backslash_escapes or chunk.find(mysql_dump_mark, pos, end) >= 0
+                if not match:
+                    result.append(chunk[pos:])
+                    break
+                result.append(chunk[pos: match.start()])
+                result.append(data_section_mark)
+                marks += 1
+                start, pos = match.start(), match.end()
+                state = "insert" if match.group(1) else "copy" if match.group(2) else None
+            else:
+                pos, state = skip_data_section(chunk, pos, state, backslash_escapes)
+            stats["skipped"] += pos - start
+        parsed = "".join(result)
+        stats["parsed"] += len(parsed) - len(data_section_mark) * marks
+        yield parsed
+
+
+def has_keyword(chunk: str, keywords: Iterable[str]) -> bool:
+    upper = chunk.upper()
+    return any(keyword in upper for keyword in keywords)
+
+
+def skip_data_section(chunk: str, pos: int, state: str, backslash_escapes: bool) -> Tuple[int, Optional[str]]:
+    """skip data section from pos till its end or till the end of chunk, get new position & state"""
+    if state == "copy":
+        match = copy_end.search(chunk, pos)
+        return (match.end(), None) if match else (len(chunk), state)
+    if pos == 0 and statement_start.match(chunk):
+        # INSERT without ';' (or with not closed string) ended at the end of previous chunk
+        return pos, None
+    if state == "string":
+        pos = string_body[backslash_escapes].match(chunk, pos).end()
+        if pos == len(chunk):
+            return pos, state
+        if chunk[pos] == "'":
+            return pos + 1, "insert"
+        # string is not closed before new statement, INSERT ends with its line
+        end = chunk.find("\n", pos)
+        return (end + 1, None) if end >= 0 else (len(chunk), None)
+    pos = insert_body[backslash_escapes].match(chunk, pos).end()
+    if pos == len(chunk):
+        return pos, state
+    # "'" starts string that is not closed in the chunk, ';' ends INSERT, '\n' before new statement too.
+    # '\n' is skipped with INSERT, as when chunk ends with it & new statement is at the start of next chunk
+    if chunk[pos] == "'":
+        return pos + 1, "string"
+    return pos + 1, None
+
+
+# magic bytes at the start of compressed file & module that decompresses it
+compressions = {
+    b"\x1f\x8b": gzip,
+    b"BZh": bz2,
+    b"\xfd7zXZ\x00": lzma,
+}
+
+
+def compression_of(file_path: str) -> Optional[ModuleType]:
+    """module to open compressed file (gzip, bz2 or lzma) or None if file is not compressed"""
+    with open(file_path, "rb") as df:
+        head = df.read(max(len(magic) for magic in compressions))
+    for magic, module in compressions.items():
+        if head.startswith(magic):
+            return module
+    return None
@@ -0,0 +1,63 @@
+import copy
+import logging
+
+import pytest
+
+from simple_ddl_parser.grammar import get_grammar
+from simple_ddl_parser.parser import Parser
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--check-driver",
+        action="store_true",
+        default=False,
+        help="parse each statement also with ply LRParser & check that LRDriver gives the same result",
+    )
+    parser.addoption(
+        "--fast-path",
+        action="store_true",
+        default=False,
+        help="run all tests with fast path for simple CREATE TABLE statements enabled",
+    )
+
+
+def parse_with_driver_and_ply(parse_statement):
+    def check_parse_statement(self):
+        ply_parser = get_grammar(type(self), logging.getLogger()).bind_ply_parser(self)
+        # t_* rules change flags of the lexer, so both parsers must start from the same lexer flags
+        lexer, self.lexer = self.lexer, copy.copy(self.lexer)
+        flags, self.lexer_flags = self.lexer_flags, copy.copy(self.lexer_flags)
+        try:
+            expected = ply_parser.parse(self.statement, lexer=self.lexer) or None, None
+        except Exception as e:
+            expected = None, repr(e)
+        finally:
+            self.lexer, self.lexer_flags = lexer, flags
+
+        parsed = len(self.tables)
+        try:
+            parse_statement(self)
+        except Exception as e:
+            assert (None, repr(e)) == expected, f"LRDriver & ply results are different for: {self.statement}"
+            raise
+        result = self.tables[parsed] if len(self.tables) > parsed else None
+        assert (result, None) == expected, f"LRDriver & ply results are different for: {self.statement}"
+
+    return check_parse_statement
+
+
+def init_with_fast_path(init):
+    def init_parser(self, *args, **kwargs):
+        kwargs["fast_path"] = True
+        init(self, *args, **kwargs)
+
+    return init_parser
+
+
+@pytest.fixture(autouse=True)
+def check_driver(request, monkeypatch):
+    if request.config.getoption("--check-driver"):
+        monkeypatch.setattr(Parser, "parse_statement", parse_with_driver_and_ply(Parser.parse_statement))
+    if request.config.getoption("--fast-path"):
+        monkeypatch.setattr(Parser, "__init__", init_with_fast_path(Parser.__init__))
@@ -844,8 +844,8 @@ def test_collection_items_terminated_by_hql():
             LineTotal decimal
             )
         ROW FORMAT DELIMITED
-            FIELDS TERMINATED BY '\002'
-            COLLECTION ITEMS TERMINATED BY '\002'
+            FIELDS TERMINATED BY '\\002'
+            COLLECTION ITEMS TERMINATED BY '\\002'
         STORED AS TEXTFILE
     """
 
@@ -928,8 +928,8 @@ def test_map_keys_terminated_by_hql():
             )
         ROW FORMAT DELIMITED
             FIELDS TERMINATED BY ','
-            COLLECTION ITEMS TERMINATED BY '\002'
-            MAP KEYS TERMINATED BY '\003'
+            COLLECTION ITEMS TERMINATED BY '\\002'
+            MAP KEYS TERMINATED BY '\\003'
         STORED AS TEXTFILE
     """
 
@@ -1537,10 +1537,10 @@ def test_with_serde_properties():
                         "parse_m_input_regex": ' "([^]*) '
                         "([^]*) "
                         "([^]*) "
-                        "(-|\\\\[^\\\\]*\\\\]) "
+                        "(-|\\[^\\]*\\]) "
                         "([^ "
                         '"]*|"[^"]*") '
-                        "(-|[0-9]*)\\n    "
+                        "(-|[0-9]*)\n    "
                         "(-|[0-9]*)(?: "
                         "([^ "
                         '"]*|".*") '
@@ -1626,7 +1626,7 @@ def test_special_characters_in_comment():
                 "columns": [
                     {
                         "check": None,
-                        "comment": "'t# est | & * % $ // * 6 % !?;;\\0b1\\0a7@~^'",
+                        "comment": "'t# est | & * % $ // * 6 % !?;;±§@~^'",
                         "default": None,
                         "name": "job_id",
                         "nullable": True,
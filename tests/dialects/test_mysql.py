@@ -293,7 +293,7 @@ def test_default_charset():
                         "unique": False,
                     },
                 ],
-                "comment": "'\\u5bfc\\u5165\\u5143\\u6570\\u636e\\u7ba1\\u7406'",
+                "comment": "'导入元数据管理'",
                 "default_charset": "utf8mb4",
                 "index": [],
                 "partitioned_by": [],
@@ -0,0 +1,20 @@
+import pytest
+
+from simple_ddl_parser import DDLParser
+
+
+@pytest.mark.parametrize("fast_path", [False, True])
+@pytest.mark.parametrize(
+    "default",
+    [
+        # each of them took seconds with search of quoted comma or in fast path tokenizer,
+        # growth of time is checked in benchmarks/bench_adversarial.py
+        "'" * 20000,
+        "' " * 20000,
+        "1" * 20000 + "x",
+    ],
+    ids=["quotes", "quotes & spaces", "number & letter"],
+)
+def test_adversarial_input_is_parsed(default, fast_path):
+    ddl = f"CREATE TABLE t (id int DEFAULT {default})"
+    assert DDLParser(ddl, fast_path=fast_path, silent=True).run() == DDLParser(ddl, silent=True).run()
@@ -0,0 +1,41 @@
+import pytest
+
+from simple_ddl_parser import DDLParser, DDLParserError
+from simple_ddl_parser import tokens as tok
+
+
+@pytest.mark.parametrize(
+    "dialect, ddl, output_mode",
+    [
+        ("psql", "CREATE TABLE t (id int PRIMARY KEY) INHERITS (parent);", "sql"),
+        ("mysql", "CREATE TABLE t (id int AUTO_INCREMENT) ENGINE=InnoDB CHARACTER SET utf8;", "mysql"),
+        ("mssql", "CREATE TABLE [dbo].[t] ([id] [int] IDENTITY(1,1) NOT NULL) ON [PRIMARY];", "mssql"),
+        ("hql", "CREATE EXTERNAL TABLE t (id STRING) STORED AS PARQUET LOCATION 'hdfs://t';", "hql"),
+        ("oracle", "CREATE TABLE t (id NUMBER ENCRYPT) STORAGE (INITIAL 5242880);", "oracle"),
+        ("ibm_db2", "CREATE TABLE t (id int) IN TABLESPACE1 INDEX IN TABLESPACE2;", "sql"),
+    ],
+)
+def test_dialect_grammar_same_result_as_union(dialect, ddl, output_mode):
+    expected = DDLParser(ddl).run(output_mode=output_mode)
+    assert expected
+    assert DDLParser(ddl, dialect=dialect).run(output_mode=output_mode) == expected
+
+
+def test_dialect_grammar_is_slim():
+    parser = DDLParser("", dialect="psql")
+    assert isinstance(parser, DDLParser)
+    assert type(parser) is type(DDLParser("", dialect="psql"))
+    assert len(parser.yacc.productions) < len(DDLParser("").yacc.productions)
+    # hql keywords are not tokens of psql grammar
+    assert "STORED" in DDLParser.keywords.after_columns_tokens
+    assert "STORED" not in parser.keywords.after_columns_tokens
+    assert "INHERITS" in parser.keywords.after_columns_tokens
+    # table of resolution of words is built from slim dicts too
+    after_columns = tok.AFTER_COLUMNS * 5 + tok.AFTER_COLUMNS
+    assert DDLParser.keywords.table[after_columns]["STORED"] == ("STORED", True)
+    assert "STORED" not in parser.keywords.table[after_columns]
+
+
+def test_unknown_dialect_raise_error():
+    with pytest.raises(DDLParserError):
+        DDLParser("", dialect="not_a_dialect")
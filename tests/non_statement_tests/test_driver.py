@@ -0,0 +1,35 @@
+import logging
+
+import pytest
+
+from simple_ddl_parser import DDLParser, parse_tables
+from simple_ddl_parser.driver import LRDriver
+from simple_ddl_parser.grammar import generate_tables, get_grammar
+
+
+def test_error_states_are_calculated_in_build_time():
+    signature, generated = generate_tables(DDLParser, logging.getLogger())
+    packaged = parse_tables.read_tables(signature)
+    driver = LRDriver(packaged, DDLParser)
+    assert driver.error_states == {row["error"] for row in generated.lr_action.values() if row.get("error", 0) > 0}
+    # no rows of lazy tables were unpacked
+    assert dict.__len__(packaged.lr_action) == 0
+
+
+@pytest.mark.parametrize(
+    "ddl",
+    [
+        # rule reads p[-1] - value below the rule in the stack
+        "CREATE TABLE t (id int) PARTITIONED BY (days(ts), months(ts), years(ts));",
+        # error recovery
+        ") ) CREATE TABLE t (id int);",
+        "CREATE TABLE t (a int) ; CREATE ) TABLE y ( b int ) ; ",
+        "CREATE TABLE t (id int PRIMARY KEY PRIMARY KEY);",
+    ],
+)
+def test_lr_driver_same_result_as_ply(ddl):
+    ply_parser = DDLParser(ddl)
+    ply_parser.yacc = get_grammar(DDLParser, logging.getLogger()).bind_ply_parser(ply_parser)
+    expected = ply_parser.run(output_mode="hql")
+    assert expected
+    assert DDLParser(ddl).run(output_mode="hql") == expected
@@ -0,0 +1,33 @@
+import pytest
+
+from simple_ddl_parser import DDLParser
+
+
+@pytest.mark.parametrize(
+    "ddl",
+    [
+        "CREATE TABLE t (id int);",
+        "CREATE TABLE IF NOT EXISTS s.t (id int NOT NULL, name varchar(100) DEFAULT 'x', "
+        "amount decimal(10,2) NULL, PRIMARY KEY (id));",
+        "CREATE TABLE t (id int DEFAULT 0, code varchar DEFAULT NULL, PRIMARY KEY (id, code));",
+    ],
+)
+def test_fast_path_same_result_as_grammar(ddl):
+    parser = DDLParser(ddl, fast_path=True)
+    assert parser.run(output_mode="mysql") == DDLParser(ddl).run(output_mode="mysql")
+    assert parser.fast_path_stats == {"hits": 1, "misses": 0}
+    assert parser.fast_path_hit_rate() == 1
+
+
+def test_fast_path_falls_back_to_grammar():
+    ddl = """CREATE TABLE t (id int);
+    CREATE TABLE t2 (id int REFERENCES t (id));
+    CREATE TABLE "t3" (id int);
+    CREATE TABLE t4 (id int) PARTITIONED BY (id);
+    CREATE TABLE t5 (id int unique);
+    """
+    parser = DDLParser(ddl, fast_path=True)
+    assert parser.run() == DDLParser(ddl).run()
+    assert parser.fast_path_stats == {"hits": 1, "misses": 4}
+    assert parser.fast_path_hit_rate() == 0.2
+    assert DDLParser(ddl).fast_path_hit_rate() is None
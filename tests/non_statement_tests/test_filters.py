@@ -0,0 +1,68 @@
+import re
+import sys
+
+import pytest
+
+from simple_ddl_parser import DDLParser, parse_from_file
+from simple_ddl_parser.cli import main
+
+
+KINDS_DDL = """SET search_path = public;
+CREATE SCHEMA sales;
+CREATE SEQUENCE sales.seq START WITH 1 INCREMENT BY 1;
+CREATE TYPE mood AS ENUM ('sad', 'ok');
+CREATE TABLE sales.orders (id int NOT NULL, mood mood, PRIMARY KEY (id));
+CREATE UNIQUE INDEX orders_idx ON sales.orders (id);
+ALTER TABLE sales.orders ADD CONSTRAINT fk FOREIGN KEY (id) REFERENCES sales.other (id);
+"""
+
+
+def test_include_kinds_skip_other_statements():
+    expected = DDLParser(KINDS_DDL).run(group_by_type=True)
+    parser = DDLParser(KINDS_DDL, include_kinds={"tables"})
+    result = parser.run(group_by_type=True)
+    assert result["tables"] == expected["tables"]
+    assert not any(result[kind] for kind in result if kind != "tables")
+    assert parser.skipped_statements == {"ddl_properties": 1, "schemas": 1, "sequences": 1, "types": 1}
+
+
+def test_include_kinds_unknown_kind_raise_error():
+    with pytest.raises(ValueError):
+        DDLParser(KINDS_DDL, include_kinds={"table"})
+
+
+FILTERS_DDL = """
+CREATE TABLE sales.orders (id int, PRIMARY KEY (id));
+CREATE TABLE sales.orders_tmp (id int);
+CREATE TABLE hr.people (id int);
+CREATE UNIQUE INDEX people_idx ON hr.people (id);
+ALTER TABLE hr.people ADD CONSTRAINT fk FOREIGN KEY (id) REFERENCES sales.orders (id);
+CREATE SEQUENCE hr.seq;
+"""
+
+
+def test_include_exclude_tables_args():
+    expected = DDLParser(FILTERS_DDL).run(group_by_type=True)
+    parser = DDLParser(FILTERS_DDL)
+    result = parser.run(group_by_type=True, include_tables=["SALES.*"], exclude_tables=["*_tmp"])
+    assert result["tables"] == expected["tables"][:1]
+    assert result["sequences"] == expected["sequences"]
+    # index & alter to filtered table are skipped too, otherwise alter to unknown table is an error
+    assert parser.skipped_statements == {"tables": 4}
+
+
+def test_tables_regex_filter_in_parse_from_file(tmp_path):
+    ddl_file = tmp_path / "filters.sql"
+    ddl_file.write_text(FILTERS_DDL)
+    result = parse_from_file(str(ddl_file), include_tables=[re.compile(r"hr\.\w+")], group_by_type=True)
+    assert [table["table_name"] for table in result["tables"]] == ["people"]
+    assert result["tables"][0]["index"][0]["index_name"] == "people_idx"
+
+
+def test_cli_tables_filters(tmp_path, capsys, monkeypatch):
+    ddl_file = tmp_path / "filters.sql"
+    ddl_file.write_text(FILTERS_DDL)
+    monkeypatch.setattr(sys, "argv", ["sdp", str(ddl_file), "--no-dump", "--regex", "--exclude", r"sales\..*"])
+    main()
+    output = capsys.readouterr().out
+    assert "'table_name': 'people'" in output and "'table_name': 'orders'" not in output
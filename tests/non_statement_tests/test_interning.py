@@ -0,0 +1,24 @@
+import io
+
+import pytest
+
+from simple_ddl_parser import DDLParser
+from simple_ddl_parser import parser as parser_module
+
+
+@pytest.mark.parametrize("fast_path", [False, True])
+def test_equal_names_and_types_share_one_object(fast_path):
+    ddl = "CREATE TABLE a (id int, name varchar(10));\nCREATE TABLE b (id int, \"name\" varchar(10));"
+    first, second = DDLParser(ddl, fast_path=fast_path, normalize_names=True).run()
+    for left, right in zip(first["columns"], second["columns"]):
+        assert left["name"] is right["name"]
+        assert left["type"] is right["type"]
+
+
+def test_interned_values_are_bounded_in_iter_parse(monkeypatch):
+    monkeypatch.setattr(parser_module, "INTERNED_LIMIT", 10)
+    ddl = "".join(f"CREATE TABLE t{num} (id int, name varchar(10) DEFAULT 'value {num}');\n" for num in range(50))
+    parser = DDLParser()
+    for _ in parser.iter_parse(io.StringIO(ddl)):
+        assert len(parser.interned) <= 20
+        assert not any(value.startswith("'") for value in parser.interned)
@@ -0,0 +1,17 @@
+from simple_ddl_parser import tokens as tok
+
+
+def test_keywords_table_resolution():
+    keywords = tok.Keywords()
+    sequence = tok.DEFENITION * 5 + tok.SEQUENCE
+    assert keywords.table[sequence]["START"] == ("START", False)
+    assert keywords.table[tok.DEFENITION * 5 + tok.BODY]["TABLE"] == ("TABLE", False)
+    # in sequence only its reserved words are not ID
+    assert "TABLE" not in keywords.table[sequence]
+    assert keywords.table[tok.FIRST_LINER * 5 + tok.COLUMNS_DEFENITION]["NULL"] == ("NULL", False)
+    # words that stay ID are not in the table
+    assert "ORDERS" not in keywords.table[tok.COMMON * 5 + tok.BODY]
+    # each reserved word is resolved to its token at least in one state
+    for words in tok.reserved_dicts:
+        for word, token in words.items():
+            assert any(table.get(word, ("ID", False))[0] == token for table in keywords.table), word
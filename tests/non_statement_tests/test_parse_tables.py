@@ -0,0 +1,78 @@
+import logging
+import sys
+import types
+
+import pytest
+
+from simple_ddl_parser import DDLParser, ParseTablesError, parse_tables
+from simple_ddl_parser.ddl_parser import dialect_parser, dialects
+from simple_ddl_parser.grammar import generate_lexer, generate_tables, reflect_grammar
+
+
+def test_parsers_share_grammar_but_not_state():
+    ddl = "CREATE TABLE [dbo].[users] ([id] [int] NOT NULL);"
+    normalized_parser = DDLParser(ddl, normalize_names=True)
+    raw_parser = DDLParser(ddl)
+
+    assert normalized_parser.yacc.action is raw_parser.yacc.action
+    assert normalized_parser.lexer.lexre[0][0] is raw_parser.lexer.lexre[0][0]
+    assert normalized_parser.lexer is not raw_parser.lexer
+
+    # parser that was created last must not affect results of parser created before it
+    assert normalized_parser.run()[0]["table_name"] == "users"
+    assert raw_parser.run()[0]["table_name"] == "[users]"
+
+
+def test_outdated_parse_tables_raise_error():
+    with pytest.raises(ParseTablesError) as e:
+        parse_tables.read_tables("signature of the changed grammar")
+    assert "python -m simple_ddl_parser.build_tables" in str(e.value)
+
+
+def test_packaged_parse_tables_same_as_generated():
+    signature, generated = generate_tables(DDLParser, logging.getLogger())
+    packaged = parse_tables.read_tables(signature)
+
+    for state in generated.lr_action:
+        assert packaged.lr_action[state] == generated.lr_action[state]
+        assert packaged.lr_goto[state] == generated.lr_goto[state]
+    assert [str(p) for p in packaged.lr_productions] == [str(p) for p in generated.lr_productions]
+
+
+def rules_class(monkeypatch, shift: int):
+    """parser class with rules in two modules, rules of the first one are shifted on 'shift' lines"""
+    sources = {
+        "rules_first": "\n" * shift
+        + 'def t_A(self, t):\n    r"a"\n\ndef t_B(self, t):\n    r"b"\n\ndef p_expr(self, p):\n    """expr : a"""\n',
+        "rules_second": "\n" * 10 + 'def p_a(self, p):\n    """a : A B"""\n',
+    }
+    attrs = {"tokens": ("A", "B"), "start": "expr", "p_error": lambda self, p: None}
+    for name, source in sources.items():
+        module = types.ModuleType(name)
+        exec(compile(source, f"{name}.py", "exec"), module.__dict__)
+        monkeypatch.setitem(sys.modules, name, module)
+        attrs.update({key: value for key, value in module.__dict__.items() if key.startswith(("t_", "p_"))})
+    return type("Rules", (), attrs)()
+
+
+def test_tables_signatures_do_not_depend_on_line_numbers(monkeypatch):
+    # p_expr goes after p_a in the shifted module
+    first, shifted = rules_class(monkeypatch, 0), rules_class(monkeypatch, 20)
+    log = logging.getLogger()
+    assert parse_tables.lexer_signature(first, 0) == parse_tables.lexer_signature(shifted, 0)
+    assert reflect_grammar(first, log).signature() == reflect_grammar(shifted, log).signature()
+
+
+def test_packaged_lexer_tables_same_as_generated():
+    signature, generated = generate_lexer(DDLParser, logging.getLogger())
+    packaged = parse_tables.read_lexer_tables(signature, DDLParser.__new__(DDLParser))
+
+    assert packaged.lexstateretext == generated.lexstateretext
+    assert packaged.lexreflags == generated.lexreflags
+
+
+def test_packaged_dialect_parse_tables_up_to_date():
+    for dialect in dialects:
+        parser_class = dialect_parser(DDLParser, dialect)
+        signature = reflect_grammar(parser_class.__new__(parser_class), logging.getLogger()).signature()
+        assert parse_tables.read_tables(signature, parser_class.parse_tables_file)
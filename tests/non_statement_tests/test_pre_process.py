@@ -0,0 +1,60 @@
+import pytest
+
+from simple_ddl_parser import DDLParser
+from simple_ddl_parser import utils
+from simple_ddl_parser.parser import COMMA_ONLY_STR
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "CREATE TABLE t (id int, name varchar(10) DEFAULT 'it\\'s');",
+        "'\t'\t'\t' '\t'\n' \\'\t' \\\\' ‘a’ \\x00,(a,b)\n'\n'",
+        "no_spaces_in_long_word_" * 10 + "(a, b)",
+    ],
+)
+def test_pre_process_same_as_replace_chain(data, monkeypatch):
+    expected = (
+        data.replace(",", " , ")
+        .replace("(", " ( ")
+        .replace(")", " ) ")
+        .replace("‘", "'")
+        .replace("’", "'")
+        .replace("'\t'", "'pars_m_t'")
+        .replace("'\n'", "'pars_m_n'")
+        .replace("\\'", "\\pars_m_single")
+        .replace("\t", " ")
+    )
+    assert utils.pre_process(data) == expected
+    # small windows, so data is cut in many places
+    monkeypatch.setattr(utils, "pre_process_window", 5)
+    assert utils.pre_process(data) == expected
+
+
+def test_non_ascii_data_parsed_without_escaping():
+    ddl = """CREATE TABLE "таблица" (
+    имя varchar(10) DEFAULT 'значение',
+    café int -- комментарий
+    ) COMMENT = 'комментарий';
+    """
+    result = DDLParser(ddl).run(group_by_type=True, output_mode="mysql")
+    table = result["tables"][0]
+    assert table["table_name"] == '"таблица"'
+    assert [column["name"] for column in table["columns"]] == ["имя", "café"]
+    assert table["columns"][0]["default"] == "'значение'"
+    assert table["comment"] == "'комментарий'"
+    assert result["comments"] == [" комментарий"]
+
+
+@pytest.mark.parametrize(
+    "line, expected",
+    [
+        ("a ',' b", "a X b"),
+        ("' , ' x", "X x"),
+        ("''' ',' a", "X a"),
+        ("'','' y", "X y"),
+        ("'a', 'b'", "'a', 'b'"),
+    ],
+)
+def test_comma_only_string(line, expected):
+    assert COMMA_ONLY_STR.sub("X", line) == expected
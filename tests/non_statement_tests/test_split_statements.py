@@ -0,0 +1,33 @@
+import pytest
+
+from simple_ddl_parser import DDLParser
+
+
+class LineByLineParser(DDLParser):
+    def split_lines(self, data):
+        for self.line in data.split("\n"):
+            statement = self.process_line(True)
+            if statement:
+                yield statement
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        "CREATE TABLE a (\n  id int,\n\n  name varchar(10)\n)\nCREATE TABLE b (id int);\n",
+        "SET a = 1;\nSET b TO 2\n  id int\nset c = 3;\nCREATE TABLE t (\n id int\n);",
+        "CREATE TABLE t ( -- comment\n  id int, /* block\n  still comment\n  */\n  x int # not a comment\n"
+        "# comment\n);",
+        "CREATE TABLE t (\n\tid int,\n  name varchar DEFAULT ',', x varchar DEFAULT 'a', 'b'\n) ;  \n"
+        "GO\nUSE db\n",
+        "  create table t (\n    ALTER int,\n    dropped int\n  )\n  drop table x\n    INSERT INTO t VALUES (1)\n",
+        "CREATE TABLE straße (\n  ſet int,\n  ß int\n);\nſet x = 1;\nCREATE TABLE t　(　\n  id int　\n);",
+        "\n\n\nCREATE TABLE t (id int)\n\n\n",
+        "/*\nCREATE TABLE commented (id int);\n*/\nCREATE TABLE t (id int);",
+    ],
+)
+def test_statement_lines_scanner_same_as_line_by_line(data):
+    parser, expected_parser = DDLParser(), LineByLineParser()
+    assert list(parser.split_statements([data])) == list(expected_parser.split_statements([data]))
+    assert parser.tables == expected_parser.tables
+    assert parser.comments == expected_parser.comments
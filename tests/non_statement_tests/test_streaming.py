@@ -0,0 +1,48 @@
+import pytest
+
+from simple_ddl_parser import DDLParser
+
+
+ALTER_DDL = """
+CREATE TABLE a (id int, name varchar(10));
+CREATE SEQUENCE seq START WITH 1;
+CREATE TABLE b (id int, a_id int);
+CREATE INDEX i_name ON a (name);
+ALTER TABLE b ADD CONSTRAINT fk FOREIGN KEY (a_id) REFERENCES a (id);
+ALTER TABLE a ADD CONSTRAINT uq UNIQUE (name);
+SET x = 1;
+-- comment
+"""
+
+
+@pytest.mark.parametrize("output_mode", ["sql", "mssql", "hql"])
+def test_iter_parse_without_lookahead_limit_same_as_run(output_mode):
+    expected = DDLParser(ALTER_DDL).run(output_mode=output_mode)
+    assert list(DDLParser(ALTER_DDL).iter_parse(output_mode=output_mode, lookahead=None)) == expected
+
+
+def test_iter_parse_yields_alter_to_already_yielded_table():
+    expected = DDLParser(ALTER_DDL).run()
+    result = list(DDLParser(ALTER_DDL).iter_parse())
+    # table 'a' is yielded before index & alter statements to it
+    assert result[0]["table_name"] == "a"
+    assert result[0]["index"] == []
+    assert result[0]["alter"] == {}
+    assert result[1] == expected[1]
+    assert [item.get("index_name") or item.get("alter_table_name") for item in result[3:6]] == ["i_name", "b", "a"]
+    assert result[6:] == expected[3:]
+
+
+def test_iter_parse_adds_alter_in_lookahead_window():
+    expected = DDLParser(ALTER_DDL).run()
+    result = list(DDLParser(ALTER_DDL).iter_parse(lookahead=3))
+    # index to 'a' & alter to 'b' are in 3 statements after the table, alter to 'a' is later
+    assert result[0]["index"] == expected[0]["index"]
+    assert result[0]["alter"] == {}
+    assert result[2]["alter"] == expected[2]["alter"]
+    assert [item.get("alter_table_name") for item in result[3:4]] == ["a"]
+
+
+def test_iter_parse_alter_to_unknown_table_raise_error():
+    with pytest.raises(ValueError):
+        list(DDLParser("ALTER TABLE c ADD CONSTRAINT uq UNIQUE (name);").iter_parse())
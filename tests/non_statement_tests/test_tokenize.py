@@ -0,0 +1,23 @@
+from simple_ddl_parser import DDLParser
+
+
+def test_tokenize_without_parser():
+    ddl = "CREATE TABLE t (id int NOT NULL, name varchar(10));\nSET x = 1;\nCREATE SEQUENCE s START WITH 1;"
+    parser = DDLParser(ddl)
+    tokens = parser.tokenize()
+    assert len(tokens.statements) == 2
+    assert tokens.statement_tokens(1) == [
+        ("CREATE", "CREATE"),
+        ("SEQUENCE", "SEQUENCE"),
+        ("ID", "s"),
+        ("START", "START"),
+        ("ID", "WITH"),
+        ("ID", "1"),
+    ]
+    assert [value for token_type, value in tokens if token_type == "ID"][:4] == ["t", "id", "int", "name"]
+    first = tokens.statements[0]
+    assert all(first.startswith(value, position) for value, position in zip(tokens.values[:5], tokens.positions))
+    assert len(tokens.types) == len(tokens.values) == len(tokens.positions) == len(tokens)
+    # SET statements are collected as in run()
+    assert parser.tables == [{"name": "x", "value": "1"}]
+    assert DDLParser("").tokenize(ddl).types == tokens.types
@@ -347,3 +347,19 @@ def test_two_defices_in_string_work_ok():
         }
     ]
     assert expected == parse_result
+
+
+def test_comment_markers_inside_quotes():
+    ddl = """CREATE TABLE t (
+    id int DEFAULT '--', -- first
+    name varchar(10) DEFAULT '/*' /* second */ NOT NULL,
+    "a--b" int COMMENT 'x -- y' -- third
+);
+"""
+    result = DDLParser(ddl).run(group_by_type=True)
+    assert result["comments"] == [" first", " second */ NOT NULL , ", " third"]
+    columns = result["tables"][0]["columns"]
+    assert [column["name"] for column in columns] == ["id", "name", '"a--b"']
+    assert [column["default"] for column in columns] == ["'--'", "'/*'", None]
+    assert columns[1]["nullable"] is False
+    assert columns[2]["comment"] == "'x -- y'"
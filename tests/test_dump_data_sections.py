@@ -0,0 +1,169 @@
+import copy
+import io
+
+import pytest
+
+from simple_ddl_parser import DDLParser, utils
+
+MYSQL_DUMP = """-- MySQL dump 10.13
+/*!40101 SET NAMES utf8mb4 */;
+DROP TABLE IF EXISTS `users`;
+CREATE TABLE `users` (
+  `id` int NOT NULL,
+  `name` varchar(100) DEFAULT NULL,
+  PRIMARY KEY (`id`)
+);
+LOCK TABLES `users` WRITE;
+/*!40000 ALTER TABLE `users` DISABLE KEYS */;
+INSERT INTO `users` VALUES (1,'it\\'s; CREATE TABLE x (a int);'),
+(2,'multi
+line'),(3,'b');
+/*!40000 ALTER TABLE `users` ENABLE KEYS */;
+UNLOCK TABLES;
+CREATE TABLE `orders` (`id` int NOT NULL);
+"""
+
+PG_DUMP = """CREATE TABLE public.t (id integer NOT NULL, name text);
+COPY public.t (id, name) FROM stdin;
+1\tCREATE TABLE x (id int);
+2\tb;
+\\.
+CREATE TABLE public.t2 (id integer);
+INSERT INTO t VALUES (1)
+GO
+CREATE TABLE t3 (id int)
+"""
+
+# pg_dump --inserts: standard strings, backslash is not escape & quote is doubled
+PG_INSERTS_DUMP = """CREATE TABLE a (path text);
+INSERT INTO a VALUES ('it''s; a');
+INSERT INTO a VALUES ('C:\\');
+CREATE TABLE c (id int);
+INSERT INTO c VALUES (1);
+CREATE TABLE d (id int);
+"""
+
+
+@pytest.mark.parametrize(
+    "ddl, tables",
+    [(MYSQL_DUMP, ["`users`", "`orders`"]), (PG_DUMP, ["t", "t2", "t3"]), (PG_INSERTS_DUMP, ["a", "c", "d"])],
+)
+def test_data_sections_are_skipped(ddl, tables):
+    parser = DDLParser(ddl)
+    result = parser.run(group_by_type=True)
+    assert [table["table_name"] for table in result["tables"]] == tables
+    assert result["ddl_properties"] == []
+    stats = parser.data_sections_stats
+    assert stats["skipped"] > 0
+    assert stats["skipped"] + stats["parsed"] == len(ddl)
+
+
+# INSERT without ';' before new statement at the start of next chunk
+MSSQL_INSERTS = """CREATE TABLE a (id int)
+INSERT INTO a VALUES (1)
+CREATE TABLE b (id int)
+INSERT INTO a VALUES (2)
+INSERT INTO a VALUES (3)
+GO
+"""
+
+
+# mysqldump escapes in default dialect: quotes of INSERT are not balanced
+ESCAPED_QUOTE_INSERTS = """CREATE TABLE a (id int);
+INSERT INTO a VALUES ('it\\'s');
+CREATE TABLE b (id int);
+CREATE TABLE c (id int);
+"""
+
+
+@pytest.mark.parametrize("read_chunk_size", [1, 7, 40])
+@pytest.mark.parametrize("ddl", [MYSQL_DUMP, PG_DUMP, PG_INSERTS_DUMP, MSSQL_INSERTS, ESCAPED_QUOTE_INSERTS])
+def test_data_sections_split_between_chunks(ddl, read_chunk_size, monkeypatch):
+    parser = DDLParser(ddl)
+    expected = parser.run(group_by_type=True)
+    # sections are continued in next chunks, with size 1 each line is separate chunk
+    monkeypatch.setattr(utils, "read_chunk_size", read_chunk_size)
+    chunks_parser = DDLParser()
+    assert chunks_parser.run(group_by_type=True, fileobj=io.StringIO(ddl)) == expected
+    assert chunks_parser.data_sections_stats == parser.data_sections_stats
+
+
+def test_backslash_escapes_in_mysql_dialect():
+    ddl = "CREATE TABLE a (id int);\nINSERT INTO a VALUES ('it\\'s; x');\nCREATE TABLE b (id int);\n"
+    parser = DDLParser(ddl, dialect="mysql")
+    assert [table["table_name"] for table in parser.run(group_by_type=True)["tables"]] == ["a", "b"]
+    assert parser.data_sections_stats["skipped"] == len("INSERT INTO a VALUES ('it\\'s; x');")
+
+
+def test_not_closed_string_does_not_hide_next_statements():
+    assert DDLParser("INSERT INTO a VALUES ('it\\'s; x');").run() == []
+    parser = DDLParser(ESCAPED_QUOTE_INSERTS)
+    assert [table["table_name"] for table in parser.run()] == ["a", "b", "c"]
+    assert parser.data_sections_stats["skipped"] == len("INSERT INTO a VALUES ('it\\'s');\n")
+
+
+def test_sections_in_comments_are_not_skipped(monkeypatch):
+    ddl = """CREATE TABLE a (id int);
+/* old data:
+INSERT INTO a VALUES (1);
+CREATE FUNCTION f() RETURNS int AS $$ SELECT 1; $$ LANGUAGE sql;
+*/
+-- /* not a comment start
+CREATE TABLE b (name varchar DEFAULT '/*');
+/*!40101 SET NAMES utf8mb4 */;
+CREATE TABLE c (id int);
+"""
+    parser = DDLParser(ddl)
+    result = parser.run(group_by_type=True)
+    assert [table["table_name"] for table in result["tables"]] == ["a", "b", "c"]
+    # versioned comments of mysqldump are comments too
+    assert result["comments"] == [
+        " old data:",
+        "INSERT INTO a VALUES  ( 1 ) ;",
+        "CREATE FUNCTION f (  )  RETURNS int AS $$ SELECT 1; $$ LANGUAGE sql;",
+        "*/",
+        "!40101 SET NAMES utf8mb4 */;",
+    ]
+    assert parser.data_sections_stats["skipped"] == 0
+    assert parser.procedural_bodies == []
+    # comment is split between chunks
+    monkeypatch.setattr(utils, "read_chunk_size", 1)
+    assert DDLParser().run(group_by_type=True, fileobj=io.StringIO(ddl)) == result
+
+
+def test_stats_are_not_summed_between_parses():
+    ddl = """CREATE TABLE a (id int); -- comment
+INSERT INTO a VALUES (1);
+CREATE FUNCTION f() RETURNS int AS $$ SELECT 1; $$ LANGUAGE sql;
+CREATE SEQUENCE s START WITH 1;
+"""
+    parser = DDLParser(ddl, fast_path=True, include_kinds={"tables"})
+
+    def stats():
+        # copies, parser could change the same objects
+        return copy.deepcopy(
+            (
+                parser.data_sections_stats,
+                parser.procedural_bodies,
+                parser.skipped_statements,
+                parser.fast_path_stats,
+                parser.comments,
+            )
+        )
+
+    parser.run()
+    expected = stats()
+    assert expected[0]["skipped"] == len("INSERT INTO a VALUES (1);")
+    assert expected[1:] == (
+        [{"kind": "function", "name": "f"}],
+        {"sequences": 1},
+        {"hits": 1, "misses": 0},
+        [" comment"],
+    )
+    parser.run()
+    assert stats() == expected
+    list(parser.iter_parse())
+    assert stats() == expected
+    parser.tokenize()
+    assert parser.data_sections_stats == expected[0]
+    assert parser.comments == expected[4]
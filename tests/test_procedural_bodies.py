@@ -0,0 +1,130 @@
+import io
+
+import pytest
+
+from simple_ddl_parser import DDLParser, utils
+PSQL_DDL = """CREATE TABLE a (id int);
+CREATE OR REPLACE FUNCTION public.f() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $_$
+BEGIN
+  CREATE TABLE x (id int);
+  RETURN NEW;
+END;
+$_$;
+DO $$ BEGIN PERFORM 1; END $$;
+CREATE FUNCTION g(a int) RETURNS int AS 'select 1; select 2' LANGUAGE sql;
+CREATE TRIGGER t BEFORE INSERT ON a FOR EACH ROW EXECUTE FUNCTION public.f();
+CREATE TABLE b (id int);
+"""
+ORACLE_DDL = """CREATE TABLE a (id int);
+CREATE OR REPLACE PACKAGE BODY pkg AS
+  PROCEDURE p(x NUMBER) IS
+    y NUMBER;
+  BEGIN
+    IF x > 0 THEN
+      y := CASE WHEN x > 1 THEN 1 ELSE 0 END;
+    END IF;
+    LOOP
+      EXIT;
+    END LOOP;
+  END p;
+END pkg;
+/
+CREATE OR REPLACE FUNCTION f RETURN NUMBER IS
+  v NUMBER;
+BEGIN
+  BEGIN
+    v := 1;
+  END;
+  RETURN v;
+END f;
+/
+CREATE OR REPLACE TRIGGER trg BEFORE INSERT ON a FOR EACH ROW
+BEGIN
+  :new.id := 1;
+END;
+CREATE TABLE b (id int);
+"""
+MSSQL_DDL = """CREATE TABLE a (id int)
+GO
+CREATE PROCEDURE dbo.p @x int
+AS
+SET NOCOUNT ON;
+BEGIN TRAN
+SELECT 1;
+COMMIT
+GO
+CREATE OR ALTER PROCEDURE dbo.q AS
+BEGIN
+  SELECT 1;
+END
+GO
+CREATE TABLE b (id int)
+GO
+"""
+ORACLE_CASE_DDL = """CREATE TABLE a (id int);
+CREATE OR REPLACE PROCEDURE p(x NUMBER) IS
+BEGIN
+  CASE x
+    WHEN 1 THEN NULL;
+    ELSE NULL;
+  END CASE;
+END p;
+CREATE TABLE b (id int);
+"""
+MYSQL_DDL = """CREATE TABLE a (id int);
+DELIMITER ;;
+CREATE DEFINER=`root`@`localhost` PROCEDURE `p`()
+BEGIN
+  SELECT 1;
+END ;;
+/*!50003 CREATE*/ /*!50017 DEFINER=`root`@`localhost`*/ /*!50003 TRIGGER `t` BEFORE INSERT ON `a` FOR EACH ROW BEGIN
+SET NEW.id = 1;
+END */;;
+DELIMITER ;
+CREATE TABLE b (id int);
+"""
+
+
+@pytest.mark.parametrize(
+    "ddl, bodies",
+    [
+        (
+            PSQL_DDL,
+            [
+                {"kind": "function", "name": "public.f"},
+                {"kind": "do", "name": None},
+                {"kind": "function", "name": "g"},
+                {"kind": "trigger", "name": "t"},
+            ],
+        ),
+        (
+            ORACLE_DDL,
+            [
+                {"kind": "package body", "name": "pkg"},
+                {"kind": "function", "name": "f"},
+                {"kind": "trigger", "name": "trg"},
+            ],
+        ),
+        (ORACLE_CASE_DDL, [{"kind": "procedure", "name": "p"}]),
+        (MSSQL_DDL, [{"kind": "procedure", "name": "dbo.p"}, {"kind": "procedure", "name": "dbo.q"}]),
+        (MYSQL_DDL, [{"kind": "procedure", "name": "`p`"}]),
+    ],
+)
+def test_procedural_bodies_are_skipped(ddl, bodies):
+    parser = DDLParser(ddl)
+    result = parser.run(group_by_type=True)
+    assert [table["table_name"] for table in result["tables"]] == ["a", "b"]
+    assert parser.procedural_bodies == bodies
+
+
+@pytest.mark.parametrize("ddl", [PSQL_DDL, ORACLE_DDL, ORACLE_CASE_DDL, MSSQL_DDL, MYSQL_DDL])
+def test_procedural_bodies_split_between_chunks(ddl, monkeypatch):
+    parser = DDLParser(ddl)
+    expected = parser.run(group_by_type=True)
+    # body is split on chunks by each inner ';'
+    monkeypatch.setattr(utils, "read_chunk_size", 1)
+    chunks_parser = DDLParser()
+    assert chunks_parser.run(group_by_type=True, fileobj=io.StringIO(ddl)) == expected
+    assert chunks_parser.procedural_bodies == parser.procedural_bodies
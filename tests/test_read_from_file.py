@@ -1,6 +1,13 @@
+import bz2
+import gzip
+import io
+import lzma
 import os
 
-from simple_ddl_parser import parse_from_file
+import pytest
+
+from simple_ddl_parser import DDLParser, cli, parse_from_file, utils
+from simple_ddl_parser.cli import ddl_file
 
 
 def test_parse_from_file_one_table():
@@ -205,3 +212,137 @@ def test_parse_from_file_two_statements():
     assert expected == parse_from_file(
         os.path.join(current_path, "sql", "test_two_tables.sql")
     )
+
+
+@pytest.mark.parametrize("file_name", ["test.sql", "test_one_table.sql", "test_two_tables.sql"])
+def test_iter_statements_from_file_same_as_whole_data(file_name, monkeypatch):
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql", file_name)
+    with open(file_path) as df:
+        expected = list(DDLParser().split_statements([df.read()]))
+    # cut file in as many parts as possible
+    monkeypatch.setattr(utils, "read_chunk_size", 1)
+    with open(file_path) as df:
+        assert list(DDLParser().iter_statements(df)) == expected
+
+
+def test_iter_statements_keeps_set_and_comments(monkeypatch):
+    ddl = """SET x = 1;
+    CREATE TABLE a (id int); -- first comment
+    /* multi
+    line ; comment */
+    CREATE TABLE b (name varchar(10) DEFAULT 'x')
+    CREATE TABLE c (id int)
+    GO
+    INSERT INTO c VALUES (1);
+    ALTER TABLE c ADD CONSTRAINT fk FOREIGN KEY (id) REFERENCES a (id);
+    """
+    monkeypatch.setattr(utils, "read_chunk_size", 1)
+    parser = DDLParser()
+    statements = parser.iter_statements(io.StringIO(ddl))
+    assert next(statements) == "CREATE TABLE a  ( id int ) "
+    assert parser.tables == [{"name": "x", "value": "1"}]
+    assert list(statements) == [
+        "CREATE TABLE b  ( name varchar ( 10 )  DEFAULT 'x' ",
+        "CREATE TABLE c  ( id int )",
+        "ALTER TABLE c ADD CONSTRAINT fk FOREIGN KEY  ( id )  REFERENCES a  ( id ) ",
+    ]
+    assert parser.comments == [" first comment", " multi"]
+
+
+@pytest.mark.parametrize("file_name", ["test.sql", "test_one_table.sql", "test_two_tables.sql"])
+def test_parse_from_file_stream(file_name, monkeypatch):
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql", file_name)
+    monkeypatch.setattr(utils, "read_chunk_size", 1)
+    result = parse_from_file(file_path, stream=True, lookahead=None)
+    assert not isinstance(result, list)
+    assert list(result) == parse_from_file(file_path)
+
+
+@pytest.mark.parametrize("file_name", ["test.sql", "test_one_table.sql", "test_two_tables.sql"])
+def test_parse_from_file_memory_map(file_name):
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql", file_name)
+    expected = parse_from_file(file_path)
+    assert parse_from_file(file_path, memory_map=True) == expected
+    assert list(parse_from_file(file_path, memory_map=True, stream=True, lookahead=None)) == expected
+
+
+def test_parse_from_file_memory_map_new_lines_and_encoding(tmp_path):
+    ddl = "CREATE TABLE t (\r\n  id int, -- идентификатор\r\n  name varchar(10) DEFAULT '\r\n'\r\n);\r\nGO\r\n"
+    file_path = tmp_path / "ddl.sql"
+    file_path.write_bytes(ddl.encode("utf-8"))
+    expected = DDLParser(ddl.replace("\r\n", "\n")).run(group_by_type=True)
+    assert expected["comments"] == [" идентификатор"]
+    assert parse_from_file(str(file_path), memory_map=True, group_by_type=True) == expected
+
+
+@pytest.mark.parametrize("memory_map", [False, True])
+def test_parse_from_file_with_encoding(tmp_path, memory_map):
+    ddl = "CREATE TABLE t (\n  id int, -- идентификатор\n  name varchar(10) DEFAULT 'имя'\n);\n"
+    file_path = tmp_path / "ddl.sql"
+    file_path.write_bytes(ddl.encode("cp1251"))
+    expected = DDLParser(ddl).run()
+    assert parse_from_file(str(file_path), memory_map=memory_map, encoding="cp1251") == expected
+    result = parse_from_file(str(file_path), stream=True, memory_map=memory_map, encoding="cp1251", lookahead=None)
+    assert list(result) == expected
+    # encoding in settings of parser
+    settings = {"encoding": "cp1251"}
+    assert parse_from_file(str(file_path), settings, memory_map=memory_map) == expected
+    assert list(parse_from_file(str(file_path), settings, stream=True, memory_map=memory_map)) == expected
+    assert settings == {"encoding": "cp1251"}
+
+
+def test_parse_from_file_memory_map_empty_file(tmp_path):
+    file_path = tmp_path / "ddl.sql"
+    file_path.write_bytes(b"")
+    assert parse_from_file(str(file_path), memory_map=True) == []
+
+
+@pytest.mark.parametrize("compression", [gzip, bz2, lzma])
+@pytest.mark.parametrize("file_name", ["test.sql", "test_two_tables.sql"])
+def test_parse_from_compressed_file(file_name, compression, tmp_path, monkeypatch):
+    file_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "sql", file_name)
+    expected = parse_from_file(file_path)
+    # name without any extension - compression is detected by magic bytes
+    compressed_path = str(tmp_path / "dump")
+    with open(file_path, "rb") as df:
+        with compression.open(compressed_path, "wb") as compressed:
+            compressed.write(df.read())
+    monkeypatch.setattr(utils, "read_chunk_size", 1)
+    assert utils.compression_of(compressed_path) is compression
+    assert parse_from_file(compressed_path) == expected
+    assert parse_from_file(compressed_path, memory_map=True) == expected
+    assert list(parse_from_file(compressed_path, stream=True, lookahead=None)) == expected
+
+
+def test_cli_accepts_compressed_files(tmp_path):
+    # compressed file must have ddl extension under extension of compression
+    files = [("dump.sql.gz", gzip), ("dump.ddl.xz", lzma), ("app.log.gz", gzip), ("backup.tar.xz", lzma)]
+    for name, compression in files:
+        with compression.open(tmp_path / name, "wb") as compressed:
+            compressed.write(b"CREATE TABLE t (id int);")
+    (tmp_path / "schema.sql").write_text("CREATE TABLE t (id int);")
+    (tmp_path / "notes.txt").write_text("CREATE TABLE t (id int);")
+    assert utils.compression_of(str(tmp_path / "schema.sql")) is None
+    assert sorted(name for name in os.listdir(tmp_path) if ddl_file(str(tmp_path / name))) == [
+        "dump.ddl.xz",
+        "dump.sql.gz",
+        "schema.sql",
+    ]
+
+
+def test_cli_reads_magic_bytes_only_of_ddl_and_compressed_files(tmp_path, monkeypatch):
+    for name in ["schema.sql", "app.log.gz", "notes.txt", "locked.sql"]:
+        (tmp_path / name).write_text("CREATE TABLE t (id int);")
+    os.mkfifo(tmp_path / "pipe.sql")
+    checked = []
+
+    def compression_of(file_path):
+        checked.append(os.path.basename(file_path))
+        if file_path.endswith("locked.sql"):
+            raise PermissionError(file_path)
+        return utils.compression_of(file_path)
+
+    monkeypatch.setattr(cli, "compression_of", compression_of)
+    assert sorted(name for name in os.listdir(tmp_path) if ddl_file(str(tmp_path / name))) == ["schema.sql"]
+    # fifo is not a file, unreadable file is skipped
+    assert sorted(checked) == ["app.log.gz", "locked.sql", "schema.sql"]